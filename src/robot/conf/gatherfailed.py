@@ -15,31 +15,53 @@
 from robot.errors import DataError
 from robot.model import SuiteVisitor
 from robot.result import ExecutionResult
+from robot.result.outputindex import OutputIndex
 from robot.utils import get_error_message
 
 
 class GatherFailedTests(SuiteVisitor):
 
     def __init__(self):
-        self.tests = []
+        self._tests = []
 
-    def visit_test(self, test):
-        if not test.passed:
-            self.tests.append(test.longname)
+    def end_test(self, test):
+        self._tests.append(test)
 
-    def visit_keyword(self, kw):
-        pass
+    def start_keyword(self, kw):
+        return False
+
+    @property
+    def tests(self):
+        # Statuses are checked only at the end because, when results are
+        # streamed, failing suite teardowns affect tests after they have
+        # been ended. This includes teardowns of all parent suites.
+        return [test.longname for test in self._tests if not test.passed]
 
 
 def gather_failed_tests(output):
     if output.upper() == 'NONE':
         return []
-    gatherer = GatherFailedTests()
     try:
-        ExecutionResult(output).suite.visit(gatherer)
-        if not gatherer.tests:
+        tests = _gather_from_index(output)
+        if tests is None:
+            tests = _gather_from_output(output)
+        if not tests:
             raise DataError('All tests passed.')
     except:
         raise DataError("Collecting failed tests from '%s' failed: %s"
                         % (output, get_error_message()))
+    return tests
+
+
+def _gather_from_index(output):
+    try:
+        index = OutputIndex(output)
+    except DataError:
+        return None
+    return [test.longname for test in index.tests if not test.passed]
+
+
+def _gather_from_output(output):
+    gatherer = GatherFailedTests()
+    ExecutionResult(output, streaming=True).visit(gatherer)
     return gatherer.tests
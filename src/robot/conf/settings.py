@@ -17,6 +17,7 @@ import os
 from robot import utils
 from robot.errors import DataError, FrameworkError
 from robot.output import LOGGER, loggerhelper
+from robot.result.binaryformat import is_binary_output
 from robot.result.keywordremover import KeywordRemover
 
 from .gatherfailed import gather_failed_tests
@@ -40,6 +41,7 @@ class _BaseSettings(object):
                  'XUnit'            : ('xunit', None),
                  'DeprecatedXUnit'  : ('xunitfile', None),
                  'SplitLog'         : ('splitlog', False),
+                 'OutputIndex'      : ('outputindex', False),
                  'TimestampOutputs' : ('timestampoutputs', False),
                  'LogTitle'         : ('logtitle', None),
                  'ReportTitle'      : ('reporttitle', None),
@@ -52,12 +54,14 @@ class _BaseSettings(object):
                  'TagDoc'           : ('tagdoc', []),
                  'TagStatLink'      : ('tagstatlink', []),
                  'RemoveKeywords'   : ('removekeywords', []),
+                 'ParseProcesses'   : ('parseprocesses', 1),
                  'NoStatusRC'       : ('nostatusrc', False),
                  'MonitorColors'    : ('monitorcolors', 'AUTO'),
                  'StdOut'           : ('stdout', None),
                  'StdErr'           : ('stderr', None),
                  'XUnitSkipNonCritical' : ('xunitskipnoncritical', False)}
-    _output_opts = ['Output', 'Log', 'Report', 'XUnit', 'DebugFile']
+    _output_opts = ['Output', 'Log', 'Report', 'XUnit', 'DebugFile',
+                    'Profile']
 
     def __init__(self, options=None, **extra_options):
         self._opts = {}
@@ -74,6 +78,15 @@ class _BaseSettings(object):
         self['TestNames'] += self['RunFailed']
         if self['DeprecatedXUnit']:
             self['XUnit'] = self['DeprecatedXUnit']
+        self._validate_binary_output()
+
+    def _validate_binary_output(self):
+        if not is_binary_output(self._opts['Output']):
+            return
+        for name in 'OutputIndex', 'BackgroundOutput':
+            if name in self and self._opts[name]:
+                raise DataError("Option '--%s' cannot be used with binary "
+                                "output files." % self._cli_opts[name][0])
 
     def __setitem__(self, name, value):
         if name not in self._cli_opts:
@@ -104,7 +117,8 @@ class _BaseSettings(object):
             return self._process_value('XUnit', value)
         if name == 'OutputDir':
             return utils.abspath(value)
-        if name in ['SuiteStatLevel', 'MonitorWidth']:
+        if name in ['SuiteStatLevel', 'MonitorWidth', 'Processes',
+                    'ParseProcesses']:
             return self._convert_to_positive_integer_or_default(name, value)
         if name in ['Listeners', 'VariableFiles']:
             return [self._split_args_from_name_or_path(item) for item in value]
@@ -179,7 +193,8 @@ class _BaseSettings(object):
     def _get_output_file(self, option):
         """Returns path of the requested output file and creates needed dirs.
 
-        `option` can be 'Output', 'Log', 'Report', 'XUnit' or 'DebugFile'.
+        `option` can be 'Output', 'Log', 'Report', 'XUnit', 'DebugFile'
+        or 'Profile'.
         """
         name = self._opts[option]
         if not name:
@@ -207,7 +222,7 @@ class _BaseSettings(object):
             return '.xml'
         if type_ in ['Log', 'Report']:
             return '.html'
-        if type_ == 'DebugFile':
+        if type_ in ['DebugFile', 'Profile']:
             return '.txt'
         raise FrameworkError("Invalid output file type: %s" % type_)
 
@@ -309,10 +324,18 @@ class _BaseSettings(object):
     def split_log(self):
         return self['SplitLog']
 
+    @property
+    def output_index(self):
+        return self['OutputIndex']
+
     @property
     def status_rc(self):
         return not self['NoStatusRC']
 
+    @property
+    def parse_processes(self):
+        return self['ParseProcesses']
+
     @property
     def xunit_skip_noncritical(self):
         return self['XUnitSkipNonCritical']
@@ -350,9 +373,13 @@ class RobotSettings(_BaseSettings):
                        'Variables'          : ('variable', []),
                        'VariableFiles'      : ('variablefile', []),
                        'Listeners'          : ('listener', []),
+                       'SplitTests'         : ('splittests', []),
+                       'Processes'          : ('processes', 1),
+                       'BackgroundOutput'   : ('backgroundoutput', False),
                        'MonitorWidth'       : ('monitorwidth', 78),
                        'MonitorMarkers'     : ('monitormarkers', 'AUTO'),
-                       'DebugFile'          : ('debugfile', None)}
+                       'DebugFile'          : ('debugfile', None),
+                       'Profile'            : ('profile', None)}
 
     def get_rebot_settings(self):
         settings = RebotSettings()
@@ -400,6 +427,10 @@ class RobotSettings(_BaseSettings):
         return (self['Randomize'] in ('tests', 'all') or
                 any(mode in ('random:test', 'random:all') for mode in self['RunMode']))
 
+    @property
+    def processes(self):
+        return self['Processes']
+
     @property
     def dry_run(self):
         return (self['DryRun'] or
@@ -14,12 +14,14 @@
 
 
 class ItemList(object):
-    __slots__ = ['_item_class', '_common_attrs', '_items']
+    __slots__ = ['_item_class', '_common_attrs', '_items', '_indices']
 
     def __init__(self, item_class, common_attrs=None, items=None):
         self._item_class = item_class
         self._common_attrs = common_attrs
-        self._items = ()
+        self._items = []
+        # Maps items to their indices. Created lazily by `index`.
+        self._indices = None
         if items:
             self.extend(items)
 
@@ -28,7 +30,10 @@ class ItemList(object):
 
     def append(self, item):
         self._check_type_and_set_attrs(item)
-        self._items += (item,)
+        if self._indices is not None:
+            self._indices.setdefault(item, len(self._items))
+        self._items.append(item)
+        self._items_changed()
         return item
 
     def _check_type_and_set_attrs(self, item):
@@ -40,19 +45,35 @@ class ItemList(object):
                 setattr(item, attr, self._common_attrs[attr])
 
     def extend(self, items):
+        items = tuple(items)
         for item in items:
             self._check_type_and_set_attrs(item)
-        self._items += tuple(items)
+        if self._indices is not None:
+            self._add_indices(items, start=len(self._items))
+        self._items.extend(items)
+        self._items_changed()
 
-    if hasattr(tuple, 'index'):  # tuples got index method in Python 2.6
-        def index(self, item):
-            return self._items.index(item)
-    else:
-        def index(self, item):
-            return list(self._items).index(item)
+    def _add_indices(self, items, start=0):
+        for index, item in enumerate(items):
+            self._indices.setdefault(item, start + index)
+
+    def index(self, item):
+        if self._indices is None:
+            self._indices = {}
+            self._add_indices(self._items)
+        try:
+            return self._indices[item]
+        except KeyError:
+            raise ValueError('%r is not in list' % (item,))
 
     def clear(self):
-        self._items = ()
+        self._items = []
+        self._indices = None
+        self._items_changed()
+
+    def _items_changed(self):
+        """Called after items have been added or removed."""
+        pass
 
     def visit(self, visitor):
         for item in self:
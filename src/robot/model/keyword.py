@@ -21,7 +21,7 @@ from .modelobject import ModelObject
 
 class Keyword(ModelObject):
     """Base model for single keyword."""
-    __slots__ = ['parent', 'name', 'doc', 'args', 'type', 'timeout']
+    __slots__ = ['_parent', 'name', 'doc', 'args', 'type', 'timeout', '_id']
     KEYWORD_TYPE = 'kw'
     SETUP_TYPE = 'setup'
     TEARDOWN_TYPE = 'teardown'
@@ -31,9 +31,8 @@ class Keyword(ModelObject):
     message_class = Message
 
     def __init__(self, name='', doc='', args=(), type='kw', timeout=None):
-        #: :class:`~.testsuite.TestSuite` or
-        #: :class:`~.testcase.TestCase` that contains this keyword.
-        self.parent = None
+        self._id = None
+        self._parent = None
         #: Keyword name.
         self.name = name
         #: Keyword documentation.
@@ -54,15 +53,38 @@ class Keyword(ModelObject):
     def keywords(self, keywords):
         return Keywords(self.keyword_class or self.__class__, self, keywords)
 
+    def _get_parent(self):
+        return self._parent
+
+    def _set_parent(self, parent):
+        self._parent = parent
+        self._reset_cache()
+
+    parent = property(_get_parent, _set_parent,
+                      doc=':class:`~.testsuite.TestSuite`, '
+                          ':class:`~.testcase.TestCase` or :class:`Keyword` '
+                          'that contains this keyword.')
+
     @setter
     def messages(self, messages):
         return Messages(self.message_class, self, messages)
 
     @property
     def id(self):
-        if not self.parent:
-            return 'k1'
-        return '%s-k%d' % (self.parent.id, self.parent.keywords.index(self)+1)
+        if self._id is None:
+            if not self.parent:
+                self._id = 'k1'
+            else:
+                self._id = '%s-k%d' % (self.parent.id,
+                                       self.parent.keywords.index(self)+1)
+        return self._id
+
+    def _reset_cache(self):
+        if self._id is None:
+            return
+        self._id = None
+        for keyword in self.keywords:
+            keyword._reset_cache()
 
     def visit(self, visitor):
         visitor.visit_keyword(self)
@@ -93,6 +93,11 @@ class TotalStat(Stat):
     #: Always string `total`
     type = 'total'
 
+    def add_stat(self, other):
+        self.passed += other.passed
+        self.failed += other.failed
+        self.elapsed += other.elapsed
+
 
 class SuiteStat(Stat):
     """Stores statistics values for a single suite."""
@@ -12,35 +12,39 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from robot.utils import Matcher, NormalizedDict, setter
+import re
+
+from robot.utils.boundedcache import BoundedCache
+from robot.utils.normalizing import Normalizer
+
+
+_normalize = Normalizer.get(ignore='_')
+_IGNORED_TAGS = frozenset(['', 'none'])
 
 
 class Tags(object):
+    """Tags of a test case.
 
-    def __init__(self, tags=None):
-        self._tags = tags
+    Tags are normalized, deduplicated and sorted when they are set. The
+    actual tags are stored in an immutable object that is shared by all
+    ``Tags`` having the same tags. Adding and removing tags replaces that
+    object with another one.
+    """
+    __slots__ = ['_set']
 
-    @setter
-    def _tags(self, tags):
-        if not tags:
-            return ()
-        if isinstance(tags, basestring):
-            tags = (tags,)
-        return self._normalize(tags)
-
-    def _normalize(self, tags):
-        normalized = NormalizedDict(((t, 1) for t in tags), ignore='_')
-        for removed in '', 'NONE':
-            if removed in normalized:
-                normalized.pop(removed)
-        return tuple(normalized)
+    def __init__(self, tags=None):
+        self._set = _TagSet.get(tags)
 
     def add(self, tags):
-        self._tags = tuple(self) + tuple(Tags(tags))
+        added = _TagSet.get(tags)
+        if added.tags:
+            self._set = _TagSet.get(self._set.tags + added.tags)
 
     def remove(self, tags):
-        tags = TagPatterns(tags)
-        self._tags = [t for t in self if not tags.match(t)]
+        tags = TagPatterns(tags) if not isinstance(tags, TagPatterns) else tags
+        kept = [t for t in self if not tags.match(t)]
+        if len(kept) < len(self):
+            self._set = _TagSet.get(kept)
 
     def match(self, tags):
         return TagPatterns(tags).match(self)
@@ -49,10 +53,10 @@ class Tags(object):
         return self.match(tags)
 
     def __len__(self):
-        return len(self._tags)
+        return len(self._set.tags)
 
     def __iter__(self):
-        return iter(self._tags)
+        return iter(self._set.tags)
 
     def __unicode__(self):
         return u'[%s]' % ', '.join(self)
@@ -64,21 +68,84 @@ class Tags(object):
         return unicode(self).encode('UTF-8')
 
     def __getitem__(self, index):
-        item = self._tags[index]
+        item = self._set.tags[index]
         return item if not isinstance(index, slice) else Tags(item)
 
     def __add__(self, other):
-        return Tags(tuple(self) + tuple(Tags(other)))
+        return Tags(self._set.tags + _TagSet.get(other).tags)
+
+
+class _TagSet(object):
+    """Immutable normalized tags shared by :class:`Tags` objects.
+
+    Instances are got using :meth:`get` that returns the same instance for
+    the same tags. Cache keys contain also types of the tags so that equal
+    byte and Unicode strings do not share instances. The cache is cleared
+    when it grows too big.
+    """
+    __slots__ = ['tags', 'normalized']
+    _cache = BoundedCache()
+
+    @classmethod
+    def get(cls, tags):
+        if isinstance(tags, Tags):
+            return tags._set
+        if not tags:
+            return _EMPTY_TAG_SET
+        tags = (tags,) if isinstance(tags, basestring) else tuple(tags)
+        key = cls._key(tags)
+        try:
+            return cls._cache[key]
+        except KeyError:
+            pass
+        tagset = cls(tags)
+        # Normalized tags are cached to themselves to make sets having
+        # the same tags given in different order or format shared.
+        tagset = cls._cache[key] \
+                = cls._cache.setdefault(cls._key(tagset.tags), tagset)
+        return tagset
+
+    @staticmethod
+    def _key(tags):
+        return tuple((type(tag), tag) for tag in tags)
+
+    def __init__(self, tags=()):
+        names = {}
+        for tag in tags:
+            names.setdefault(_normalize(tag), tag)
+        for ignored in _IGNORED_TAGS:
+            names.pop(ignored, None)
+        self.tags = tuple(names[name] for name in sorted(names))
+        self.normalized = frozenset(names)
+
+
+_EMPTY_TAG_SET = _TagSet()
 
 
 class TagPatterns(object):
+    """Matches tags against patterns possibly containing AND, OR and NOT.
+
+    Patterns are compiled when the object is created and results are
+    cached by normalized tags got from :class:`_TagSet`. Typically the same
+    patterns are matched against tags of many tests having the same tags.
+    The cache is cleared when it grows too big.
+    """
 
     def __init__(self, patterns):
         self._patterns = tuple(TagPattern(p) for p in Tags(patterns))
+        self._matcher = _OrTagPattern(self._patterns)
+        self._cache = BoundedCache()
 
     def match(self, tags):
-        tags = tags if isinstance(tags, Tags) else Tags(tags)
-        return any(p.match(tags) for p in self._patterns)
+        if not self._patterns:
+            return False
+        tags = _TagSet.get(tags).normalized
+        try:
+            return self._cache[tags]
+        except KeyError:
+            pass
+        match = self._cache[tags] = self._matcher.match(tags)
+        return match
 
     def __contains__(self, tag):
         return self.match(tag)
@@ -102,16 +169,23 @@ def TagPattern(pattern):
     return _SingleTagPattern(pattern)
 
 
+# Pattern classes below match sets of normalized tags.
+
 class _SingleTagPattern(object):
 
     def __init__(self, pattern):
-        self._matcher = Matcher(pattern, ignore='_')
+        self.pattern = pattern
+        self.name = _normalize(pattern)
+        self.exact = '*' not in self.name and '?' not in self.name
+        self._regexp = _compile_regexp([self.name]) if not self.exact else None
 
     def match(self, tags):
-        return self._matcher.match_any(tags)
+        if self.exact:
+            return self.name in tags
+        return any(self._regexp.match(t) for t in tags)
 
     def __unicode__(self):
-        return self._matcher.pattern
+        return self.pattern
 
 
 class _AndTagPattern(object):
@@ -127,8 +201,46 @@ class _NotTagPattern(object):
 
     def __init__(self, must_match, *must_not_match):
         self._must = TagPattern(must_match)
-        self._must_not = tuple(TagPattern(m) for m in must_not_match)
+        self._must_not = _OrTagPattern([TagPattern(m) for m in must_not_match])
+
+    def match(self, tags):
+        return self._must.match(tags) and not self._must_not.match(tags)
+
+
+class _OrTagPattern(object):
+    """Matches if any of the given patterns matches.
+
+    Exact single patterns are matched using a set lookup and single patterns
+    with wildcards using one combined regexp. Other patterns are matched
+    separately.
+    """
+
+    def __init__(self, patterns):
+        singles = [p for p in patterns if isinstance(p, _SingleTagPattern)]
+        self._names = frozenset(p.name for p in singles if p.exact)
+        self._regexp = _compile_regexp([p.name for p in singles
+                                        if not p.exact])
+        self._others = tuple(p for p in patterns
+                             if not isinstance(p, _SingleTagPattern))
 
     def match(self, tags):
-        return self._must.match(tags) \
-            and not any(p.match(tags) for p in self._must_not)
+        names = self._names
+        if names and any(t in names for t in tags):
+            return True
+        regexp = self._regexp
+        if regexp and any(regexp.match(t) for t in tags):
+            return True
+        return any(p.match(tags) for p in self._others)
+
+
+_wildcard_tokenizer = re.compile('(\*|\?)')
+_wildcards = {'*': '.*', '?': '.'}
+
+
+def _compile_regexp(patterns):
+    if not patterns:
+        return None
+    alternatives = [''.join(_wildcards.get(token) or re.escape(token)
+                            for token in _wildcard_tokenizer.split(pattern))
+                    for pattern in patterns]
+    return re.compile('^(?:%s)$' % '|'.join(alternatives), re.DOTALL)
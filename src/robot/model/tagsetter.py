@@ -12,7 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from visitor import SuiteVisitor
+from .tags import TagPatterns
+from .visitor import SuiteVisitor
 
 
 class TagSetter(SuiteVisitor):
@@ -20,13 +21,14 @@ class TagSetter(SuiteVisitor):
     def __init__(self, add=None, remove=None):
         self.add = add
         self.remove = remove
+        self._remove = TagPatterns(remove)
 
     def start_suite(self, suite):
         return bool(self)
 
     def visit_test(self, test):
         test.tags.add(self.add)
-        test.tags.remove(self.remove)
+        test.tags.remove(self._remove)
 
     def visit_keyword(self, keyword):
         pass
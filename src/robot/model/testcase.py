@@ -22,13 +22,12 @@ from .tags import Tags
 
 class TestCase(ModelObject):
     """Base model for single test case."""
-    __slots__ = ['parent', 'name', 'doc', 'timeout']
+    __slots__ = ['_parent', '_name', 'doc', 'timeout', '_id', '_longname']
     keyword_class = Keyword
 
     def __init__(self, name='', doc='', tags=None, timeout=None):
-        #: :class:`~.testsuite.TestSuite` that contains this test.
-        self.parent = None
-        #: Test case name.
+        self._id = self._longname = None
+        self._parent = None
         self.name = name
         #: Test case documentation.
         self.doc = doc
@@ -40,6 +39,26 @@ class TestCase(ModelObject):
         #: instances and contains also possible setup and teardown keywords.
         self.keywords = None
 
+    def _get_parent(self):
+        return self._parent
+
+    def _set_parent(self, parent):
+        self._parent = parent
+        self._reset_cache()
+
+    parent = property(_get_parent, _set_parent,
+                      doc=':class:`~.testsuite.TestSuite` that contains '
+                          'this test.')
+
+    def _get_name(self):
+        return self._name
+
+    def _set_name(self, name):
+        self._name = name
+        self._longname = None
+
+    name = property(_get_name, _set_name, doc='Test case name.')
+
     @setter
     def tags(self, tags):
         return Tags(tags)
@@ -50,15 +69,29 @@ class TestCase(ModelObject):
 
     @property
     def id(self):
-        if not self.parent:
-            return 't1'
-        return '%s-t%d' % (self.parent.id, self.parent.tests.index(self)+1)
+        if self._id is None:
+            if not self.parent:
+                self._id = 't1'
+            else:
+                self._id = '%s-t%d' % (self.parent.id,
+                                       self.parent.tests.index(self)+1)
+        return self._id
 
     @property
     def longname(self):
-        if not self.parent:
-            return self.name
-        return '%s.%s' % (self.parent.longname, self.name)
+        if self._longname is None:
+            if not self.parent:
+                self._longname = self.name
+            else:
+                self._longname = '%s.%s' % (self.parent.longname, self.name)
+        return self._longname
+
+    def _reset_cache(self):
+        if self._id is None and self._longname is None:
+            return
+        self._id = self._longname = None
+        for keyword in self.keywords:
+            keyword._reset_cache()
 
     def visit(self, visitor):
         visitor.visit_test(self)
@@ -74,3 +107,8 @@ class TestCases(ItemList):
         ItemList._check_type_and_set_attrs(self, test)
         for visitor in test.parent._visitors:
             test.visit(visitor)
+
+    def _items_changed(self):
+        parent = self._common_attrs['parent']
+        if parent:
+            parent._children_changed()
@@ -12,6 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from itertools import chain
+
 from robot.utils import setter
 
 from .configurer import SuiteConfigurer
@@ -27,13 +29,14 @@ from .testcase import TestCase, TestCases
 class TestSuite(ModelObject):
     """Base model for single suite.
     """
-    __slots__ = ['parent', 'source', '_name', 'doc', '_my_visitors']
+    __slots__ = ['_parent', 'source', '_name', 'doc', '_my_visitors',
+                 '_id', '_longname']
     test_class = TestCase
     keyword_class = Keyword
 
     def __init__(self, name='', doc='', metadata=None, source=None):
-        #: Parent :class:`TestSuite` or `None`.
-        self.parent = None
+        self._id = self._longname = None
+        self._parent = None
         #: Test suite name.
         self.name = name
         #: Test suite documentation.
@@ -51,16 +54,41 @@ class TestSuite(ModelObject):
         self.keywords = None
         self._my_visitors = []
 
+    def _children_changed(self):
+        """Called when child suites or tests are added or removed."""
+        if not self._name:
+            self._name_changed()
+
     @property
     def _visitors(self):
         parent_visitors = self.parent._visitors if self.parent else []
         return self._my_visitors + parent_visitors
 
+    def _get_parent(self):
+        return self._parent
+
+    def _set_parent(self, parent):
+        self._parent = parent
+        self._reset_cache()
+
+    parent = property(_get_parent, _set_parent,
+                      doc='Parent :class:`TestSuite` or `None`.')
+
     def _get_name(self):
         return self._name or ' & '.join(s.name for s in self.suites)
 
     def _set_name(self, name):
         self._name = name
+        self._name_changed()
+
+    def _name_changed(self):
+        # Names of suites without an explicit name depend on child suite
+        # names. Changing a name can thus change long names of suites and
+        # tests anywhere under the topmost such parent.
+        suite = self
+        while suite.parent and not suite.parent._name:
+            suite = suite.parent
+        suite._reset_cache()
 
     name = property(_get_name, _set_name)
 
@@ -90,16 +118,32 @@ class TestSuite(ModelObject):
         ``s1-s2``, ..., their children get ids ``s1-s1-s1``, ``s1-s1-s2``,
         ..., ``s1-s2-s1``, ..., and so on.
         """
-        if not self.parent:
-            return 's1'
-        return '%s-s%d' % (self.parent.id, self.parent.suites.index(self)+1)
+        if self._id is None:
+            if not self.parent:
+                self._id = 's1'
+            else:
+                self._id = '%s-s%d' % (self.parent.id,
+                                       self.parent.suites.index(self)+1)
+        return self._id
 
     @property
     def longname(self):
         """Suite name prefixed with all parent suite names."""
-        if not self.parent:
-            return self.name
-        return '%s.%s' % (self.parent.longname, self.name)
+        if self._longname is None:
+            if not self.parent:
+                self._longname = self.name
+            else:
+                self._longname = '%s.%s' % (self.parent.longname, self.name)
+        return self._longname
+
+    def _reset_cache(self):
+        # Cached ids and long names are reset recursively. Children cannot
+        # have cached values if their parent does not have them.
+        if self._id is None and self._longname is None:
+            return
+        self._id = self._longname = None
+        for child in chain(self.suites, self.tests, self.keywords):
+            child._reset_cache()
 
     @property
     def test_count(self):
@@ -157,3 +201,8 @@ class TestSuites(ItemList):
 
     def __init__(self, suite_class=TestSuite, parent=None, suites=None):
         ItemList.__init__(self, suite_class, {'parent': parent}, suites)
+
+    def _items_changed(self):
+        parent = self._common_attrs['parent']
+        if parent:
+            parent._children_changed()
@@ -63,6 +63,10 @@ class TotalStatisticsBuilder(SuiteVisitor):
         if test.critical:
             self.stats.critical.add_test(test)
 
+    def add_statistics(self, stats):
+        self.stats.critical.add_stat(stats.critical)
+        self.stats.all.add_stat(stats.all)
+
     def visit_test(self, test):
         self.add_test(test)
 
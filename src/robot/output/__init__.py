@@ -21,4 +21,5 @@ test execution is refactored.
 from .output import Output
 from .logger import LOGGER
 from .xmllogger import XmlLogger
+from .binarylogger import BinaryLogger
 from .loggerhelper import LEVELS, Message
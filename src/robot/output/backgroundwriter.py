@@ -0,0 +1,100 @@
+#  Copyright 2008-2013 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import threading
+from Queue import Queue
+
+from robot.errors import DataError
+from robot.utils import get_error_message
+
+
+class BackgroundWriter(object):
+    """Calls methods of wrapped objects in a separate writer thread.
+
+    Calls are made in the order they were done. They are sent to the writer
+    thread in batches via a bounded queue, and callers block if the queue
+    is full. Calling the ``flush`` method of a wrapped object sends the
+    current batch immediately. :meth:`close` waits until all calls have
+    been made and reports a possible error that occurred in the thread.
+
+    Arguments are used as-is in the writer thread, and callers must thus
+    not modify them afterwards.
+    """
+    _batch_size = 100
+
+    def __init__(self, queue_size=100):
+        self._queue = Queue(queue_size)
+        self._batch = []
+        self._error = None
+        self._thread = threading.Thread(target=self._run,
+                                        name='RobotBackgroundWriter')
+        self._thread.setDaemon(True)
+        self._thread.start()
+
+    def wrap(self, obj):
+        """Returns a proxy whose method calls are made in the writer thread.
+
+        Other attributes are got from the wrapped object directly.
+        """
+        return _QueuedCalls(obj, self)
+
+    def call(self, method, *args, **kwargs):
+        self._batch.append((method, args, kwargs))
+        if len(self._batch) >= self._batch_size:
+            self.flush()
+
+    def flush(self):
+        """Sends queued calls to the writer thread without waiting for them."""
+        if self._batch:
+            self._queue.put(self._batch)
+            self._batch = []
+
+    def close(self):
+        self.flush()
+        self._queue.put(None)
+        self._thread.join()
+        if self._error:
+            raise DataError('Writing output failed: %s' % self._error)
+
+    def _run(self):
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+            # After an error, calls are still consumed to not block callers.
+            if self._error:
+                continue
+            try:
+                for method, args, kwargs in batch:
+                    method(*args, **kwargs)
+            except:
+                self._error = get_error_message()
+
+
+class _QueuedCalls(object):
+
+    def __init__(self, obj, writer):
+        self._obj = obj
+        self._writer = writer
+
+    def __getattr__(self, name):
+        attr = getattr(self._obj, name)
+        if not callable(attr):
+            return attr
+        def queued(*args, **kwargs):
+            self._writer.call(attr, *args, **kwargs)
+            if name == 'flush':
+                self._writer.flush()
+        setattr(self, name, queued)
+        return queued
@@ -0,0 +1,107 @@
+#  Copyright 2008-2013 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from robot.utils import get_timestamp, unic
+from robot.version import get_full_version
+from robot.result.visitor import ResultVisitor
+from robot.result import binaryformat as rbin
+
+from .loggerhelper import IsLogged
+
+
+class BinaryLogger(ResultVisitor):
+    """Writes results in the binary format instead of XML.
+
+    Has the same interface as :class:`~.xmllogger.XmlLogger`.
+    """
+
+    def __init__(self, path, log_level='TRACE', generator='Robot'):
+        self._log_message_is_logged = IsLogged(log_level)
+        self._error_message_is_logged = IsLogged('WARN')
+        self._writer = rbin.BinaryWriter(path)
+        self._writer.record(rbin.HEADER,
+                            self._writer.string(get_full_version(generator)),
+                            self._writer.string(get_timestamp()))
+        self._errors = []
+
+    def close(self):
+        for msg in self._errors:
+            self._write_message(msg, rbin.ERROR)
+        self._writer.close()
+
+    def set_log_level(self, level):
+        return self._log_message_is_logged.set_level(level)
+
+    def message(self, msg):
+        if self._error_message_is_logged(msg.level):
+            self._errors.append(msg)
+
+    def log_message(self, msg):
+        if self._log_message_is_logged(msg.level):
+            self._write_message(msg)
+
+    def _write_message(self, msg, type=rbin.MESSAGE):
+        writer = self._writer
+        writer.record(type, writer.string(msg.timestamp),
+                      writer.level(msg.level), bool(msg.html),
+                      writer.string(msg.message))
+
+    def start_keyword(self, kw):
+        writer = self._writer
+        writer.record(rbin.START_KEYWORD, writer.keyword_type(kw.type),
+                      writer.string(kw.name), writer.string(kw.timeout),
+                      writer.string(kw.doc),
+                      writer.strings(unic(a) for a in kw.args))
+
+    def end_keyword(self, kw):
+        writer = self._writer
+        writer.record(rbin.END_KEYWORD, writer.status(kw.status),
+                      writer.string(kw.message), writer.string(kw.starttime),
+                      writer.string(kw.endtime))
+
+    def start_test(self, test):
+        writer = self._writer
+        writer.record(rbin.START_TEST, writer.string(test.name),
+                      writer.string(test.timeout))
+
+    def end_test(self, test):
+        writer = self._writer
+        writer.record(rbin.END_TEST, writer.string(test.doc),
+                      writer.status(test.status), writer.string(test.message),
+                      writer.string(test.starttime),
+                      writer.string(test.endtime), bool(test.critical),
+                      writer.strings(test.tags))
+
+    def start_suite(self, suite):
+        writer = self._writer
+        writer.record(rbin.START_SUITE, writer.string(suite.name),
+                      writer.string(suite.source))
+
+    def end_suite(self, suite):
+        writer = self._writer
+        writer.record(rbin.END_SUITE, writer.string(suite.doc),
+                      writer.string(suite.message),
+                      writer.string(suite.starttime),
+                      writer.string(suite.endtime),
+                      writer.strings(self._flatten(suite.metadata.items())))
+
+    def visit_stat(self, stat):
+        writer = self._writer
+        attrs = stat.get_attributes(values_as_strings=True)
+        writer.record(rbin.STATISTIC, writer.statistic_type(stat.type),
+                      writer.string(stat.name),
+                      writer.strings(self._flatten(sorted(attrs.items()))))
+
+    def _flatten(self, pairs):
+        return [item for pair in pairs for item in pair]
@@ -55,9 +55,13 @@ class Listeners(object):
     __metaclass__ = _RecursionAvoidingMetaclass
     _start_attrs = ['doc', 'starttime', 'longname']
     _end_attrs = _start_attrs + ['endtime', 'elapsedtime', 'status', 'message']
+    _attr_names = {}
 
     def __init__(self, listeners):
         self._listeners = self._import_listeners(listeners)
+        self._method_listeners = self._get_method_listeners(self._listeners)
+        self._keyword_listeners = any(self._method_listeners[name] for name
+                                      in ('start_keyword', 'end_keyword'))
         self._running_test = False
         self._setup_or_teardown_type = None
 
@@ -76,14 +80,51 @@ class Listeners(object):
                              % (name, unicode(err)))
         return listeners
 
+    def _get_method_listeners(self, listeners):
+        method_listeners = {}
+        for method in _ListenerProxy._methods:
+            method_listeners[method] = [li for li in listeners
+                                        if method in li.methods]
+        # Old style listeners do not get messages.
+        for method in 'log_message', 'message':
+            method_listeners[method] = [li for li in method_listeners[method]
+                                        if li.version == 2]
+        return method_listeners
+
+    def _call(self, method, get_old_style_args, get_new_style_args):
+        # Arguments are got only if some listener implements the method, and
+        # only once per listener version. Every listener gets its own copies
+        # of mutable arguments so that listeners cannot affect each other.
+        listeners = self._method_listeners[method]
+        if not listeners:
+            return
+        args = {}
+        for li in listeners:
+            if li.version not in args:
+                args[li.version] = (get_old_style_args() if li.version == 1
+                                    else get_new_style_args())
+            li.call_method(getattr(li, method),
+                           *self._copy_args(args[li.version]))
+
+    def _copy_args(self, args):
+        return [self._copy_arg(arg) for arg in args]
+
+    def _copy_arg(self, arg):
+        if isinstance(arg, dict):
+            return dict((name, self._take_copy_of_mutable_value(value))
+                        for name, value in arg.items())
+        if isinstance(arg, list):
+            return list(arg)
+        return arg
+
     def start_suite(self, suite):
-        for li in self._listeners:
-            if li.version == 1:
-                li.call_method(li.start_suite, suite.name, suite.doc)
-            else:
-                attrs = self._get_start_attrs(suite, 'metadata')
-                attrs.update(self._get_suite_attrs(suite))
-                li.call_method(li.start_suite, suite.name, attrs)
+        self._call('start_suite', lambda: (suite.name, suite.doc),
+                   lambda: (suite.name, self._get_start_suite_attrs(suite)))
+
+    def _get_start_suite_attrs(self, suite):
+        attrs = self._get_start_attrs(suite, 'metadata')
+        attrs.update(self._get_suite_attrs(suite))
+        return attrs
 
     def _get_suite_attrs(self, suite):
         return {
@@ -94,56 +135,57 @@ class Listeners(object):
         }
 
     def end_suite(self, suite):
-        for li in self._listeners:
-            if li.version == 1:
-                li.call_method(li.end_suite, suite.status,
-                               suite.full_message)
-            else:
-                attrs = self._get_end_attrs(suite, 'metadata')
-                attrs['statistics'] = suite.stat_message
-                attrs.update(self._get_suite_attrs(suite))
-                li.call_method(li.end_suite, suite.name, attrs)
+        self._call('end_suite', lambda: (suite.status, suite.full_message),
+                   lambda: (suite.name, self._get_end_suite_attrs(suite)))
+
+    def _get_end_suite_attrs(self, suite):
+        attrs = self._get_end_attrs(suite, 'metadata')
+        attrs['statistics'] = suite.stat_message
+        attrs.update(self._get_suite_attrs(suite))
+        return attrs
 
     def start_test(self, test):
         self._running_test = True
-        for li in self._listeners:
-            if li.version == 1:
-                li.call_method(li.start_test, test.name, test.doc,
-                               list(test.tags))
-            else:
-                attrs = self._get_start_attrs(test, 'tags')
-                attrs['critical'] = 'yes' if test.critical else 'no'
-                attrs['template'] = test.template or ''
-                li.call_method(li.start_test, test.name, attrs)
+        self._call('start_test',
+                   lambda: (test.name, test.doc, list(test.tags)),
+                   lambda: (test.name, self._get_test_attrs(
+                       test, self._get_start_attrs(test, 'tags'))))
+
+    def _get_test_attrs(self, test, attrs):
+        attrs['critical'] = 'yes' if test.critical else 'no'
+        attrs['template'] = test.template or ''
+        return attrs
 
     def end_test(self, test):
         self._running_test = False
-        for li in self._listeners:
-            if li.version == 1:
-                li.call_method(li.end_test, test.status, test.message)
-            else:
-                attrs = self._get_end_attrs(test, 'tags')
-                attrs['critical'] = 'yes' if test.critical else 'no'
-                attrs['template'] = test.template or ''
-                li.call_method(li.end_test, test.name, attrs)
+        self._call('end_test', lambda: (test.status, test.message),
+                   lambda: (test.name, self._get_test_attrs(
+                       test, self._get_end_attrs(test, 'tags'))))
 
     def start_keyword(self, kw):
-        for li in self._listeners:
-            if li.version == 1:
-                li.call_method(li.start_keyword, kw.name, kw.args)
-            else:
-                attrs = self._get_start_attrs(kw, 'args', '-longname')
-                attrs['type'] = self._get_keyword_type(kw, start=True)
-                li.call_method(li.start_keyword, kw.name, attrs)
+        if not self._keyword_listeners:
+            return
+        # Keyword type must be resolved also when only end_keyword is
+        # implemented because resolving it keeps track of setups and
+        # teardowns.
+        kw_type = self._get_keyword_type(kw, start=True)
+        self._call('start_keyword', lambda: (kw.name, kw.args),
+                   lambda: (kw.name, self._get_keyword_attrs(
+                       kw_type, self._get_start_attrs(kw, 'args',
+                                                      '-longname'))))
+
+    def _get_keyword_attrs(self, kw_type, attrs):
+        attrs['type'] = kw_type
+        return attrs
 
     def end_keyword(self, kw):
-        for li in self._listeners:
-            if li.version == 1:
-                li.call_method(li.end_keyword, kw.status)
-            else:
-                attrs = self._get_end_attrs(kw, 'args', '-longname', '-message')
-                attrs['type'] = self._get_keyword_type(kw, start=False)
-                li.call_method(li.end_keyword, kw.name, attrs)
+        if not self._keyword_listeners:
+            return
+        kw_type = self._get_keyword_type(kw, start=False)
+        self._call('end_keyword', lambda: (kw.status,),
+                   lambda: (kw.name, self._get_keyword_attrs(
+                       kw_type, self._get_end_attrs(kw, 'args', '-longname',
+                                                    '-message'))))
 
     def _get_keyword_type(self, kw, start=True):
         # When running setup or teardown, only the top level keyword has type
@@ -160,22 +202,20 @@ class Listeners(object):
                           kw.type.title())
 
     def log_message(self, msg):
-        for li in self._listeners:
-            if li.version == 2:
-                li.call_method(li.log_message, self._create_msg_dict(msg))
+        self._call('log_message', None,
+                   lambda: (self._create_msg_dict(msg),))
 
     def message(self, msg):
-        for li in self._listeners:
-            if li.version == 2:
-                li.call_method(li.message, self._create_msg_dict(msg))
+        self._call('message', None, lambda: (self._create_msg_dict(msg),))
 
     def _create_msg_dict(self, msg):
         return {'timestamp': msg.timestamp, 'message': msg.message,
                 'level': msg.level, 'html': 'yes' if msg.html else 'no'}
 
     def output_file(self, name, path):
-        for li in self._listeners:
-            li.call_method(getattr(li, '%s_file' % name.lower()), path)
+        method = '%s_file' % name.lower()
+        for li in self._method_listeners.get(method, []):
+            li.call_method(getattr(li, method), path)
 
     def close(self):
         for li in self._listeners:
@@ -192,13 +232,16 @@ class Listeners(object):
         return dict((n, self._get_attr_value(item, n)) for n in names)
 
     def _get_attr_names(self, defaults, extras):
-        names = list(defaults)
-        for name in extras:
-            if name.startswith('-'):
-                names.remove(name[1:])
-            else:
-                names.append(name)
-        return names
+        key = (tuple(defaults), extras)
+        if key not in self._attr_names:
+            names = list(defaults)
+            for name in extras:
+                if name.startswith('-'):
+                    names.remove(name[1:])
+                else:
+                    names.append(name)
+            self._attr_names[key] = names
+        return self._attr_names[key]
 
     def _get_attr_value(self, item, name):
         value = getattr(item, name)
@@ -224,6 +267,9 @@ class _ListenerProxy(AbstractLoggerProxy):
         self.name = name
         self.version = self._get_version(listener)
         self.is_java = utils.is_jython and isinstance(listener, Object)
+        # Methods the listener does not have are replaced with `_no_method`.
+        self.methods = frozenset(name for name in self._methods
+                                 if getattr(self, name) != self._no_method)
 
     def _import_listener(self, name, args):
         importer = utils.Importer('listener')
@@ -12,22 +12,34 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from robot.result.binaryformat import is_binary_output
+
 from . import pyloggingconf
 from .debugfile import DebugFile
 from .listeners import Listeners
 from .logger import LOGGER
 from .loggerhelper import AbstractLogger
 from .xmllogger import XmlLogger
+from .binarylogger import BinaryLogger
 
 
 class Output(AbstractLogger):
 
     def __init__(self, settings):
         AbstractLogger.__init__(self)
-        self._xmllogger = XmlLogger(settings['Output'], settings['LogLevel'])
+        self._xmllogger = self._get_output_logger(settings['Output'],
+                                                  settings['LogLevel'],
+                                                  settings['OutputIndex'],
+                                                  settings['BackgroundOutput'])
         self._register_loggers(settings['Listeners'], settings['DebugFile'])
         self._settings = settings
 
+    def _get_output_logger(self, path, log_level, index=False,
+                           background=False):
+        if is_binary_output(path):
+            return BinaryLogger(path, log_level)
+        return XmlLogger(path, log_level, index=index, background=background)
+
     def _register_loggers(self, listeners, debugfile):
         LOGGER.register_context_changing_logger(self._xmllogger)
         for logger in Listeners(listeners), DebugFile(debugfile):
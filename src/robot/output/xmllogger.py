@@ -16,23 +16,35 @@ from robot.errors import DataError
 from robot.utils import XmlWriter, NullMarkupWriter, get_timestamp, unic
 from robot.version import get_full_version
 from robot.result.visitor import ResultVisitor
+from robot.result.outputindex import OutputIndexWriter, NullOutputIndexWriter
 
+from .backgroundwriter import BackgroundWriter
 from .loggerhelper import IsLogged
 
 
 class XmlLogger(ResultVisitor):
 
-    def __init__(self, path, log_level='TRACE', generator='Robot'):
+    def __init__(self, path, log_level='TRACE', generator='Robot',
+                 index=False, background=False):
         self._log_message_is_logged = IsLogged(log_level)
         self._error_message_is_logged = IsLogged('WARN')
         self._writer = self._get_writer(path, generator)
+        self._index = self._get_index(path, index, generator)
+        self._background = None
+        if path and background:
+            # Items are read when they are logged and only writing is done
+            # in the background. Later changes to them do not affect output.
+            self._background = BackgroundWriter()
+            self._writer = self._background.wrap(self._writer)
+            self._index = self._background.wrap(self._index)
         self._errors = []
 
     def _get_writer(self, path, generator):
         if not path:
             return NullMarkupWriter()
         try:
-            writer = XmlWriter(path, encoding='UTF-8')
+            writer = XmlWriter(path, encoding='UTF-8', buffer_size=64 * 1024,
+                               flush_interval=1)
         except EnvironmentError, err:
             raise DataError("Opening output file '%s' failed: %s" %
                             (path, err.strerror))
@@ -40,6 +52,11 @@ class XmlLogger(ResultVisitor):
                                'generated': get_timestamp()})
         return writer
 
+    def _get_index(self, path, index, generator):
+        if not (path and index):
+            return NullOutputIndexWriter()
+        return OutputIndexWriter(path, self._writer.output, generator)
+
     def close(self):
         self.start_errors()
         for msg in self._errors:
@@ -47,6 +64,9 @@ class XmlLogger(ResultVisitor):
         self.end_errors()
         self._writer.end('robot')
         self._writer.close()
+        self._index.close()
+        if self._background:
+            self._background.close()
 
     def set_log_level(self, level):
         return self._log_message_is_logged.set_level(level)
@@ -81,6 +101,8 @@ class XmlLogger(ResultVisitor):
         attrs = {'id': test.id, 'name': test.name}
         if test.timeout:
             attrs['timeout'] = unicode(test.timeout)
+        self._writer.flush()
+        self._index.start('test', test)
         self._writer.start('test', attrs)
 
     def end_test(self, test):
@@ -88,11 +110,15 @@ class XmlLogger(ResultVisitor):
         self._write_list('tags', 'tag', test.tags)
         self._write_status(test, {'critical': 'yes' if test.critical else 'no'})
         self._writer.end('test')
+        self._writer.flush()
+        self._index.end(test)
 
     def start_suite(self, suite):
         attrs = {'id': suite.id, 'name': suite.name}
         if suite.source:
             attrs['source'] = suite.source
+        self._writer.flush()
+        self._index.start('suite', suite)
         self._writer.start('suite', attrs)
 
     def end_suite(self, suite):
@@ -103,6 +129,8 @@ class XmlLogger(ResultVisitor):
         self._writer.end('metadata')
         self._write_status(suite)
         self._writer.end('suite')
+        self._writer.flush()
+        self._index.end(suite)
 
     def start_statistics(self, stats):
         self._writer.start('statistics')
@@ -0,0 +1,275 @@
+#  Copyright 2008-2013 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""On-disk cache for parsed test case and resource files.
+
+The cache is enabled by setting the :data:`CACHE_DIRECTORY_ENV_VAR`
+environment variable to point to a directory where to store cached data.
+It is used by all tools parsing test data, including test execution,
+Libdoc, Testdoc and Tidy.
+
+Each parsed file is stored into its own file in the cache directory.
+Cached data is used only if the path, modification time and size of the
+parsed file, as well as the Robot Framework version, match. Possible
+syntax errors reported when the file was parsed are stored with the data
+and reported again when the cached data is used.
+
+The same serialized format is used also when files are parsed in other
+processes using :func:`parse` and the data is then made available to
+:func:`populate` using :func:`preparsed`. Also those processes use the
+cache if it is enabled.
+
+Cached data is stored using :mod:`pickle`, and loading it can execute
+arbitrary code. Anyone who can write to the cache directory can thus run
+code as the user using the cache. On platforms supporting file ownership,
+the cache is not used at all if the directory is not owned by the current
+user or if it is writable by others, and individual cache files are
+ignored under the same conditions. Elsewhere the cache directory must be
+protected by other means.
+"""
+
+from __future__ import with_statement
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from cStringIO import StringIO
+try:
+    from hashlib import sha1
+except ImportError:  # IronPython
+    from sha import new as sha1
+
+from robot.errors import DataError
+from robot.output import LOGGER
+from robot.utils import get_error_message
+from robot.version import get_version
+
+from . import populators
+
+
+#: Name of the environment variable used to enable the cache.
+CACHE_DIRECTORY_ENV_VAR = 'ROBOT_DATA_CACHE'
+_FORMAT_VERSION = 2
+_preparsed = {}
+_insecure_directories = set()
+
+
+def populate(datafile):
+    """Populates the given test case or resource file using the cache.
+
+    Data made available using :func:`preparsed` is used first. Otherwise
+    the on-disk cache is used if it is enabled. If the file has not been
+    cached earlier, it is parsed normally.
+    """
+    data = _preparsed.pop(_get_name(datafile), None)
+    if data is not None:
+        _populate_preparsed(datafile, data)
+    else:
+        _parse(datafile)
+
+
+def parse(datafile):
+    """Parses the given datafile and returns its data in serialized form.
+
+    Returns a tuple containing a name identifying the file and the data.
+    If parsing fails, the data is the error message. The result can be
+    given to :func:`preparsed` also in another process. The on-disk cache
+    is used and updated if it is enabled.
+    """
+    try:
+        output = StringIO()
+        _dump(datafile, _parse(datafile, report=False), output)
+        data = output.getvalue()
+    except DataError, err:
+        data = unicode(err)
+    return _get_name(datafile), data
+
+
+@contextmanager
+def preparsed(data):
+    """Makes data returned by :func:`parse` available to :func:`populate`.
+
+    :param data: Dictionary mapping names to data, or an iterable of
+        name and data pairs.
+
+    Data that has not been used is discarded when the context ends.
+    """
+    data = dict(data)
+    _preparsed.update(data)
+    try:
+        yield
+    finally:
+        for name in data:
+            _preparsed.pop(name, None)
+
+
+def _populate_preparsed(datafile, data):
+    LOGGER.info("Parsing file '%s'." % datafile.source)
+    if isinstance(data, unicode):
+        raise DataError(data)
+    _apply(datafile, *_load(StringIO(data), datafile))
+
+
+def _get_name(datafile):
+    return '%s:%s' % (type(datafile).__name__, datafile.source)
+
+
+def _parse(datafile, report=True):
+    directory = os.environ.get(CACHE_DIRECTORY_ENV_VAR)
+    if directory and datafile.source and os.path.isfile(datafile.source):
+        return DataCache(directory).parse(datafile, report)
+    return _parse_file(datafile, report)
+
+
+def _parse_file(datafile, report=True):
+    # Errors reported during parsing are recorded by temporarily
+    # overriding the reporting method of this particular datafile.
+    # Tables and other objects report errors through it.
+    errors = []
+    report_invalid_syntax = datafile.report_invalid_syntax
+    def record(message, level='ERROR'):
+        errors.append((message, level))
+        if report:
+            report_invalid_syntax(message, level)
+    datafile.report_invalid_syntax = record
+    try:
+        populators.FromFilePopulator(datafile).populate(datafile.source)
+    finally:
+        del datafile.report_invalid_syntax
+    return errors
+
+
+def _dump(datafile, errors, output):
+    # The datafile itself is not stored but replaced with the object given
+    # when the data is loaded. Its parent is not stored at all because the
+    # datafile may have a different parent, or none, when it is parsed.
+    state = datafile.__dict__.copy()
+    state.pop('parent', None)
+    pickler = pickle.Pickler(output, pickle.HIGHEST_PROTOCOL)
+    pickler.persistent_id = lambda obj: 'datafile' if obj is datafile else None
+    pickler.dump((state, errors))
+
+
+def _load(input, datafile):
+    unpickler = pickle.Unpickler(input)
+    unpickler.persistent_load = {'datafile': datafile}.get
+    return unpickler.load()
+
+
+def _apply(datafile, state, errors, report=True):
+    datafile.__dict__.update(state)
+    if report:
+        for message, level in errors:
+            datafile.report_invalid_syntax(message, level)
+
+
+class DataCache(object):
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(directory)
+
+    def populate(self, datafile):
+        self.parse(datafile)
+
+    def parse(self, datafile, report=True):
+        """Populates the datafile using cached data or by parsing it.
+
+        Returns errors reported during parsing. They are also reported
+        using the datafile if `report` is true.
+        """
+        if not self._directory_is_secure():
+            return _parse_file(datafile, report)
+        path = self._get_cache_path(datafile)
+        key = self._get_key(datafile)
+        errors = self._read(path, key, datafile, report)
+        if errors is None:
+            errors = _parse_file(datafile, report)
+            self._write(path, key, datafile, errors)
+        return errors
+
+    def _get_cache_path(self, datafile):
+        name = _get_name(datafile)
+        return os.path.join(self.directory,
+                            sha1(name.encode('UTF-8')).hexdigest())
+
+    def _get_key(self, datafile):
+        stat = os.stat(datafile.source)
+        return (_FORMAT_VERSION, get_version(), populators.PROCESS_CURDIR,
+                datafile.source, stat.st_mtime, stat.st_size)
+
+    def _directory_is_secure(self):
+        directory = self.directory
+        if not os.path.exists(directory) or self._is_secure(directory):
+            return True
+        if directory not in _insecure_directories:
+            _insecure_directories.add(directory)
+            LOGGER.warn("Data cache directory '%s' is not used because it is "
+                        "not owned by the current user or is writable by "
+                        "others." % directory)
+        return False
+
+    def _is_secure(self, path):
+        # Unpickling data can execute arbitrary code. Data written by other
+        # users is thus not trusted. Without ownership information nothing
+        # can be checked.
+        if not hasattr(os, 'getuid'):
+            return True
+        info = os.stat(path)
+        return (info.st_uid == os.getuid() and
+                not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH))
+
+    def _read(self, path, key, datafile, report=True):
+        if not os.path.isfile(path):
+            return None
+        if not self._is_secure(path):
+            LOGGER.info("Ignoring cached data '%s' because it is not owned by "
+                        "the current user or is writable by others." % path)
+            return None
+        try:
+            with open(path, 'rb') as cache:
+                if pickle.load(cache) != key:
+                    return None
+                state, errors = _load(cache, datafile)
+        except:
+            LOGGER.info("Reading cached data '%s' failed: %s"
+                        % (path, get_error_message()))
+            return None
+        LOGGER.info("Parsing file '%s' using cached data." % datafile.source)
+        _apply(datafile, state, errors, report)
+        return errors
+
+    def _write(self, path, key, datafile, errors):
+        # Data is written to a temporary file that is then renamed to avoid
+        # other processes reading partial data.
+        temp = None
+        try:
+            if not os.path.exists(self.directory):
+                os.makedirs(self.directory, 0700)
+            fd, temp = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, 'wb') as cache:
+                pickle.dump(key, cache, pickle.HIGHEST_PROTOCOL)
+                _dump(datafile, errors, cache)
+            if os.path.exists(path):
+                os.remove(path)
+            os.rename(temp, path)
+        except:
+            LOGGER.info("Writing cached data '%s' failed: %s"
+                        % (path, get_error_message()))
+            if temp and os.path.exists(temp):
+                os.remove(temp)
@@ -12,6 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from __future__ import with_statement
+
 import os
 import copy
 
@@ -21,24 +23,28 @@ from robot.output import LOGGER
 from robot import utils
 from robot.writer import DataFileWriter
 
+from . import datacache, parallel
 from .comments import Comment
-from .populators import FromFilePopulator, FromDirectoryPopulator
+from .populators import FromDirectoryPopulator
 from .settings import (Documentation, Fixture, Timeout, Tags, Metadata, Library,
     Resource, Variables, Arguments, Return, Template, MetadataList, ImportList)
 
 
 def TestData(parent=None, source=None, include_suites=None,
-             warn_on_skipped=False):
+             warn_on_skipped=False, processes=1):
     """Parses a file or directory to a corresponding model object.
 
     :param parent: (optional) parent to be used in creation of the model object.
     :param source: path where test data is read from.
+    :param processes: number of processes to use for parsing test case
+        files in a directory in parallel.
     :returns: :class:`~.model.TestDataDirectory`  if `source` is a directory,
         :class:`~.model.TestCaseFile` otherwise.
     """
     if os.path.isdir(source):
         return TestDataDirectory(parent, source).populate(include_suites,
-                                                          warn_on_skipped)
+                                                          warn_on_skipped,
+                                                          processes=processes)
     return TestCaseFile(parent, source).populate()
 
 
@@ -128,7 +134,7 @@ class TestCaseFile(_TestData):
         _TestData.__init__(self, parent, source)
 
     def populate(self):
-        FromFilePopulator(self).populate(self.source)
+        datacache.populate(self)
         self._validate()
         return self
 
@@ -163,7 +169,7 @@ class ResourceFile(_TestData):
         _TestData.__init__(self, source=source)
 
     def populate(self):
-        FromFilePopulator(self).populate(self.source)
+        datacache.populate(self)
         self._report_status()
         return self
 
@@ -203,9 +209,16 @@ class TestDataDirectory(_TestData):
         self.keyword_table = KeywordTable(self)
         _TestData.__init__(self, parent, source)
 
-    def populate(self, include_suites=None, warn_on_skipped=False, recurse=True):
-        FromDirectoryPopulator().populate(self.source, self, include_suites,
-                                          warn_on_skipped, recurse)
+    def populate(self, include_suites=None, warn_on_skipped=False,
+                 recurse=True, processes=1):
+        populator = FromDirectoryPopulator()
+        parsed = {}
+        if recurse and processes > 1:
+            files = populator.get_test_case_files(self.source, include_suites)
+            parsed = parallel.parse(TestCaseFile, files, processes)
+        with datacache.preparsed(parsed):
+            populator.populate(self.source, self, include_suites,
+                               warn_on_skipped, recurse)
         self.children = [ch for ch in self.children if ch.has_tests()]
         return self
 
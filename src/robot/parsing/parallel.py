@@ -0,0 +1,70 @@
+#  Copyright 2008-2013 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Parsing test case files in parallel in multiple processes.
+
+Files are parsed in worker processes into the serialized format used by
+:mod:`~robot.parsing.datacache`. The data directory tree is then populated
+normally in the main process using the parsed data instead of parsing files
+again. The created model, the order of the files, and the messages and
+errors logged during parsing are thus the same as when files are parsed
+serially.
+"""
+
+try:
+    import multiprocessing
+except ImportError:
+    multiprocessing = None  # Python 2.5, Jython and IronPython
+
+from robot.output import LOGGER
+from robot.utils import get_error_message
+
+from . import datacache
+
+
+def parse(datafile_class, paths, processes):
+    """Parses the given files in parallel using the given number of processes.
+
+    :param datafile_class: Class used to create datafiles, typically
+        :class:`~robot.parsing.model.TestCaseFile`.
+    :returns: Dictionary that can be given to
+        :func:`~robot.parsing.datacache.preparsed`. The dictionary is empty
+        if parallel parsing is not possible or fails, in which case files
+        are parsed normally.
+    """
+    if not multiprocessing or processes < 2 or len(paths) < 2:
+        return {}
+    pool = multiprocessing.Pool(min(processes, len(paths)), _disable_logging)
+    try:
+        try:
+            return dict(pool.map(_parse, [(datafile_class, path)
+                                          for path in paths]))
+        except:
+            LOGGER.info('Parsing files in parallel failed: %s'
+                        % get_error_message())
+            return {}
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _disable_logging():
+    # Messages are logged when the parsed data is used in the main process.
+    LOGGER.unregister_logger(*[proxy.logger for proxy in LOGGER])
+    LOGGER.disable_message_cache()
+
+
+def _parse(args):
+    datafile_class, path = args
+    return datacache.parse(datafile_class(source=path))
@@ -112,6 +112,24 @@ class FromDirectoryPopulator(object):
             self._populate_chidren(datadir, children, include_suites,
                                    warn_on_skipped)
 
+    def get_test_case_files(self, path, include_suites=None):
+        """Returns test case files populating the directory would parse.
+
+        Files are returned in the order they would be parsed. Initialization
+        files are not included.
+        """
+        include_suites = self._get_include_suites(path, include_suites)
+        files = []
+        for name, child in self._list_dir(path):
+            if (self._is_init_file(name, child) or
+                    not self._is_included(name, child, include_suites)):
+                continue
+            if os.path.isdir(child):
+                files.extend(self.get_test_case_files(child, include_suites))
+            else:
+                files.append(child)
+        return files
+
     def _populate_init_file(self, datadir, init_file):
         datadir.initfile = init_file
         try:
@@ -114,6 +114,13 @@ Options
                           specified. Given path, similarly as paths given to
                           --log, --report and --xunit, is relative to
                           --outputdir unless given as an absolute path.
+                          Outputs with extension `.rbin` are written in binary
+                          format. Binary outputs can be used as inputs the
+                          same way as XML outputs, which also allows
+                          converting outputs between the two formats.
+    --outputindex         Write an index next to the XML output file.
+                          See Robot Framework's --outputindex for details.
+                          Cannot be used with binary outputs.
  -l --log file            HTML log file. Can be disabled by giving a special
                           name `NONE`. Default: log.html
                           Examples: `--log mylog.html`, `-l none`
@@ -218,6 +225,11 @@ Options
                           of combined test suites together.
     --nostatusrc          Sets the return code to zero regardless of failures
                           in test cases. Error codes are returned normally.
+    --parseprocesses count  Parse multiple output files in parallel using
+                          the given number of processes. The combined results
+                          are the same as when outputs are parsed one by one.
+                          Requires Python 2.6 or newer and is ignored on
+                          Jython and IronPython. Default is 1.
  -C --monitorcolors auto|on|ansi|off  Use colors on console output or not.
                           auto: use colors when output not redirected (default)
                           on:   always use colors
@@ -14,6 +14,7 @@
 
 from __future__ import with_statement
 
+from robot.model import SuiteVisitor
 from robot.output import LEVELS
 
 from .jsbuildingcontext import JsBuildingContext
@@ -39,6 +40,30 @@ class JsModelBuilder(object):
             min_level=self._context.min_level
         )
 
+    def build_from_stream(self, streaming_result, configure=None):
+        """Builds the model while results are parsed from output XML.
+
+        Keywords and messages are converted to the model right when they
+        are parsed and they are never all in memory at the same time.
+        Suites and tests are built after parsing, which allows configuring
+        the result using the optional ``configure`` callable. It gets the
+        result as an argument and must not modify keywords or messages.
+        """
+        keywords = StreamingKeywordBuilder(self._context)
+        streaming_result.visit(keywords)
+        if configure:
+            configure(streaming_result)
+        suite_builder = StreamedSuiteBuilder(self._context, keywords.built)
+        return JsExecutionResult(
+            statistics=StatisticsBuilder().build(streaming_result.statistics),
+            suite=suite_builder.build(streaming_result.suite),
+            errors=ErrorsBuilder(self._context).build(streaming_result.errors),
+            strings=self._context.strings,
+            basemillis=self._context.basemillis,
+            split_results=self._context.split_results,
+            min_level=self._context.min_level
+        )
+
 
 class _Builder(object):
     _statuses = {'FAIL': 0, 'PASS': 1, 'NOT_RUN': 2}
@@ -130,14 +155,20 @@ class KeywordBuilder(_Builder):
 
     def build(self, kw, split=False):
         with self._context.prune_input(kw.messages, kw.keywords):
-            return (self._types[kw.type],
-                    self._string(kw.name),
-                    self._string(kw.timeout),
-                    self._html(kw.doc),
-                    self._string(', '.join(kw.args)),
-                    self._get_status(kw),
-                    self._build_keywords(kw.keywords, split),
-                    tuple(self._build_message(m) for m in kw.messages))
+            return self._build(kw) + \
+                    (self._build_keywords(kw.keywords, split),
+                     tuple(self._build_message(m) for m in kw.messages))
+
+    def build_with_children(self, kw, keywords, messages):
+        return self._build(kw) + (keywords, messages)
+
+    def _build(self, kw):
+        return (self._types[kw.type],
+                self._string(kw.name),
+                self._string(kw.timeout),
+                self._html(kw.doc),
+                self._string(', '.join(kw.args)),
+                self._get_status(kw))
 
 
 class MessageBuilder(_Builder):
@@ -154,6 +185,114 @@ class MessageBuilder(_Builder):
                 self._string(msg.html_message, escape=False))
 
 
+class StreamingKeywordBuilder(SuiteVisitor):
+    """Builds keywords and messages of streamed results as they are parsed.
+
+    Built test keywords are stored into :attr:`built` using the keyword
+    list of the test as a key, and suite setups and teardowns using the
+    keyword itself.
+    """
+
+    def __init__(self, context):
+        self._context = context
+        self._build_keyword = KeywordBuilder(context).build_with_children
+        self._build_message = MessageBuilder(context).build
+        self._children = []
+        self.built = {}
+
+    def start_test(self, test):
+        self._start_children(split=True)
+
+    def end_test(self, test):
+        keywords, _ = self._end_children()
+        self.built[test.keywords] = keywords
+
+    def start_keyword(self, kw):
+        suite_keyword = not self._children
+        self._start_children(split=suite_keyword, suite_keyword=suite_keyword)
+
+    def end_keyword(self, kw):
+        model = self._build_keyword(kw, *self._end_children())
+        if self._children:
+            self._children[-1].keywords.append(model)
+        else:
+            self.built[kw] = model
+
+    def visit_message(self, msg):
+        children = self._children[-1]
+        if not children.suite_keyword:
+            msg = self._build_message(msg)
+        children.messages.append(msg)
+
+    def _start_children(self, split, suite_keyword=False):
+        splitting = self._context.start_splitting_if_needed(split)
+        self._children.append(_Children(splitting, suite_keyword))
+
+    def _end_children(self):
+        children = self._children.pop()
+        keywords = tuple(children.keywords)
+        if children.splitting:
+            keywords = self._context.end_splitting(keywords)
+        # Messages of suite setups and teardowns are not split.
+        if children.suite_keyword:
+            children.messages = [self._build_message(m)
+                                 for m in children.messages]
+        return keywords, tuple(children.messages)
+
+
+class _Children(object):
+
+    def __init__(self, splitting, suite_keyword):
+        self.splitting = splitting
+        self.suite_keyword = suite_keyword
+        self.keywords = []
+        self.messages = []
+
+
+class StreamedSuiteBuilder(SuiteBuilder):
+    """Builds suites and tests using keywords built during streaming.
+
+    Split results created during streaming are re-added to the context in
+    the same order as when building from a full result.
+    """
+
+    def __init__(self, context, built_keywords):
+        SuiteBuilder.__init__(self, context)
+        splits = _StreamedSplitResults(context)
+        self._build_test = StreamedTestBuilder(context, built_keywords,
+                                               splits).build
+        self._build_keyword = lambda kw, split=False: \
+                splits.readd_keyword(built_keywords[kw])
+
+
+class StreamedTestBuilder(TestBuilder):
+
+    def __init__(self, context, built_keywords, splits):
+        TestBuilder.__init__(self, context)
+        self._built_keywords = built_keywords
+        self._splits = splits
+
+    def _build_keywords(self, kws, split=False):
+        return self._splits.readd(self._built_keywords[kws])
+
+
+class _StreamedSplitResults(object):
+
+    def __init__(self, context):
+        self._context = context
+        self._streamed = context.split_results
+        context.split_results = []
+
+    def readd(self, keywords):
+        if isinstance(keywords, tuple):
+            return keywords
+        self._context.split_results.append(self._streamed[keywords-1])
+        return len(self._context.split_results)
+
+    def readd_keyword(self, kw):
+        return kw[:6] + (self.readd(kw[6]),) + kw[7:]
+
+
 class StatisticsBuilder(object):
 
     def build(self, statistics):
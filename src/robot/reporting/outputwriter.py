@@ -13,12 +13,14 @@
 #  limitations under the License.
 
 from robot.output.xmllogger import XmlLogger
+from robot.output.binarylogger import BinaryLogger
+from robot.result import binaryformat as rbin
 
 
 class OutputWriter(XmlLogger):
 
-    def __init__(self, output):
-        XmlLogger.__init__(self, output, generator='Rebot')
+    def __init__(self, output, index=False):
+        XmlLogger.__init__(self, output, generator='Rebot', index=index)
 
     def start_message(self, msg):
         self._write_message(msg)
@@ -26,6 +28,26 @@ class OutputWriter(XmlLogger):
     def close(self):
         self._writer.end('robot')
         self._writer.close()
+        self._index.close()
+
+    def end_result(self, result):
+        self.close()
+
+
+class BinaryOutputWriter(BinaryLogger):
+
+    def __init__(self, output):
+        BinaryLogger.__init__(self, output, generator='Rebot')
+
+    def start_message(self, msg):
+        self._write_message(msg)
+
+    def visit_errors(self, errors):
+        for msg in errors:
+            self._write_message(msg, rbin.ERROR)
+
+    def close(self):
+        self._writer.close()
 
     def end_result(self, result):
         self.close()
@@ -53,7 +53,8 @@ class ResultWriter(object):
         settings = settings or RebotSettings(options)
         results = Results(settings, *self._sources)
         if settings.output:
-            self._write_output(results.result, settings.output)
+            self._write_output(results.result, settings.output,
+                               settings.output_index)
         if settings.xunit:
             self._write_xunit(results.result, settings.xunit,
                               settings.xunit_skip_noncritical)
@@ -67,8 +68,8 @@ class ResultWriter(object):
                                settings.report_config)
         return results.return_code
 
-    def _write_output(self, result, path):
-        self._write('Output', result.save, path)
+    def _write_output(self, result, path, index=False):
+        self._write('Output', result.save, path, index)
 
     def _write_xunit(self, result, path, skip_noncritical):
         self._write('XUnit', XUnitWriter(result, skip_noncritical).write, path)
@@ -95,6 +96,8 @@ class ResultWriter(object):
 
 
 class Results(object):
+    _model_modifiers = ('remove_keywords', 'include_tags', 'exclude_tags',
+                        'include_suites', 'include_tests')
 
     def __init__(self, settings, *sources):
         self._settings = settings
@@ -112,22 +115,42 @@ class Results(object):
     @property
     def result(self):
         if self._result is None:
-            include_keywords = bool(self._settings.log or self._settings.output)
+            settings = self._settings
+            include_keywords = bool(settings.log or settings.output)
             self._result = ExecutionResult(include_keywords=include_keywords,
+                                           processes=settings.parse_processes,
                                            *self._sources)
-            self._result.configure(self._settings.status_rc,
-                                   self._settings.suite_config,
-                                   self._settings.statistics_config)
-            self.return_code = self._result.return_code
+            self._configure(self._result)
         return self._result
 
+    def _configure(self, result):
+        result.configure(self._settings.status_rc,
+                         self._settings.suite_config,
+                         self._settings.statistics_config)
+        self.return_code = result.return_code
+
     @property
     def js_result(self):
         if self._js_result is None:
             builder = JsModelBuilder(log_path=self._settings.log,
                                      split_log=self._settings.split_log,
                                      prune_input_to_save_memory=self._prune)
-            self._js_result = builder.build_from(self.result)
+            if self._can_build_js_result_while_parsing():
+                result = ExecutionResult(self._sources[0], streaming=True)
+                self._js_result = builder.build_from_stream(result,
+                                                            self._configure)
+            else:
+                self._js_result = builder.build_from(self.result)
             if self._prune:
                 self._result = None
         return self._js_result
+
+    def _can_build_js_result_while_parsing(self):
+        # Keyword information is needed only by the log file. Combining
+        # outputs, removing keywords, and filtering tests or messages need
+        # the full model and are not supported while parsing.
+        config = self._settings.suite_config
+        return (self._result is None and self._settings.log and
+                len(self._sources) == 1 and
+                not any(config.get(name) for name in self._model_modifiers) and
+                config.get('log_level', 'TRACE') == 'TRACE')
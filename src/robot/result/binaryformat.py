@@ -0,0 +1,417 @@
+#  Copyright 2008-2013 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Compact binary alternative to output XML files.
+
+A binary output starts with :data:`MAGIC` and :data:`FORMAT_VERSION` as
+an unsigned big-endian 16-bit integer. They are followed by records that
+have a header containing the record type as an unsigned byte and
+the payload length as an unsigned big-endian 32-bit integer.
+
+Payloads of :data:`STRING` records are UTF-8 encoded strings. Every string
+is stored only once, and other records refer to strings using their index
+in this string table. Index ``0`` is always an empty string. Payloads of
+other records are sequences of unsigned big-endian 32-bit integers that
+are string indices, codes of statuses, keyword types, message levels or
+statistic types, or boolean flags. Fields of each record type are listed
+below. A field marked with ``*`` contains all remaining integers.
+
+- :data:`HEADER`: generator, generated
+- :data:`START_SUITE`: name, source
+- :data:`END_SUITE`: doc, message, starttime, endtime, \*metadata names
+  and values
+- :data:`START_TEST`: name, timeout
+- :data:`END_TEST`: doc, status, message, starttime, endtime, critical,
+  \*tags
+- :data:`START_KEYWORD`: type, name, timeout, doc, \*args
+- :data:`END_KEYWORD`: status, message, starttime, endtime
+- :data:`MESSAGE` and :data:`ERROR`: timestamp, level, html, text
+- :data:`STATISTIC`: type, name, \*attribute names and values
+
+The format version must be incremented whenever the format changes in
+a backwards incompatible way. Files with other versions are not read.
+
+Binary outputs are created when the output file has extension
+:data:`EXTENSION`, and :func:`~robot.result.resultbuilder.ExecutionResult`
+reads them transparently.
+"""
+
+from __future__ import with_statement
+
+import struct
+
+from robot.errors import DataError
+
+
+MAGIC = 'RBIN'
+FORMAT_VERSION = 2
+EXTENSION = '.rbin'
+
+STRING = 0
+HEADER = 1
+START_SUITE = 2
+END_SUITE = 3
+START_TEST = 4
+END_TEST = 5
+START_KEYWORD = 6
+END_KEYWORD = 7
+MESSAGE = 8
+ERROR = 9
+STATISTIC = 10
+
+STATUSES = ('FAIL', 'PASS', 'NOT_RUN')
+KEYWORD_TYPES = ('kw', 'setup', 'teardown', 'for', 'foritem')
+LEVELS = ('TRACE', 'DEBUG', 'INFO', 'WARN', 'ERROR', 'FAIL', 'NONE')
+STATISTIC_TYPES = ('total', 'tag', 'suite')
+KEYWORD_RECORDS = (START_KEYWORD, END_KEYWORD, MESSAGE)
+
+_file_header = struct.Struct('>%dsH' % len(MAGIC))
+_record_header = struct.Struct('>BI')
+
+
+def is_binary_output(path):
+    """Returns ``True`` if ``path`` should be written in binary format."""
+    return isinstance(path, basestring) and \
+        path.lower().endswith(EXTENSION)
+
+
+def is_binary_source(source):
+    """Returns ``True`` if ``source`` is a binary output.
+
+    Existing files are recognized based on their content and others based
+    on their extension.
+    """
+    if not isinstance(source, basestring) or source.lstrip().startswith('<'):
+        return False
+    try:
+        with open(source, 'rb') as binary:
+            return binary.read(len(MAGIC)) == MAGIC
+    except EnvironmentError:
+        return is_binary_output(source)
+
+
+def _codes(values):
+    return dict((value, index) for index, value in enumerate(values))
+
+
+class BinaryWriter(object):
+    """Writes records and maintains the string table."""
+    _status_codes = _codes(STATUSES)
+    _keyword_type_codes = _codes(KEYWORD_TYPES)
+    _level_codes = _codes(LEVELS)
+    _statistic_type_codes = _codes(STATISTIC_TYPES)
+
+    def __init__(self, path):
+        try:
+            self._output = open(path, 'wb')
+        except EnvironmentError, err:
+            raise DataError("Opening output file '%s' failed: %s"
+                            % (path, err.strerror))
+        self._output.write(_file_header.pack(MAGIC, FORMAT_VERSION))
+        self._strings = {u'': 0}
+
+    def string(self, string):
+        """Returns index of the given string in the string table.
+
+        New strings are written to the output before they are used.
+        """
+        if not string:
+            return 0
+        if not isinstance(string, unicode):
+            string = unicode(string)
+        if string not in self._strings:
+            self._strings[string] = len(self._strings)
+            self._write(STRING, string.encode('UTF-8'))
+        return self._strings[string]
+
+    def strings(self, strings):
+        return tuple(self.string(s) for s in strings)
+
+    def status(self, status):
+        return self._status_codes[status]
+
+    def keyword_type(self, type):
+        return self._keyword_type_codes[type]
+
+    def level(self, level):
+        return self._level_codes[level]
+
+    def statistic_type(self, type):
+        return self._statistic_type_codes[type]
+
+    def record(self, type, *fields):
+        """Writes a record containing the given integer fields.
+
+        A tuple as the last field is expanded to separate fields.
+        """
+        if fields and isinstance(fields[-1], tuple):
+            fields = fields[:-1] + fields[-1]
+        self._write(type, struct.pack('>%dI' % len(fields), *fields))
+
+    def _write(self, type, payload):
+        self._output.write(_record_header.pack(type, len(payload)))
+        self._output.write(payload)
+
+    def close(self):
+        self._output.close()
+
+
+class BinaryReader(object):
+    """Reads records from a binary output and resolves strings.
+
+    Iterating the reader yields ``(type, payload)`` tuples. String records
+    are handled internally and not yielded. Records whose type is in
+    ``skip`` are neither deserialized nor yielded. The file is read in
+    chunks so that the whole output is never in memory at once.
+    """
+    _chunk_size = 256 * 1024
+
+    def __init__(self, path, skip=()):
+        self._path = path
+        self._skip = skip
+        self.strings = [u'']
+
+    def __iter__(self):
+        binary = open(self._path, 'rb')
+        try:
+            self._verify_header(binary.read(_file_header.size))
+        except DataError:
+            binary.close()
+            raise
+        return self._read_records(binary)
+
+    def _verify_header(self, header):
+        if not header.startswith(MAGIC):
+            raise DataError('Not a binary output file.')
+        if len(header) < _file_header.size:
+            raise DataError('Binary output file is truncated.')
+        version = _file_header.unpack(header)[1]
+        if version != FORMAT_VERSION:
+            raise DataError('Unsupported binary output format version %d. '
+                            'Only version %d is supported.'
+                            % (version, FORMAT_VERSION))
+
+    def _read_records(self, binary):
+        # Reading is performance optimized. Do not change without profiling!
+        unpack = _record_header.unpack_from
+        header_size = _record_header.size
+        fields = _FieldsUnpacker().unpack
+        read = binary.read
+        chunk_size = self._chunk_size
+        skip = self._skip
+        strings = self.strings
+        try:
+            data = read(chunk_size)
+            position = 0
+            while True:
+                end = len(data)
+                missing = 0
+                while position + header_size <= end:
+                    type, length = unpack(data, position)
+                    start = position + header_size
+                    stop = start + length
+                    if stop > end:
+                        missing = stop - end
+                        break
+                    if type == STRING:
+                        strings.append(data[start:stop].decode('UTF-8'))
+                    elif type not in skip:
+                        yield type, fields(data, start, length)
+                    position = stop
+                more = read(max(chunk_size, missing))
+                if not more:
+                    break
+                data = data[position:] + more
+                position = 0
+            if position < len(data):
+                raise DataError('Binary output file is truncated.')
+        finally:
+            binary.close()
+
+
+class _FieldsUnpacker(object):
+
+    def __init__(self):
+        self._structs = {}
+
+    def unpack(self, data, start, length):
+        try:
+            unpacker = self._structs[length]
+        except KeyError:
+            if length % 4:
+                raise DataError('Invalid record length %d.' % length)
+            unpacker = struct.Struct('>%dI' % (length // 4)).unpack_from
+            self._structs[length] = unpacker
+        return unpacker(data, start)
+
+
+class BinaryRecordHandler(object):
+    """Builds :class:`~.executionresult.Result` objects from records."""
+
+    def __init__(self, execution_result, strings):
+        self._result = execution_result
+        self._strings = strings
+        self._stack = []
+        self._handlers = {HEADER: self._header,
+                          START_SUITE: self._start_suite,
+                          END_SUITE: self._end_suite,
+                          START_TEST: self._start_test,
+                          END_TEST: self._end_test,
+                          START_KEYWORD: self._start_keyword,
+                          END_KEYWORD: self._end_keyword,
+                          MESSAGE: self._message,
+                          ERROR: self._error,
+                          STATISTIC: self._statistic}
+
+    def handle(self, type, payload):
+        try:
+            handler = self._handlers[type]
+        except KeyError:
+            raise DataError('Invalid record type %d.' % type)
+        handler(*payload)
+
+    def _header(self, generator, generated):
+        generator = self._strings[generator]
+        generator = generator.split()[0].upper() if generator else ''
+        self._result.generated_by_robot = generator == 'ROBOT'
+
+    def _start_suite(self, name, source):
+        strings = self._strings
+        if self._stack:
+            suite = self._stack[-1].suites.create(name=strings[name],
+                                                  source=strings[source])
+        else:
+            suite = self._result.suite
+            suite.name = strings[name]
+            suite.source = strings[source] or None
+        self._start(suite, 'suite')
+
+    def _end_suite(self, doc, message, starttime, endtime, *metadata):
+        strings = self._strings
+        suite = self._stack[-1]
+        suite.doc = strings[doc]
+        for name, value in zip(metadata[::2], metadata[1::2]):
+            suite.metadata[strings[name]] = strings[value]
+        suite.message = strings[message]
+        suite.starttime = self._timestamp(starttime)
+        suite.endtime = self._timestamp(endtime)
+        self._end('suite')
+
+    def _start_test(self, name, timeout):
+        strings = self._strings
+        test = self._stack[-1].tests.create(name=strings[name],
+                                            timeout=strings[timeout] or None)
+        self._start(test, 'test')
+
+    def _end_test(self, doc, status, message, starttime, endtime, critical,
+                  *tags):
+        # Criticality is re-created based on tags like with XML outputs.
+        strings = self._strings
+        test = self._stack[-1]
+        test.doc = strings[doc]
+        test.tags.add([strings[tag] for tag in tags])
+        test.status = STATUSES[status]
+        test.message = strings[message]
+        test.starttime = self._timestamp(starttime)
+        test.endtime = self._timestamp(endtime)
+        self._end('test')
+
+    def _start_keyword(self, type, name, timeout, doc, *args):
+        strings = self._strings
+        kw = self._stack[-1].keywords.create(name=strings[name],
+                                             timeout=strings[timeout] or None,
+                                             type=KEYWORD_TYPES[type])
+        kw.doc = strings[doc]
+        kw.args = tuple(strings[arg] for arg in args)
+        self._start(kw, 'keyword')
+
+    def _end_keyword(self, status, message, starttime, endtime):
+        kw = self._stack[-1]
+        kw.status = STATUSES[status]
+        if kw.type == kw.TEARDOWN_TYPE:
+            kw.message = self._strings[message]
+        kw.starttime = self._timestamp(starttime)
+        kw.endtime = self._timestamp(endtime)
+        self._end('keyword')
+
+    def _message(self, timestamp, level, html, text):
+        kw = self._stack[-1]
+        kw.messages.create(self._strings[text], LEVELS[level], bool(html),
+                           self._timestamp(timestamp))
+        self._message_created(kw)
+
+    def _error(self, timestamp, level, html, text):
+        self._result.errors.messages.create(self._strings[text], LEVELS[level],
+                                            bool(html),
+                                            self._timestamp(timestamp))
+
+    def _statistic(self, type, name, *attrs):
+        # Statistics are re-created from results like with XML outputs.
+        pass
+
+    def _timestamp(self, index):
+        return self._strings[index] or None
+
+    def _start(self, item, type):
+        self._stack.append(item)
+
+    def _end(self, type):
+        self._stack.pop()
+
+    def _message_created(self, kw):
+        pass
+
+
+class StreamingBinaryRecordHandler(BinaryRecordHandler):
+    """Passes suites, tests, keywords and messages to a visitor while reading.
+
+    Works the same way as
+    :class:`~.xmlelementhandlers.StreamingXmlElementHandler` except that
+    keywords are started already when their start record is read, because
+    the record contains also keyword documentation and arguments.
+    """
+
+    def __init__(self, execution_result, strings, visitor):
+        BinaryRecordHandler.__init__(self, execution_result, strings)
+        self._visitor = visitor
+        self._visit = [True]
+
+    def _start(self, item, type):
+        BinaryRecordHandler._start(self, item, type)
+        visit = self._visit[-1]
+        if visit:
+            visit = getattr(self._visitor, 'start_' + type)(item) is not False
+        self._visit.append(visit)
+
+    def _end(self, type):
+        item = self._stack.pop()
+        if type == 'suite':
+            self._handle_suite_teardown_failure(item)
+        if self._visit.pop():
+            getattr(self._visitor, 'end_' + type)(item)
+        if type != 'suite':
+            item.keywords.clear()
+        if type == 'keyword':
+            item.messages.clear()
+
+    def _message_created(self, kw):
+        if self._visit[-1]:
+            self._visitor.visit_message(kw.messages[-1])
+        kw.messages.clear()
+
+    def _handle_suite_teardown_failure(self, suite):
+        teardown = suite.keywords.teardown
+        if (self._result.generated_by_robot and
+                teardown and teardown.status == 'FAIL'):
+            suite.suite_teardown_failed(teardown.message)
@@ -16,8 +16,10 @@ from __future__ import with_statement
 
 from robot.model import Statistics
 
+from .binaryformat import is_binary_output
 from .executionerrors import ExecutionErrors
 from .testsuite import TestSuite
+from .visitor import ResultVisitor
 
 
 class Result(object):
@@ -93,14 +95,21 @@ class Result(object):
         self._status_rc = status_rc
         self._stat_config = stat_config or {}
 
-    def save(self, path=None):
+    def save(self, path=None, index=False):
         """Save results as a new output XML file.
 
         :param path: Path to save results to. If omitted, overwrites the
-            original file.
+            original file. If the path has extension ``.rbin``, results
+            are saved in the :mod:`binary format <.binaryformat>`.
+        :param index: When ``True``, an :mod:`index <.outputindex>` is
+            written next to the saved output XML file.
         """
-        from robot.reporting.outputwriter import OutputWriter
-        self.visit(OutputWriter(path or self.source))
+        from robot.reporting.outputwriter import OutputWriter, BinaryOutputWriter
+        path = path or self.source
+        if is_binary_output(path):
+            self.visit(BinaryOutputWriter(path))
+        else:
+            self.visit(OutputWriter(path, index))
 
     def visit(self, visitor):
         """An entry point to visit the whole result object.
@@ -122,6 +131,50 @@ class Result(object):
             self.suite.handle_suite_teardown_failures()
 
 
+class StreamingResult(Result):
+    """Test execution results that are visited while they are parsed.
+
+    Created by :func:`~.resultbuilder.ExecutionResult` when it is called
+    with ``streaming=True``. The source is parsed only when the result is
+    :meth:`visited <visit>`, and keywords and messages are released right
+    after they have been visited. This allows processing huge output files
+    without keeping them in memory.
+
+    Only ``start/end_suite``, ``start/end_test``, ``start/end_keyword`` and
+    ``visit_message`` methods of the visitor are called while parsing, in
+    the order items are in the output file. Suite teardowns are thus
+    visited after child suites and tests. Because output files contain
+    documentation, metadata, tags and statuses after child items, they are
+    available only when suites, tests and keywords are ended. Possible suite
+    teardown failures are also taken into account only when the suite is
+    ended, but ``suite.tests`` are available and up-to-date in
+    ``end_suite``. If the visitor is
+    a :class:`~.visitor.ResultVisitor`, also ``statistics`` and ``errors``
+    are visited after the suite.
+    """
+
+    def __init__(self, source, builder):
+        Result.__init__(self, source)
+        self._builder = builder
+
+    def visit(self, visitor):
+        """Parses the source and visits it with the given visitor.
+
+        :param visitor: An instance of :class:`~robot.model.SuiteVisitor`
+            or :class:`~.visitor.ResultVisitor`.
+        """
+        result_visitor = isinstance(visitor, ResultVisitor)
+        if result_visitor and visitor.start_result(self) is False:
+            return
+        self.suite = TestSuite()
+        self.errors = ExecutionErrors()
+        self._builder.stream(self, visitor)
+        if result_visitor:
+            self.statistics.visit(visitor)
+            self.errors.visit(visitor)
+            visitor.end_result(self)
+
+
 class CombinedResult(Result):
     """Combined results of multiple test executions."""
 
@@ -0,0 +1,216 @@
+#  Copyright 2008-2013 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Index files allowing random access to suites and tests in output XML files.
+
+An index is a text file next to the output file with an :data:`EXTENSION`
+added to the output file name. It starts with a header line containing
+the index format version, the generator of the output, and the size,
+modification time and a hash of the first and last blocks of the output
+file. The index is used only if they all still match the output. After
+the header, the index has one tab separated line for each suite and
+test in the order they are in the output. These lines contain the item
+type, id, start and end byte offsets, status, and name.
+
+Statuses in the index take possible suite teardown failures into account.
+"""
+
+from __future__ import with_statement
+
+import os
+from StringIO import StringIO
+try:
+    from hashlib import sha1
+except ImportError:  # IronPython
+    from sha import new as sha1
+
+from robot.errors import DataError
+from robot.utils import get_error_message
+
+from .resultbuilder import ExecutionResultBuilder
+from .testsuite import TestSuite
+
+
+EXTENSION = '.index'
+_HEADER = 'ROBOT-OUTPUT-INDEX'
+_VERSION = '2'
+_BLOCK_SIZE = 64 * 1024
+
+
+def index_path(output):
+    """Returns path to the index of the given output file."""
+    return output + EXTENSION
+
+
+def _fingerprint(output):
+    # Hashing only the first and last blocks keeps checking huge outputs
+    # cheap. Together with the size and the modification time they catch
+    # outputs that have been rewritten after the index was created.
+    size = os.path.getsize(output)
+    digest = sha1()
+    with open(output, 'rb') as data:
+        digest.update(data.read(_BLOCK_SIZE))
+        if size > _BLOCK_SIZE:
+            data.seek(max(size - _BLOCK_SIZE, _BLOCK_SIZE))
+            digest.update(data.read())
+    return [str(size), str(int(os.path.getmtime(output))),
+            digest.hexdigest()]
+
+
+class OutputIndexWriter(object):
+    """Collects offsets of suites and tests while an output is written.
+
+    :meth:`start` must be called right before an item is written to
+    the output and :meth:`end` right after it. The index itself is written
+    by :meth:`close` after the output file has been closed.
+    """
+
+    def __init__(self, output, output_file, generator):
+        self._output = output
+        self._output_file = output_file
+        self._generator = generator
+        self._items = []
+        self._started = []
+
+    def start(self, type, item):
+        entry = [type, item, self._output_file.tell(), None]
+        self._items.append(entry)
+        self._started.append(entry)
+
+    def end(self, item):
+        self._started.pop()[3] = self._output_file.tell()
+
+    def close(self):
+        header = [_HEADER, _VERSION, self._generator]
+        header.extend(_fingerprint(self._output))
+        with open(index_path(self._output), 'w') as index:
+            index.write(' '.join(header) + '\n')
+            for type, item, start, end in self._items:
+                line = '\t'.join([type, item.id, str(start), str(end),
+                                  item.status, item.name])
+                index.write(line.encode('UTF-8') + '\n')
+
+
+class NullOutputIndexWriter(object):
+    """Null implementation of the :class:`OutputIndexWriter` interface."""
+    start = end = close = lambda *args: None
+
+
+class IndexedItem(object):
+    """A suite or a test in an :class:`OutputIndex`."""
+    __slots__ = ['type', 'id', 'start', 'end', 'status', 'name', 'longname']
+
+    def __init__(self, type, id, start, end, status, name, parent=None):
+        self.type = type
+        self.id = id
+        self.start = int(start)
+        self.end = int(end)
+        self.status = status
+        self.name = name
+        self.longname = '%s.%s' % (parent.longname, name) if parent else name
+
+    @property
+    def passed(self):
+        return self.status == 'PASS'
+
+
+class OutputIndex(object):
+    """Index of suites and tests in an output XML file.
+
+    Makes it possible to check statuses of suites and tests without parsing
+    the output at all, and to :meth:`build` individual suites and tests
+    by parsing only their part of the output.
+
+    :param output: Path to the output XML file. Its index must exist and
+        be up-to-date, otherwise :class:`~robot.errors.DataError` is raised.
+    """
+
+    def __init__(self, output):
+        self.source = output
+        #: Indexed suites in the order they are in the output.
+        self.suites = []
+        #: Indexed tests in the order they are in the output.
+        self.tests = []
+        self._generated_by_robot = False
+        self._items = {}
+        try:
+            self._read(index_path(output), _fingerprint(output))
+        except DataError:
+            raise
+        except:
+            raise DataError("Reading index of '%s' failed: %s"
+                            % (output, get_error_message()))
+
+    def _read(self, path, fingerprint):
+        with open(path) as index:
+            header = index.readline().split()
+            if len(header) != 6 or header[:2] != [_HEADER, _VERSION]:
+                raise DataError("Invalid index file '%s'." % path)
+            if header[3:] != fingerprint:
+                raise DataError("Index file '%s' is not up-to-date." % path)
+            self._generated_by_robot = header[2].upper() == 'ROBOT'
+            for line in index:
+                self._add(*line.decode('UTF-8').rstrip('\n').split('\t', 5))
+
+    def _add(self, type, id, start, end, status, name):
+        parent = self._items[id.rsplit('-', 1)[0]] if '-' in id else None
+        item = IndexedItem(type, id, start, end, status, name, parent)
+        (self.suites if type == 'suite' else self.tests).append(item)
+        self._items[id] = item
+
+    def get(self, id):
+        """Returns :class:`IndexedItem` matching the given suite or test id."""
+        try:
+            return self._items[id]
+        except KeyError:
+            raise DataError("No suite or test with id '%s' in index of '%s'."
+                            % (id, self.source))
+
+    def build(self, id, include_keywords=True):
+        """Builds the suite or test with the given id by parsing only it.
+
+        :param id: Id of the suite or test like ``s1-s2-t3``.
+        :param include_keywords: Include keyword information to the built
+            suite or test.
+        :returns: A :class:`~.testsuite.TestSuite` or
+            a :class:`~.testcase.TestCase` object. Unless the root suite is
+            built, its parent is an empty suite that has the same long name
+            as the real parent suite.
+
+        Suite teardown failures inside a built suite are handled normally,
+        but possible failures of its parent suite teardowns are reflected
+        only by the :attr:`IndexedItem.status` in the index.
+        """
+        item = self.get(id)
+        with open(self.source, 'rb') as output:
+            output.seek(item.start)
+            fragment = output.read(item.end - item.start)
+        parent = self._parent(item)
+        builder = ExecutionResultBuilder(StringIO(fragment), include_keywords)
+        try:
+            built = builder.build_fragment(
+                TestSuite(name=parent.longname if parent else ''))
+        except:
+            raise DataError("Building '%s' from '%s' failed: %s"
+                            % (item.longname, self.source, get_error_message()))
+        if not parent:
+            built.parent = None
+        if self._generated_by_robot and item.type == 'suite':
+            built.handle_suite_teardown_failures()
+        return built
+
+    def _parent(self, item):
+        if '-' not in item.id:
+            return None
+        return self._items[item.id.rsplit('-', 1)[0]]
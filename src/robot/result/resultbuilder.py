@@ -14,43 +14,103 @@
 
 from __future__ import with_statement
 
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+try:
+    import multiprocessing
+except ImportError:
+    multiprocessing = None  # Python 2.5, Jython and IronPython
+
 from robot.errors import DataError
 from robot.utils import ET, ETSource, get_error_message
 
-from .xmlelementhandlers import XmlElementHandler
-from .executionresult import Result, CombinedResult
+from .binaryformat import (BinaryReader, BinaryRecordHandler,
+                           StreamingBinaryRecordHandler, KEYWORD_RECORDS,
+                           is_binary_source)
+from .xmlelementhandlers import (XmlElementHandler, StreamingXmlElementHandler,
+                                 FragmentHandler)
+from .executionresult import Result, CombinedResult, StreamingResult
 
 
 def ExecutionResult(*sources, **options):
     """Factory method to constructs :class:`~.executionresult.Result` objects.
 
-    :param sources: Path(s) to output XML file(s).
+    :param sources: Path(s) to output XML file(s). Binary outputs created
+                    by :class:`~robot.output.binarylogger.BinaryLogger`
+                    are detected and read automatically.
     :param options: Configuration options passed to
                     :py:class:`~ExecutionResultBuilder` as keyword arguments.
+                    Additionally ``streaming=True`` can be used to get
+                    a :class:`~.executionresult.StreamingResult` that is
+                    parsed only when it is visited, and ``processes=<int>``
+                    to parse multiple sources in parallel.
     :returns: :class:`~.executionresult.Result` instance.
 
     See :mod:`~robot.result` package for a usage example.
     """
     if not sources:
         raise DataError('One or more data source needed.')
+    if options.get('streaming') and len(sources) > 1:
+        raise DataError('Streaming is supported only with one data source.')
+    processes = options.pop('processes', 1)
     if len(sources) > 1:
-        return _combined_result(sources, options)
+        return _combined_result(sources, options, processes)
     return _single_result(sources[0], options)
 
 
-def _combined_result(sources, options):
+def _combined_result(sources, options, processes=1):
+    if processes > 1 and multiprocessing and _all_paths(sources):
+        return CombinedResult(_parse_in_parallel(sources, options, processes))
     return CombinedResult(ExecutionResult(src, **options) for src in sources)
 
 
+def _all_paths(sources):
+    return all(isinstance(src, basestring) for src in sources)
+
+
+def _parse_in_parallel(sources, options, processes):
+    # Results are pickled explicitly to get the most compact protocol.
+    # Pool.map returns results in the order of the sources.
+    pool = multiprocessing.Pool(min(processes, len(sources)))
+    try:
+        pickled = pool.map(_parse_and_pickle,
+                           [(src, options) for src in sources], chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    return [pickle.loads(result) for result in pickled]
+
+
+def _parse_and_pickle(args):
+    source, options = args
+    result = ExecutionResult(source, **options)
+    return pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+
+
 def _single_result(source, options):
-    ets = ETSource(source)
+    streaming = options.pop('streaming', False)
+    if is_binary_source(source):
+        builder = BinaryResultBuilder(source, **options)
+        name, format = source, 'binary'
+    else:
+        name, format = ETSource(source), 'XML'
+        builder = ExecutionResultBuilder(name, **options)
+    if streaming:
+        return StreamingResult(source, builder)
     try:
-        return ExecutionResultBuilder(ets, **options).build(Result(source))
+        return builder.build(Result(source))
     except IOError, err:
         error = err.strerror
     except:
         error = get_error_message()
-    raise DataError("Reading XML source '%s' failed: %s" % (unicode(ets), error))
+    raise _reading_failed(name, error, format)
+
+
+def _reading_failed(source, error, format='XML'):
+    return DataError("Reading %s source '%s' failed: %s"
+                     % (format, unicode(source), error))
 
 
 class ExecutionResultBuilder(object):
@@ -75,6 +135,36 @@ class ExecutionResultBuilder(object):
         result.handle_suite_teardown_failures()
         return result
 
+    def build_fragment(self, parent):
+        """Builds a suite or test element that is not inside a full output.
+
+        The built suite or test is added as a child to the given ``parent``
+        suite and returned.
+        """
+        handler = XmlElementHandler(parent, FragmentHandler())
+        with self._source as source:
+            self._parse(source, handler.start, handler.end)
+        return (parent.suites or parent.tests)[0]
+
+    def stream(self, result, visitor):
+        """Visits suites, tests, keywords and messages while parsing them.
+
+        Parsed keywords and messages are released after they have been
+        visited, which keeps memory usage low also with huge output files.
+        Failures of suite teardowns are handled before the suite is ended.
+        """
+        handler = StreamingXmlElementHandler(result, visitor)
+        try:
+            with self._source as source:
+                self._parse(source, handler.start, handler.end)
+        except IOError, err:
+            error = err.strerror
+        except:
+            error = get_error_message()
+        else:
+            return result
+        raise _reading_failed(self._source, error)
+
     def _parse(self, source, start, end):
         context = ET.iterparse(source, events=('start', 'end'))
         if not self._include_keywords:
@@ -99,3 +189,45 @@ class ExecutionResultBuilder(object):
                 elem.clear()
             if kw and not start:
                 started_kws -= 1
+
+
+class BinaryResultBuilder(object):
+
+    def __init__(self, source, include_keywords=True):
+        """Builds :class:`~.executionresult.Result` objects from binary
+        output files created by :class:`~robot.output.binarylogger.BinaryLogger`.
+
+        :param source: Path to binary output file.
+        :param include_keywords: Include keyword information to the
+            :class:`~.executionresult.Result` objects
+        """
+        self._source = source
+        self._skip = KEYWORD_RECORDS if not include_keywords else ()
+
+    def build(self, result):
+        reader = BinaryReader(self._source, self._skip)
+        self._read(reader, BinaryRecordHandler(result, reader.strings))
+        result.handle_suite_teardown_failures()
+        return result
+
+    def stream(self, result, visitor):
+        """Visits suites, tests, keywords and messages while reading them.
+
+        See :meth:`ExecutionResultBuilder.stream` for details.
+        """
+        reader = BinaryReader(self._source, self._skip)
+        handler = StreamingBinaryRecordHandler(result, reader.strings, visitor)
+        try:
+            self._read(reader, handler)
+        except IOError, err:
+            error = err.strerror
+        except:
+            error = get_error_message()
+        else:
+            return result
+        raise _reading_failed(self._source, error, 'binary')
+
+    def _read(self, reader, handler):
+        handle = handler.handle
+        for type, payload in reader:
+            handle(type, payload)
@@ -13,27 +13,70 @@
 #  limitations under the License.
 
 from robot import model, utils
+from robot.utils import setter
 
 from keyword import Keyword
 
 
 class TestCase(model.TestCase):
     """Results of a single test case."""
-    __slots__ = ['status', 'message', 'starttime', 'endtime']
+    __slots__ = ['message', '_status', '_starttime', '_endtime']
     keyword_class = Keyword
 
     def __init__(self, name='', doc='', tags=None, timeout=None, status='FAIL',
                  message='', starttime=None, endtime=None):
         model.TestCase.__init__(self, name, doc, tags, timeout)
-        #: String 'PASS' of 'FAIL'.
         self.status = status
         #: Possible failure message.
         self.message = message
-        #: Test case execution start time in format ``%Y%m%d %H:%M:%S.%f``.
         self.starttime = starttime
-        #: Test case execution end time in format ``%Y%m%d %H:%M:%S.%f``.
         self.endtime = endtime
 
+    # Status, times and tags affect statistics of the parent suites that
+    # are cached and must thus be told about changes.
+
+    def _changed(self):
+        if self.parent:
+            self.parent._children_changed()
+
+    def _get_status(self):
+        return self._status
+
+    def _set_status(self, status):
+        self._status = status
+        self._changed()
+
+    status = property(_get_status, _set_status,
+                      doc="String 'PASS' of 'FAIL'.")
+
+    def _get_starttime(self):
+        return self._starttime
+
+    def _set_starttime(self, starttime):
+        self._starttime = starttime
+        self._changed()
+
+    starttime = property(_get_starttime, _set_starttime,
+                         doc='Test case execution start time in format '
+                             '``%Y%m%d %H:%M:%S.%f``.')
+
+    def _get_endtime(self):
+        return self._endtime
+
+    def _set_endtime(self, endtime):
+        self._endtime = endtime
+        self._changed()
+
+    endtime = property(_get_endtime, _set_endtime,
+                       doc='Test case execution end time in format '
+                           '``%Y%m%d %H:%M:%S.%f``.')
+
+    @setter
+    def tags(self, tags):
+        """Test case tags as a :class:`~robot.model.tags.Tags` object."""
+        self._changed()
+        return _TestTags(tags, self)
+
     @property
     def elapsedtime(self):
         """Elapsed execution time of the test case in milliseconds."""
@@ -52,3 +95,20 @@ class TestCase(model.TestCase):
         if not self.parent:
             return True
         return self.parent.criticality.test_is_critical(self)
+
+
+class _TestTags(model.Tags):
+    """Tags that tell the test they belong to when they are modified."""
+    __slots__ = ['_test']
+
+    def __init__(self, tags, test):
+        model.Tags.__init__(self, tags)
+        self._test = test
+
+    def add(self, tags):
+        model.Tags.add(self, tags)
+        self._test._changed()
+
+    def remove(self, tags):
+        model.Tags.remove(self, tags)
+        self._test._changed()
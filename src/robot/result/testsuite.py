@@ -28,12 +28,14 @@ from .testcase import TestCase
 
 class TestSuite(model.TestSuite):
     """Result of a single test suite."""
-    __slots__ = ['message', 'starttime', 'endtime', '_criticality']
+    __slots__ = ['message', 'starttime', 'endtime', '_criticality',
+                 '_statistics']
     test_class = TestCase
     keyword_class = Keyword
 
     def __init__(self, name='', doc='', metadata=None, source=None,
                  message='', starttime=None, endtime=None):
+        self._statistics = None
         model.TestSuite.__init__(self, name, doc, metadata, source)
         #: Suite setup/teardown error message.
         self.message = message
@@ -46,7 +48,7 @@ class TestSuite(model.TestSuite):
     @property
     def passed(self):
         """``True`` if all critical tests succeeded, ``False`` otherwise."""
-        return not self.statistics.critical.failed
+        return not self._get_statistics().critical.failed
 
     @property
     def status(self):
@@ -57,15 +59,40 @@ class TestSuite(model.TestSuite):
     def statistics(self):
         """Suite statistics as a :class:`~robot.model.totalstatistics.TotalStatistics` object.
 
-        Recreated every time this property is accessed, so saving the results
-        to a variable and inspecting it is often a good idea::
+        Statistics are cached and recalculated only after tests in this
+        suite or in its child suites have been added, removed or modified.
+        A new object is returned every time this property is accessed::
 
             stats = suite.statistics
             print stats.critical.failed
             print stats.all.total
             print stats.message
         """
-        return TotalStatisticsBuilder(self).stats
+        builder = TotalStatisticsBuilder()
+        builder.add_statistics(self._get_statistics())
+        return builder.stats
+
+    def _get_statistics(self):
+        # Cached statistics are valid only with the criticality they were
+        # created with. Setting criticality or moving this suite to another
+        # suite structure can thus invalidate them.
+        criticality = self.criticality
+        if self._statistics and self._statistics[0] is criticality:
+            return self._statistics[1]
+        builder = TotalStatisticsBuilder()
+        for test in self.tests:
+            builder.add_test(test)
+        for suite in self.suites:
+            builder.add_statistics(suite._get_statistics())
+        self._statistics = (criticality, builder.stats)
+        return builder.stats
+
+    def _children_changed(self):
+        model.TestSuite._children_changed(self)
+        suite = self
+        while suite and suite._statistics:
+            suite._statistics = None
+            suite = suite.parent
 
     @property
     def full_message(self):
@@ -77,7 +104,7 @@ class TestSuite(model.TestSuite):
     @property
     def stat_message(self):
         """String representation of the suite's :attr:`statistics`."""
-        return self.statistics.message
+        return self._get_statistics().message
 
     @property
     def elapsedtime(self):
@@ -31,6 +31,84 @@ class XmlElementHandler(object):
         handler.end(elem, result)
 
 
+class StreamingXmlElementHandler(XmlElementHandler):
+    """Passes suites, tests, keywords and messages to a visitor while parsing.
+
+    Suites, tests and keywords are started when their first child item or
+    status is encountered, and ended when their element ends. After a
+    keyword has been visited its child keywords and messages are released,
+    and the same is done to test keywords after the test has been visited.
+    Suites and tests themselves are retained to keep statistics available.
+    """
+    _item_tags = {'suite': 'suite', 'test': 'test', 'kw': 'keyword'}
+    _starting_tags = ('suite', 'test', 'kw', 'msg', 'status')
+
+    def __init__(self, execution_result, visitor):
+        XmlElementHandler.__init__(self, execution_result)
+        self._execution_result = execution_result
+        self._visitor = visitor
+        self._items = []
+
+    def start(self, elem):
+        if elem.tag in self._starting_tags and self._items:
+            self._start_item(self._items[-1])
+        XmlElementHandler.start(self, elem)
+        handler, result = self._stack[-1]
+        if isinstance(handler, self._item_handlers):
+            visit = self._items[-1].visit if self._items else True
+            self._items.append(_StreamedItem(self._item_tags[elem.tag],
+                                             result, visit, len(self._stack)))
+
+    def end(self, elem):
+        depth = len(self._stack)
+        XmlElementHandler.end(self, elem)
+        if self._items and self._items[-1].depth == depth:
+            self._end_item(self._items.pop())
+        elif elem.tag == 'msg' and self._items:
+            keyword = self._stack[-1][1]
+            if self._items[-1].visit:
+                self._visitor.visit_message(keyword.messages[-1])
+            keyword.messages.clear()
+
+    @property
+    def _item_handlers(self):
+        return (SuiteHandler, TestCaseHandler, KeywordHandler)
+
+    def _start_item(self, item):
+        if not item.started:
+            item.started = True
+            if item.visit:
+                start = getattr(self._visitor, 'start_' + item.type)
+                item.visit = start(item.model) is not False
+
+    def _end_item(self, item):
+        self._start_item(item)
+        if item.type == 'suite':
+            self._handle_suite_teardown_failure(item.model)
+        if item.visit:
+            getattr(self._visitor, 'end_' + item.type)(item.model)
+        if item.type != 'suite':
+            item.model.keywords.clear()
+        if item.type == 'keyword':
+            item.model.messages.clear()
+
+    def _handle_suite_teardown_failure(self, suite):
+        teardown = suite.keywords.teardown
+        if (self._execution_result.generated_by_robot and
+                teardown and teardown.status == 'FAIL'):
+            suite.suite_teardown_failed(teardown.message)
+
+
+class _StreamedItem(object):
+
+    def __init__(self, type, model, visit, depth):
+        self.type = type
+        self.model = model
+        self.visit = visit
+        self.depth = depth
+        self.started = False
+
+
 class _Handler(object):
 
     def __init__(self):
@@ -74,6 +152,12 @@ class RobotHandler(_Handler):
         return [RootSuiteHandler(), StatisticsHandler(), ErrorsHandler()]
 
 
+class FragmentHandler(_Handler):
+
+    def _children(self):
+        return [SuiteHandler(), TestCaseHandler()]
+
+
 class SuiteHandler(_Handler):
     tag = 'suite'
 
@@ -150,7 +150,16 @@ Options
                           can also be further processed with Rebot tool. Can be
                           disabled by giving a special value `NONE`. In this
                           case, also log and report are automatically disabled.
-                          Default: output.xml
+                          If the file has extension `.rbin`, results are
+                          written in a compact binary format that is faster
+                          to process. Default: output.xml
+    --outputindex         Write an index next to the XML output file. The
+                          index allows tools like --runfailed to find tests
+                          and their statuses without parsing the whole output.
+                          Cannot be used with binary outputs.
+    --backgroundoutput    Write the XML output file in a separate thread so
+                          that writing it does not slow down test execution.
+                          Cannot be used with binary outputs.
  -l --log file            HTML log file. Can be disabled by giving a special
                           value `NONE`. Default: log.html
                           Examples: `--log mylog.html`, `-l NONE`
@@ -162,6 +171,12 @@ Options
     --xunitskipnoncritical  Mark non-critical tests on xUnit output as skipped.
  -b --debugfile file      Debug file written during execution. Not created
                           unless this option is specified.
+    --profile file        Profile containing call counts and execution times
+                          of executed keywords and libraries. Written as plain
+                          text to the given file and in CSV format to a file
+                          with the same name and extension `.csv`. Not created
+                          unless this option is specified. Not supported with
+                          --processes.
  -T --timestampoutputs    When this option is used, timestamp in a format
                           `YYYYMMDD-hhmmss` is added to all generated output
                           files between their basename and extension. For
@@ -265,6 +280,21 @@ Options
                           suites: randomizes suites
                           tests:  randomizes tests
                           none:   no randomization (default)
+    --processes count     Executes tests in parallel using the given number of
+                          processes. Child suites of the top level suite are
+                          run in separate processes and their results merged
+                          after execution. Setups and teardowns of the top
+                          level suite are run by every process. Per-process
+                          outputs are written to a directory next to the
+                          output file. Default is 1 (no parallel execution).
+    --splittests suite *  When using --processes, run tests and child suites
+                          of matching suites in separate processes. Suite is
+                          matched similarly as with --suite.
+                          Example: --processes 8 --splittests Smoke*
+    --parseprocesses count  Parses test case files in test data directories
+                          in parallel using the given number of processes.
+                          Requires Python 2.6 or newer and is ignored on
+                          Jython and IronPython. Default is 1.
     --runmode mode *      Deprecated in version 2.8. Use individual options
                           --dryrun, --exitonfailure, --skipteardownonexit, or
                           --randomize instead.
@@ -336,6 +366,14 @@ ROBOT_SYSLOG_FILE         Path to a file where Robot Framework writes internal
 ROBOT_SYSLOG_LEVEL        Log level to use when writing to the syslog file.
                           Available levels are the same as for --loglevel
                           command line option and the default is INFO.
+ROBOT_DATA_CACHE          Path to a directory where parsed test case and
+                          resource files are cached. Cached data is used
+                          instead of parsing a file again if the file has not
+                          been modified. Not used by default. Cached data can
+                          contain executable code, so the directory must not
+                          be writable by other users. On platforms supporting
+                          it, the cache is not used if the directory is owned
+                          by another user or writable by others.
 
 Examples
 ========
@@ -371,6 +409,7 @@ from robot.conf import RobotSettings
 from robot.output import LOGGER
 from robot.reporting import ResultWriter
 from robot.running import TestSuiteBuilder
+from robot.running.parallel import ParallelRunner
 from robot.utils import Application
 
 
@@ -389,9 +428,14 @@ class RobotFramework(Application):
         LOGGER.info('Settings:\n%s' % unicode(settings))
         suite = TestSuiteBuilder(settings['SuiteNames'],
                                  settings['WarnOnSkipped'],
-                                 settings['RunEmptySuite']).build(*datasources)
-        suite.configure(**settings.suite_config)
-        result = suite.run(settings)
+                                 settings['RunEmptySuite'],
+                                 settings.parse_processes).build(*datasources)
+        if settings.processes > 1:
+            runner = ParallelRunner(settings, datasources, options)
+            result = runner.run(suite)
+        else:
+            suite.configure(**settings.suite_config)
+            result = suite.run(settings)
         LOGGER.info("Tests execution ended. Statistics:\n%s"
                     % result.suite.stat_message)
         if settings.log or settings.report or settings.xunit:
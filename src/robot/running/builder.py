@@ -22,16 +22,21 @@ from .model import TestSuite, ForLoop
 
 class TestSuiteBuilder(object):
 
-    def __init__(self, include_suites=None, warn_on_skipped=False, include_empty_suites=False):
+    def __init__(self, include_suites=None, warn_on_skipped=False,
+                 include_empty_suites=False, processes=1):
         """Create programmatically executable
         :class:`~robot.running.model.TestSuite` objects based on existing data
         on the file system.
 
+        ``processes`` is the number of processes to use for parsing test case
+        files in directories in parallel.
+
         See example of usage in :mod:`.running` package.
         """
         self.include_suites = include_suites
         self.warn_on_skipped = warn_on_skipped
         self.include_empty_suites = include_empty_suites
+        self.processes = processes
 
     def build(self, *paths):
         if not paths:
@@ -59,7 +64,8 @@ class TestSuiteBuilder(object):
         try:
             return TestData(source=abspath(path),
                             include_suites=self.include_suites,
-                            warn_on_skipped=self.warn_on_skipped)
+                            warn_on_skipped=self.warn_on_skipped,
+                            processes=self.processes)
         except DataError, err:
             raise DataError("Parsing '%s' failed: %s" % (path, unicode(err)))
 
@@ -21,6 +21,7 @@ from robot.errors import FrameworkError
 from robot import utils
 
 from .testlibraries import TestLibrary
+from .userkeyword import UserLibrary
 
 
 class Importer(object):
@@ -28,6 +29,7 @@ class Importer(object):
     def __init__(self):
         self._library_cache = ImportCache()
         self._resource_cache = ImportCache()
+        self._user_library_cache = ImportCache()
 
     def reset(self):
         self.__init__()
@@ -50,6 +52,17 @@ class Importer(object):
             self._resource_cache[path] = resource
         return self._resource_cache[path]
 
+    def import_user_library(self, resource):
+        """Returns a user library containing keywords of the resource file.
+
+        The library is created only once and shared by all suites importing
+        the resource. It must thus not be modified.
+        """
+        if resource.source not in self._user_library_cache:
+            self._user_library_cache[resource.source] \
+                = UserLibrary(resource.keyword_table.keywords, resource.source)
+        return self._user_library_cache[resource.source]
+
     def _import_library(self, name, positional, named, lib):
         args = positional + ['%s=%s' % arg for arg in sorted(named.items())]
         key = (name, positional, named)
@@ -88,33 +101,40 @@ class ImportCache:
 
     Handles paths in keys case-insensitively on case-insensitive OSes.
     Unlike dicts, this storage accepts mutable values in keys.
+
+    Keys are indexed by their hashable equivalents so that lookups do not
+    need to go through all keys. Keys that cannot be made hashable are
+    searched linearly.
     """
 
     def __init__(self):
         self._keys = []
         self._items = []
+        self._index = {}
 
     def __setitem__(self, key, item):
         if not isinstance(key, (basestring, tuple)):
             raise FrameworkError('Invalid key for ImportCache')
         key = self._norm_path_key(key)
-        if key not in self._keys:
+        index = self._get_index(key)
+        if index is None:
+            self._add_to_index(key, len(self._keys))
             self._keys.append(key)
             self._items.append(item)
         else:
-            self._items[self._keys.index(key)] = item
+            self._items[index] = item
 
     def add(self, key, item=None):
         self.__setitem__(key, item)
 
     def __getitem__(self, key):
-        key = self._norm_path_key(key)
-        if key not in self._keys:
+        index = self._get_index(self._norm_path_key(key))
+        if index is None:
             raise KeyError
-        return self._items[self._keys.index(key)]
+        return self._items[index]
 
     def __contains__(self, key):
-        return self._norm_path_key(key) in self._keys
+        return self._get_index(self._norm_path_key(key)) is not None
 
     def values(self):
         return self._items
@@ -128,3 +148,29 @@ class ImportCache:
 
     def _is_path(self, key):
         return isinstance(key, basestring) and os.path.isabs(key) and os.path.exists(key)
+
+    def _get_index(self, key):
+        try:
+            return self._index.get(self._hashable(key))
+        except TypeError:
+            if key in self._keys:
+                return self._keys.index(key)
+            return None
+
+    def _add_to_index(self, key, index):
+        try:
+            self._index[self._hashable(key)] = index
+        except TypeError:
+            pass
+
+    def _hashable(self, key):
+        # Raises TypeError if the key contains unhashable items.
+        if isinstance(key, tuple):
+            return tuple(self._hashable(k) for k in key)
+        if isinstance(key, list):
+            return (list, tuple(self._hashable(k) for k in key))
+        if isinstance(key, dict):
+            return (dict, frozenset((self._hashable(k), self._hashable(v))
+                                    for k, v in key.items()))
+        hash(key)
+        return key
@@ -12,6 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from __future__ import with_statement
+
 from robot import model
 from robot.conf import RobotSettings
 from robot.output import LOGGER, Output, pyloggingconf
@@ -19,6 +21,7 @@ from robot.utils import setter
 from robot.variables import init_global_variables
 
 from .namespace import IMPORTER
+from .profiler import profiling
 from .randomizer import Randomizer
 from .runner import Runner
 from .signalhandler import STOP_SIGNAL_MONITOR
@@ -183,7 +186,8 @@ class TestSuite(model.TestSuite):
         init_global_variables(settings)
         output = Output(settings)
         runner = Runner(output, settings)
-        self.visit(runner)
+        with profiling(settings['Profile']):
+            self.visit(runner)
         output.close(runner.result)
         return runner.result
 
@@ -36,7 +36,7 @@ STDLIB_NAMES = set(('BuiltIn', 'Collections', 'Dialogs', 'Easter',
 IMPORTER = Importer()
 
 
-class Namespace:
+class Namespace(object):
     _default_libraries = ('BuiltIn', 'Reserved', 'Easter')
     _deprecated_libraries = {'BuiltIn': 'DeprecatedBuiltIn',
                              'OperatingSystem': 'DeprecatedOperatingSystem'}
@@ -49,6 +49,7 @@ class Namespace:
         self.test = None
         self.uk_handlers = []
         self.variables = _VariableScopes(variables, parent_variables)
+        self._handler_cache = _HandlerCache()
         self.library_search_order = []
         self._imports = imports
         self._user_keywords = UserLibrary(user_keywords)
@@ -56,6 +57,15 @@ class Namespace:
         self._imported_resource_files = ImportCache()
         self._imported_variable_files = ImportCache()
 
+    @property
+    def library_search_order(self):
+        return self._library_search_order
+
+    @library_search_order.setter
+    def library_search_order(self, order):
+        self._library_search_order = order
+        self._handler_cache.clear()
+
     def handle_imports(self):
         self._import_default_libraries()
         self._handle_imports(self._imports)
@@ -95,7 +105,8 @@ class Namespace:
             self.variables.set_from_variable_table(resource.variable_table,
                                                    overwrite)
             self._imported_resource_files[path] \
-                = UserLibrary(resource.keyword_table.keywords, resource.source)
+                = IMPORTER.import_user_library(resource)
+            self._handler_cache.clear()
             self._handle_imports(resource.setting_table.imports)
         else:
             LOGGER.info("Resource file '%s' already imported by suite '%s'"
@@ -135,6 +146,7 @@ class Namespace:
                         % (lib.name, self.suite.longname))
             return
         self._testlibs[lib.name] = lib
+        self._handler_cache.clear()
         lib.start_suite()
         if self.test:
             lib.start_test()
@@ -240,6 +252,14 @@ class Namespace:
             handler.replace_variables(self.variables)
 
     def _get_handler(self, name):
+        handler = self._handler_cache.get(name)
+        if not handler:
+            handler = self._find_handler(name)
+            if handler:
+                self._handler_cache[name] = handler
+        return handler
+
+    def _find_handler(self, name):
         handler = None
         if not name:
             raise DataError('Keyword name cannot be empty.')
@@ -379,6 +399,46 @@ class Namespace:
         raise DataError(error)
 
 
+class _HandlerCache(object):
+    """Caches keyword handlers found from a namespace by the used name.
+
+    Names are used as-is and not normalized because BDD prefixes, embedded
+    arguments and the old `Nx` syntax all depend on the exact name.
+    """
+
+    def __init__(self):
+        self._handlers = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name):
+        try:
+            handler = self._handlers[name]
+        except (KeyError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return handler
+
+    def __setitem__(self, name, handler):
+        self._handlers[name] = handler
+
+    def __len__(self):
+        return len(self._handlers)
+
+    def clear(self):
+        self._handlers.clear()
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return 100.0 * self.hits / lookups if lookups else 0.0
+
+    def __str__(self):
+        return '%d hits, %d misses (hit rate %.1f%%)' \
+                % (self.hits, self.misses, self.hit_rate)
+
+
 class _VariableScopes:
 
     def __init__(self, suite_variables, parent_variables):
@@ -396,10 +456,13 @@ class _VariableScopes:
         self._uk_handlers = []
 
     def __len__(self):
-        if self.current:
+        if self.current is not None:
             return len(self.current)
         return 0
 
+    def __nonzero__(self):
+        return self.current is not None
+
     def copy_all(self):
         vs = _VariableScopes(None, None)
         vs._suite = self._suite
@@ -446,14 +509,14 @@ class _VariableScopes:
         self._suite = self._test = self.current = None
 
     def start_test(self):
-        self._test = self.current = self._suite.copy()
+        self._test = self.current = self._suite.new_scope()
 
     def end_test(self):
         self.current = self._suite
 
     def start_uk(self):
         self._uk_handlers.append(self.current)
-        self.current = self.current.copy()
+        self.current = self.current.new_scope()
 
     def end_uk(self):
         self.current = self._uk_handlers.pop()
@@ -0,0 +1,405 @@
+#  Copyright 2008-2013 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Executing tests in parallel in multiple processes.
+
+The executed suite is split into units that are run in separate worker
+processes. Each worker re-builds the suite from the original data sources
+using the original options, selects its own unit, and writes results into
+its own output XML file. These outputs are merged into one result in the
+order of the units, and progress is reported to the console when all the
+earlier units have been reported. Console output is thus the same as when
+tests are run serially, it just comes in bigger chunks.
+
+Child suites of the top level suite are run as separate units by default.
+Suites matching ``--splittests`` are split further so that each of their
+tests and child suites is run as a separate unit. Tests of other split
+suites are run together as one unit. Setups and teardowns of the parent
+suites are run by every unit.
+"""
+
+from __future__ import with_statement
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from robot.conf import RobotSettings
+from robot.errors import DataError
+from robot.model import SuiteNamePatterns
+from robot.output import LOGGER
+from robot.result import ExecutionResult
+from robot.utils import Application, get_error_message
+
+from .builder import TestSuiteBuilder
+
+
+#: Used as a test index in units that run all tests of a suite but not
+#: its child suites.
+OWN_TESTS = 'tests'
+
+class ParallelRunner(object):
+    """Runs a suite in multiple processes.
+
+    :param settings: :class:`~robot.conf.settings.RobotSettings` object.
+    :param datasources: Data sources the suite was built from.
+    :param options: Options the settings were created from. Workers use
+        them to build and configure the suite again.
+    """
+    _poll_interval = 0.1
+    _parent_only_options = ('stdout', 'stderr', 'xunitfile', 'processes',
+                            'splittests', 'parseprocesses', 'timestampoutputs',
+                            'profile')
+
+    def __init__(self, settings, datasources, options):
+        self._settings = settings
+        self._datasources = datasources
+        self._options = options
+        self._result = None
+        self._started_suites = []
+        self._seen_errors = set()
+        self._pending_errors = []
+
+    def run(self, suite):
+        """Configures, splits and runs the given suite.
+
+        The suite must not have been configured earlier. Returns the merged
+        :class:`~robot.result.executionresult.Result` object.
+        """
+        config, randomize = suite_config(self._settings)
+        suite.configure(**config)
+        units = UnitSplitter(self._settings['SplitTests']).split(suite,
+                                                                 *randomize)
+        directory = self._create_unit_directory()
+        LOGGER.register_logger(self)
+        try:
+            self._run_units(self._write_spec(directory, units), directory,
+                            len(units))
+        finally:
+            LOGGER.unregister_logger(self)
+            if not self._settings.output:
+                shutil.rmtree(directory, ignore_errors=True)
+        return self._finish()
+
+    def _create_unit_directory(self):
+        output = self._settings.output
+        if not output:
+            return tempfile.mkdtemp(prefix='robot-processes-')
+        directory = os.path.splitext(output)[0] + '-processes'
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        return directory
+
+    def _write_spec(self, directory, units):
+        options = dict((name, value) for name, value in self._options.items()
+                       if name not in self._parent_only_options)
+        spec = {'datasources': self._datasources, 'options': options,
+                'pythonpath': sys.path, 'units': units,
+                'directory': directory}
+        path = os.path.join(directory, 'units.pickle')
+        with open(path, 'wb') as specfile:
+            pickle.dump(spec, specfile, pickle.HIGHEST_PROTOCOL)
+        return path
+
+    def _run_units(self, spec, directory, count):
+        waiting = range(count)
+        running = {}
+        finished = {}
+        reported = 0
+        try:
+            while reported < count:
+                while waiting and len(running) < self._settings.processes:
+                    index = waiting.pop(0)
+                    running[index] = self._start_worker(spec, directory, index)
+                for index in self._get_finished(running):
+                    process, console = running.pop(index)
+                    console.close()
+                    finished[index] = process.returncode
+                while reported in finished:
+                    self._report_unit(directory, reported,
+                                      finished.pop(reported))
+                    reported += 1
+                time.sleep(self._poll_interval)
+        finally:
+            for process, console in running.values():
+                self._stop_worker(process, console)
+
+    def _start_worker(self, spec, directory, index):
+        robot_parent = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__))))
+        code = ('import sys; sys.path.insert(0, %r); '
+                'from robot.running.parallel import run_unit; '
+                'sys.exit(run_unit(sys.argv[1], int(sys.argv[2])))'
+                % robot_parent)
+        console = open(_unit_path(directory, index, '.txt'), 'w')
+        process = subprocess.Popen([sys.executable, '-c', code, spec,
+                                    str(index)], env=self._get_env(directory,
+                                                                   index),
+                                   stdout=console, stderr=subprocess.STDOUT)
+        return process, console
+
+    def _get_env(self, directory, index):
+        env = os.environ.copy()
+        if env.get('ROBOT_SYSLOG_FILE', 'NONE').upper() != 'NONE':
+            env['ROBOT_SYSLOG_FILE'] = _unit_path(directory, index,
+                                                  '-syslog.txt')
+        return env
+
+    def _get_finished(self, running):
+        return [index for index in sorted(running)
+                if running[index][0].poll() is not None]
+
+    def _stop_worker(self, process, console):
+        try:
+            if process.poll() is None and hasattr(process, 'terminate'):
+                process.terminate()
+                process.wait()
+        finally:
+            console.close()
+
+    def _report_unit(self, directory, index, returncode):
+        # Return codes up to 250 are numbers of failed tests. Bigger ones
+        # mean errors and negative ones that the process was killed.
+        if not 0 <= returncode <= 250:
+            self._unit_failed(directory, index, 'Worker process exited with '
+                              'status %d.' % returncode)
+        try:
+            result = ExecutionResult(_unit_path(directory, index, '.xml'))
+        except DataError:
+            self._unit_failed(directory, index, get_error_message())
+            return
+        errors = self._get_new_errors(result.errors)
+        self._pending_errors = errors[:]
+        if not self._result:
+            result.errors.messages = errors
+            self._result = result
+            self._merge(result.suite, result.suite)
+        else:
+            self._result.errors.messages.extend(errors)
+            self._merge(result.suite, self._result.suite)
+        self._report_pending_errors()
+
+    def _unit_failed(self, directory, index, error):
+        console = _unit_path(directory, index, '.txt')
+        LOGGER.error("Executing unit %d failed: %s See '%s' for details."
+                     % (index + 1, error, console))
+
+    def _get_new_errors(self, errors):
+        # Errors occurring when workers parse test data are reported by all
+        # of them and also by this process.
+        return [msg for msg in errors
+                if (msg.message, msg.level) not in self._seen_errors]
+
+    def _report_pending_errors(self):
+        for msg in self._pending_errors:
+            LOGGER.message(msg)
+        self._pending_errors = []
+
+    def message(self, msg):
+        self._seen_errors.add((msg.message, msg.level))
+
+    def _merge(self, source, target):
+        self._start_suite(target)
+        tests = list(source.tests)
+        if source is not target:
+            self._merge_suite_attributes(source, target)
+            target.tests.extend(tests)
+        for test in tests:
+            LOGGER.start_test(test)
+            LOGGER.end_test(test)
+        for suite in list(source.suites):
+            self._merge(suite, self._get_merge_target(suite, source, target))
+
+    def _merge_suite_attributes(self, source, target):
+        target.starttime = min(target.starttime, source.starttime)
+        target.endtime = max(target.endtime, source.endtime)
+        if not target.message:
+            target.message = source.message
+
+    def _get_merge_target(self, suite, source, target):
+        if source is target:
+            return suite
+        if target.suites:
+            last = target.suites[-1]
+            if last.name == suite.name and last.source == suite.source:
+                return last
+        target.suites.append(suite)
+        return suite
+
+    def _start_suite(self, suite):
+        if any(started is suite for started in self._started_suites):
+            return
+        while (self._started_suites and
+               not self._is_parent(self._started_suites[-1], suite)):
+            LOGGER.end_suite(self._started_suites.pop())
+        LOGGER.start_suite(suite)
+        self._started_suites.append(suite)
+        # Errors are reported after the first started suite like in serial
+        # execution where they typically occur when suites are initialized.
+        self._report_pending_errors()
+
+    def _is_parent(self, parent, suite):
+        while suite.parent:
+            if suite.parent is parent:
+                return True
+            suite = suite.parent
+        return False
+
+    def _finish(self):
+        while self._started_suites:
+            LOGGER.end_suite(self._started_suites.pop())
+        if not self._result:
+            raise DataError('Executing tests in parallel failed.')
+        result = self._result
+        result.suite.set_criticality(self._settings.critical_tags,
+                                     self._settings.non_critical_tags)
+        result.configure(status_rc=self._settings.status_rc,
+                         stat_config=self._settings.statistics_config)
+        if self._settings.output:
+            result.save(self._settings.output, self._settings.output_index)
+            LOGGER.output_file('Output', self._settings.output)
+        return result
+
+
+class UnitSplitter(object):
+    """Splits a suite into units that can be run in separate processes.
+
+    Suites are split into their child suites and, if they match the given
+    ``split_tests`` patterns, also into their tests. The top level suite
+    and suites containing matching suites are always split into their child
+    suites.
+
+    Units are ``(suite_path, test_index)`` tuples where ``suite_path``
+    contains indices of child suites starting from the top level suite and
+    ``test_index`` is the index of the test in the selected suite, ``None``
+    if the whole suite is run, or :data:`OWN_TESTS` if all tests of a suite
+    that is split into its child suites are run. Indices refer to the order
+    before randomization, but units are returned in the randomized order.
+    """
+
+    def __init__(self, split_tests=None):
+        self._split_tests = SuiteNamePatterns(split_tests)
+        self._paths = {}
+
+    def split(self, suite, randomize_suites=False, randomize_tests=False):
+        self._record_paths(suite)
+        suite.randomize(randomize_suites, randomize_tests)
+        return list(self._split(suite, top=True))
+
+    def _record_paths(self, suite, path=()):
+        self._paths[id(suite)] = (path, None)
+        for index, test in enumerate(suite.tests):
+            self._paths[id(test)] = (path, index)
+        for index, child in enumerate(suite.suites):
+            self._record_paths(child, path + (index,))
+
+    def _split(self, suite, top=False):
+        split_tests = self._split_tests.match(suite.name, suite.longname)
+        if not (split_tests or self._contains_split_suites(suite) or
+                top and suite.suites):
+            yield self._paths[id(suite)]
+            return
+        if split_tests:
+            for test in suite.tests:
+                yield self._paths[id(test)]
+        elif suite.tests:
+            yield self._paths[id(suite)][0], OWN_TESTS
+        for child in suite.suites:
+            for unit in self._split(child):
+                yield unit
+
+    def _contains_split_suites(self, suite):
+        return any(self._split_tests.match(child.name, child.longname) or
+                   self._contains_split_suites(child)
+                   for child in suite.suites)
+
+
+def suite_config(settings):
+    """Returns suite configuration and randomization options separately.
+
+    Randomization must be applied separately to be able to identify units
+    based on the original order of suites and tests.
+    """
+    config = settings.suite_config
+    randomize = (config.pop('randomize_suites'),
+                 config.pop('randomize_tests'))
+    return config, randomize
+
+
+def select_unit(suite, suite_path, test_index=None):
+    """Removes everything but the specified unit from the given suite.
+
+    Returns the suite where the unit is. Parent suites are preserved so
+    that their setups and teardowns are run also with the unit.
+    """
+    for index in suite_path:
+        child = suite.suites[index]
+        suite.suites = [child]
+        suite.tests = []
+        suite = child
+    if test_index == OWN_TESTS:
+        suite.suites = []
+    elif test_index is not None:
+        suite.tests = [suite.tests[test_index]]
+        suite.suites = []
+    return suite
+
+
+def run_unit(spec, index):
+    """Entry point for worker processes. Returns the return code."""
+    with open(spec, 'rb') as specfile:
+        spec = pickle.load(specfile)
+    sys.path = spec['pythonpath']
+    runner = _UnitRunner(spec['directory'], index, *spec['units'][index])
+    return runner.execute(*spec['datasources'], **spec['options'])
+
+
+class _UnitRunner(Application):
+
+    def __init__(self, directory, index, suite_path, test_index):
+        Application.__init__(self, 'Robot Framework', logger=LOGGER)
+        self._directory = directory
+        self._index = index
+        self._suite_path = suite_path
+        self._test_index = test_index
+
+    def main(self, datasources, **options):
+        settings = RobotSettings(options, **self._get_unit_options(options))
+        LOGGER.register_console_logger(width=settings['MonitorWidth'],
+                                       colors='OFF', markers='OFF')
+        suite = TestSuiteBuilder(settings['SuiteNames'],
+                                 settings['WarnOnSkipped'],
+                                 settings['RunEmptySuite']).build(*datasources)
+        config, randomize = suite_config(settings)
+        suite.configure(**config)
+        unit = select_unit(suite, self._suite_path, self._test_index)
+        unit.randomize(*randomize)
+        return suite.run(settings).return_code
+
+    def _get_unit_options(self, options):
+        path = lambda ext: _unit_path(self._directory, self._index, ext)
+        debugfile = path('-debug.txt') if 'debugfile' in options else 'NONE'
+        return {'output': path('.xml'), 'log': 'NONE', 'report': 'NONE',
+                'xunit': 'NONE', 'debugfile': debugfile}
+
+
+def _unit_path(directory, index, suffix):
+    return os.path.join(directory, 'unit-%d%s' % (index + 1, suffix))
@@ -0,0 +1,235 @@
+#  Copyright 2008-2013 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Profiling keywords executed during test execution.
+
+Profiling is enabled with the ``--profile`` option. A textual report is
+written to the given path and the same data in CSV format to a file with
+the same name but with ``.csv`` extension.
+"""
+
+from __future__ import with_statement
+
+import csv
+import os
+import time
+from contextlib import contextmanager
+
+from robot.output import LOGGER
+from robot.variables.variables import Variables
+
+from .keywords import Keyword
+from .namespace import Namespace
+
+
+@contextmanager
+def profiling(path):
+    """Profiles keywords executed in this context and writes results to path.
+
+    Nothing is done if `path` is not given.
+    """
+    if not path:
+        yield
+        return
+    profiler = Profiler()
+    try:
+        with profiler.enabled():
+            yield
+    finally:
+        profiler.write(path)
+
+
+class ProfileStats(object):
+    """Call count and times of a keyword or a library.
+
+    Times are in seconds. ``total`` contains also time spent in called
+    keywords, but recursive calls are counted only once. ``own`` does not
+    contain time spent in called keywords, in finding keywords (``lookup``),
+    or in replacing variables (``variables``).
+    """
+    __slots__ = ['name', 'calls', 'total', 'own', 'lookup', 'variables']
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.total = 0.0
+        self.own = 0.0
+        self.lookup = 0.0
+        self.variables = 0.0
+
+
+class Profiler(object):
+    """Collects call counts and times of executed keywords.
+
+    While :meth:`enabled`, running keywords, finding keywords and replacing
+    variables are timed by wrapping the related methods. Results are
+    collected into :attr:`keywords` and :attr:`libraries` dictionaries that
+    map long names of keywords and names of libraries, respectively, to
+    :class:`ProfileStats` objects. User keywords created in test case files
+    do not belong to any library.
+    """
+    timer = staticmethod(time.time)
+
+    def __init__(self):
+        self.keywords = {}
+        self.libraries = {}
+        self.elapsed = 0.0
+        self._frames = []
+        self._active = {}
+        self._timing = False
+
+    @contextmanager
+    def enabled(self):
+        wrapped = [(Keyword, 'run', self._run_keyword),
+                   (Namespace, 'get_handler', self._get_handler)]
+        wrapped.extend((Variables, name, self._replace_variables)
+                       for name in ('replace_list', 'replace_scalar',
+                                    'replace_string'))
+        originals = [(cls, name, cls.__dict__[name])
+                     for cls, name, wrapper in wrapped]
+        for cls, name, wrapper in wrapped:
+            setattr(cls, name, self._wrap(wrapper, cls.__dict__[name]))
+        start = self.timer()
+        try:
+            yield self
+        finally:
+            self.elapsed += self.timer() - start
+            for cls, name, original in originals:
+                setattr(cls, name, original)
+
+    def _wrap(self, wrapper, method):
+        def wrapped(*args, **kwargs):
+            return wrapper(method, *args, **kwargs)
+        return wrapped
+
+    def _run_keyword(self, run, kw, context):
+        frame = _Frame()
+        self._frames.append(frame)
+        start = self.timer()
+        try:
+            return run(kw, context)
+        finally:
+            elapsed = self.timer() - start
+            self._frames.pop()
+            if self._frames:
+                self._frames[-1].children += elapsed
+            self._record(kw, frame, elapsed)
+
+    def _get_handler(self, get_handler, namespace, name):
+        handler = self._time(get_handler, 'lookup', namespace, name)
+        if self._frames and not self._frames[-1].names:
+            frame = self._frames[-1]
+            frame.names = (handler.longname,
+                           getattr(handler, 'libname', None))
+            for name in frame.names:
+                if name is not None:
+                    self._active[name] = self._active.get(name, 0) + 1
+        return handler
+
+    def _replace_variables(self, replace, *args, **kwargs):
+        return self._time(replace, 'variables', *args, **kwargs)
+
+    def _time(self, method, attr, *args, **kwargs):
+        # Only the outermost timed call is taken into account to avoid
+        # counting the same time twice, e.g. with nested variables.
+        if self._timing or not self._frames:
+            return method(*args, **kwargs)
+        frame = self._frames[-1]
+        self._timing = True
+        start = self.timer()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            setattr(frame, attr, getattr(frame, attr) + self.timer() - start)
+            self._timing = False
+
+    def _record(self, kw, frame, elapsed):
+        own = elapsed - frame.children - frame.lookup - frame.variables
+        name, library = frame.names or (kw.name, None)
+        for stats, name in [(self.keywords, name), (self.libraries, library)]:
+            if name is None:
+                continue
+            if name not in stats:
+                stats[name] = ProfileStats(name)
+            item = stats[name]
+            item.calls += 1
+            item.own += own
+            item.lookup += frame.lookup
+            item.variables += frame.variables
+            if not self._is_still_active(name, frame):
+                item.total += elapsed
+
+    def _is_still_active(self, name, frame):
+        # Time of recursive calls is included in the outermost call.
+        if not frame.names:
+            return False
+        self._active[name] -= 1
+        return self._active[name] > 0
+
+    def write(self, path):
+        """Writes a report to `path` and CSV data next to it."""
+        base, ext = os.path.splitext(path)
+        csv_path = base + '.csv'
+        if path == csv_path:
+            path = base + '.txt'
+        try:
+            self._write_report(path)
+            self._write_csv(csv_path)
+        except EnvironmentError, err:
+            LOGGER.error("Writing profile '%s' failed: %s"
+                         % (err.filename, err.strerror))
+        else:
+            LOGGER.output_file('Profile', path)
+
+    def _write_report(self, path):
+        with open(path, 'w') as report:
+            report.write('Total time: %.3f s\n' % self.elapsed)
+            for title, stats in [('Keywords', self.keywords),
+                                 ('Libraries', self.libraries)]:
+                report.write('\n%s by own time:\n\n' % title)
+                report.write('%8s %11s %11s %11s %11s  %s\n'
+                             % ('Calls', 'Total', 'Own', 'Lookup',
+                                'Variables', 'Name'))
+                for item in self._sort(stats):
+                    line = '%8d %11.3f %11.3f %11.3f %11.3f  %s\n' \
+                        % (item.calls, item.total, item.own, item.lookup,
+                           item.variables, item.name)
+                    report.write(line.encode('UTF-8'))
+
+    def _sort(self, stats):
+        return sorted(stats.values(), key=lambda item: -item.own)
+
+    def _write_csv(self, path):
+        with open(path, 'wb') as output:
+            writer = csv.writer(output)
+            writer.writerow(['TYPE', 'NAME', 'CALLS', 'TOTAL', 'OWN',
+                             'LOOKUP', 'VARIABLES'])
+            for type, stats in [('Keyword', self.keywords),
+                                ('Library', self.libraries)]:
+                for item in self._sort(stats):
+                    writer.writerow([type, item.name.encode('UTF-8'),
+                                     item.calls] +
+                                    ['%.6f' % value for value in
+                                     (item.total, item.own, item.lookup,
+                                      item.variables)])
+
+
+class _Frame(object):
+    __slots__ = ['names', 'children', 'lookup', 'variables']
+
+    def __init__(self):
+        self.names = None
+        self.children = 0.0
+        self.lookup = 0.0
+        self.variables = 0.0
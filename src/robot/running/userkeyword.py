@@ -49,6 +49,8 @@ class UserLibrary(BaseLibrary):
                 error = "Keyword '%s' defined multiple times." % handler.name
                 handler = UserErrorHandler(handler.name, error)
             self.handlers[handler.name] = handler
+        self._embedded_arg_matcher \
+                = EmbeddedArgsMatcher(self.embedded_arg_handlers)
 
     def _create_handler(self, kw):
         try:
@@ -67,14 +69,7 @@ class UserLibrary(BaseLibrary):
     def has_handler(self, name):
         if BaseLibrary.has_handler(self, name):
             return True
-        for template in self.embedded_arg_handlers:
-            try:
-                EmbeddedArgs(name, template)
-            except TypeError:
-                pass
-            else:
-                return True
-        return False
+        return bool(self._embedded_arg_matcher.match(name))
 
     def get_handler(self, name):
         try:
@@ -88,13 +83,8 @@ class UserLibrary(BaseLibrary):
             self._raise_multiple_matching_keywords_found(name, found)
 
     def _get_embedded_arg_handlers(self, name):
-        found = []
-        for template in self.embedded_arg_handlers:
-            try:
-                found.append(EmbeddedArgs(name, template))
-            except TypeError:
-                pass
-        return found
+        return [EmbeddedArgs(name, template)
+                for template in self._embedded_arg_matcher.match(name)]
 
     def _raise_multiple_matching_keywords_found(self, name, found):
         names = utils.seq2str([f.orig_name for f in found])
@@ -111,7 +101,8 @@ class UserKeywordHandler(object):
 
     def __init__(self, keyword, libname):
         self.name = keyword.name
-        self.keywords = Keywords(keyword.steps)
+        self._steps = keyword.steps
+        self._keywords = None
         self.return_value = tuple(keyword.return_)
         self.teardown = keyword.teardown
         self.libname = libname
@@ -120,6 +111,13 @@ class UserKeywordHandler(object):
                                                            tuple(keyword.args))
         self._timeout = keyword.timeout
 
+    @property
+    def keywords(self):
+        # Keyword bodies are created only when they are needed the first time.
+        if self._keywords is None:
+            self._keywords = Keywords(self._steps)
+        return self._keywords
+
     @property
     def longname(self):
         return '%s.%s' % (self.libname, self.name) if self.libname else self.name
@@ -261,7 +259,7 @@ class EmbeddedArgsTemplate(UserKeywordHandler):
     def __init__(self, keyword, libname):
         if keyword.args:
             raise TypeError('Cannot have normal arguments')
-        self.embedded_args, self.name_regexp \
+        self.embedded_args, self.name_regexp, self.name_pattern \
                 = self._read_embedded_args_and_regexp(keyword.name)
         if not self.embedded_args:
             raise TypeError('Must have embedded arguments')
@@ -270,17 +268,20 @@ class EmbeddedArgsTemplate(UserKeywordHandler):
 
     def _read_embedded_args_and_regexp(self, string):
         args = []
-        full_pattern = ['^']
+        parts = []
         while True:
             before, variable, rest = self._split_from_variable(string)
             if before is None:
                 break
             variable, pattern = self._get_regexp_pattern(variable)
             args.append('${%s}' % variable)
-            full_pattern.extend([re.escape(before), '(%s)' % pattern])
+            parts.append((re.escape(before), pattern))
             string = rest
-        full_pattern.extend([re.escape(rest), '$'])
-        return args, self._compile_regexp(full_pattern)
+        rest = re.escape(rest)
+        full_pattern = ''.join('%s(%s)' % part for part in parts) + rest
+        name_pattern = ''.join('%s(?:%s)' % part for part in parts) + rest
+        return (args, self._compile_regexp('^%s$' % full_pattern),
+                name_pattern)
 
     def _split_from_variable(self, string):
         var = VariableSplitter(string, identifiers=['$'])
@@ -319,12 +320,79 @@ class EmbeddedArgsTemplate(UserKeywordHandler):
 
     def _compile_regexp(self, pattern):
         try:
-            return re.compile(''.join(pattern), re.IGNORECASE)
+            return re.compile(pattern, re.IGNORECASE)
         except:
             raise DataError("Compiling embedded arguments regexp failed: %s"
                             % utils.get_error_message())
 
 
+class EmbeddedArgsMatcher(object):
+    """Finds embedded argument templates matching a name.
+
+    Templates are combined into alternation regexps where each alternative
+    is a named group. A match tells the first matching template, and
+    searching continues with a regexp combining only the templates after
+    it. Names matching no template are thus rejected with one regexp match
+    instead of trying every template separately. Regexps are created
+    lazily and cached based on the index of their first template.
+    """
+    # Python 2 regexps can have at most 100 groups.
+    _max_templates = 99
+    _backreference = re.compile(r'\\\d')
+
+    def __init__(self, templates):
+        self._templates = templates
+        self._matchers = {}
+        self._latest = (None, [])
+
+    def match(self, name):
+        """Returns templates matching `name` in their definition order.
+
+        The latest result is cached because `UserLibrary.has_handler` and
+        `UserLibrary.get_handler` are typically called with the same name.
+        """
+        if name != self._latest[0]:
+            self._latest = (name, self._match(name))
+        return self._latest[1]
+
+    def _match(self, name):
+        found = []
+        start = 0
+        while start < len(self._templates):
+            matcher, end = self._get_matcher(start)
+            match = matcher.match(name)
+            if not match:
+                start = end
+            elif match.lastgroup:
+                index = int(match.lastgroup[1:])
+                found.append(self._templates[index])
+                start = index + 1
+            else:
+                found.append(self._templates[start])
+                start += 1
+        return found
+
+    def _get_matcher(self, start):
+        if start not in self._matchers:
+            self._matchers[start] = self._create_matcher(start)
+        return self._matchers[start]
+
+    def _create_matcher(self, start):
+        template = self._templates[start]
+        if self._backreference.search(template.name_pattern):
+            # Backreferences would point to wrong groups in a combined regexp.
+            return template.name_regexp, start + 1
+        alternatives = []
+        for index in range(start, len(self._templates)):
+            pattern = self._templates[index].name_pattern
+            if (len(alternatives) == self._max_templates or
+                    self._backreference.search(pattern)):
+                break
+            alternatives.append('(?P<t%d>%s)' % (index, pattern))
+        regexp = '^(?:%s)$' % '|'.join(alternatives)
+        return re.compile(regexp, re.IGNORECASE), start + len(alternatives)
+
+
 class EmbeddedArgs(UserKeywordHandler):
 
     def __init__(self, name, template):
@@ -332,6 +400,7 @@ class EmbeddedArgs(UserKeywordHandler):
         if not match:
             raise TypeError('Does not match given name')
         UserKeywordHandler.__init__(self, template.keyword, template.libname)
+        self._keywords = template.keywords
         self.embedded_args = zip(template.embedded_args, match.groups())
         self.name = name
         self.orig_name = template.name
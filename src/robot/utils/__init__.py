@@ -34,6 +34,7 @@ or::
 
 from .argumentparser import ArgumentParser
 from .application import Application
+from .boundedcache import BoundedCache
 from .compress import compress_text
 from .connectioncache import ConnectionCache
 from .encoding import (decode_output, encode_output,
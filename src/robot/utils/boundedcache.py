@@ -0,0 +1,38 @@
+#  Copyright 2008-2013 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+class BoundedCache(dict):
+    """Dictionary for caching results that is emptied when it gets full.
+
+    Emptying the whole cache is cheaper than keeping track of which items
+    are used, and works well when the same items are needed over and over
+    again. Getting items is as fast as with normal dictionaries.
+    """
+    max_size = 10000
+
+    def __init__(self, max_size=None):
+        dict.__init__(self)
+        if max_size is not None:
+            self.max_size = max_size
+
+    def __setitem__(self, key, value):
+        if len(self) >= self.max_size:
+            self.clear()
+        dict.__setitem__(self, key, value)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
@@ -12,12 +12,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import time
+
 from .markuputils import html_escape, xml_escape, attribute_escape
 
 
 class _MarkupWriter(object):
 
-    def __init__(self, output, line_separator='\n', encoding='UTF-8'):
+    def __init__(self, output, line_separator='\n', encoding='UTF-8',
+                 buffer_size=0, flush_interval=None):
         """
         :param output: Either an opened, file like object, or a path to the
             desired output file. In the latter case, the file is created
@@ -25,12 +28,24 @@ class _MarkupWriter(object):
         :param line_separator: Defines the used line separator.
         :param encoding: Encoding to be used to encode all text written to the
             output file. If `None`, text will not be encoded.
+        :param buffer_size: If positive, written text is collected into
+            a buffer that is encoded and written to the output when it
+            contains at least this many characters, or when :py:meth:`flush`
+            or :py:meth:`close` is called. By default text is written
+            immediately.
+        :param flush_interval: When using a buffer, write it also when this
+            many seconds have passed since it was last written.
         """
         if isinstance(output, basestring):
             output = open(output, 'w')
         self.output = output
         self._line_separator = line_separator
         self._encoding = encoding
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._buffer = []
+        self._buffered = 0
+        self._written = time.time()
         self._preamble()
 
     def _preamble(self):
@@ -66,14 +81,39 @@ class _MarkupWriter(object):
         self.content(content, escape, replace_newlines)
         self.end(name, newline)
 
+    def flush(self):
+        """Writes possibly buffered text and flushes the underlying output."""
+        self._write_buffer()
+        if hasattr(self.output, 'flush'):
+            self.output.flush()
+
     def close(self):
         """Closes the underlying output file."""
+        self._write_buffer()
         self.output.close()
 
     def _write(self, text, newline=False):
-        self.output.write(self._encode(text))
+        if not self._buffer_size:
+            self.output.write(self._encode(text))
+            if newline:
+                self.output.write(self._line_separator)
+            return
+        self._buffer.append(text)
+        self._buffered += len(text)
         if newline:
-            self.output.write(self._line_separator)
+            self._buffer.append(self._line_separator)
+            self._buffered += 1
+        if self._buffered >= self._buffer_size or \
+                (self._flush_interval is not None and
+                 time.time() - self._written >= self._flush_interval):
+            self._write_buffer()
+
+    def _write_buffer(self):
+        if self._buffer:
+            self.output.write(self._encode(''.join(self._buffer)))
+            self._buffer = []
+            self._buffered = 0
+        self._written = time.time()
 
     def _encode(self, text):
         return text.encode(self._encoding) if self._encoding else text
@@ -99,4 +139,5 @@ class XmlWriter(_MarkupWriter):
 
 class NullMarkupWriter(object):
     """Null implementation of _MarkupWriter interface"""
-    __init__ = start = content = element = end = close = lambda *args: None
+    __init__ = start = content = element = end = flush = close = \
+        lambda *args: None
@@ -22,6 +22,8 @@ except ImportError:  # Pre Python 2.6 support
 else:
     mappings = (Mapping, UserDict)
 
+from .boundedcache import BoundedCache
+
 
 _WHITESPACE_REGEXP = re.compile('\s+')
 
@@ -66,6 +68,56 @@ else:
         return False
 
 
+class Normalizer(object):
+    """Normalizes strings according to a fixed spec and caches the results.
+
+    Normalizers are got using :meth:`get` that returns the same instance
+    for the same spec. All :class:`NormalizedDict` instances normalizing
+    keys the same way thus share the cache. Normalized strings are cached
+    as well, when normalizing them again would not change them, so that
+    already normalized keys are also found from the cache. Cache keys
+    contain also the type of the string because equal byte and Unicode
+    strings would otherwise share entries. The cache is cleared when it
+    grows too big.
+    """
+    _normalizers = {}
+
+    @classmethod
+    def get(cls, ignore=(), caseless=True, spaceless=True):
+        spec = (tuple(ignore), caseless, spaceless)
+        try:
+            return cls._normalizers[spec]
+        except KeyError:
+            normalizer = cls._normalizers[spec] = cls(*spec)
+            return normalizer
+
+    def __init__(self, ignore=(), caseless=True, spaceless=True):
+        self._spec = (tuple(ignore), caseless, spaceless)
+        self._ignore = tuple(lower(i) if caseless else i for i in ignore)
+        self._caseless = caseless
+        self._spaceless = spaceless
+        # Removing multi-character strings may create new ones to remove.
+        self._idempotent = all(len(i) == 1 for i in self._ignore)
+        self._cache = BoundedCache()
+
+    def __call__(self, string):
+        key = (type(string), string)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        normalized = self._cache[key] \
+                = normalize(string, self._ignore, self._caseless,
+                            self._spaceless)
+        if self._idempotent:
+            self._cache[(type(normalized), normalized)] = normalized
+        return normalized
+
+    def __reduce__(self):
+        # Pickled normalizers do not contain the cache.
+        return Normalizer, self._spec
+
+
 class NormalizedDict(UserDict):
     """Custom dictionary implementation automatically normalizing keys."""
 
@@ -79,7 +131,7 @@ class NormalizedDict(UserDict):
         """
         UserDict.__init__(self)
         self._keys = {}
-        self._normalize = lambda s: normalize(s, ignore, caseless, spaceless)
+        self._normalize = Normalizer.get(ignore, caseless, spaceless)
         if initial:
             self._add_initial(initial)
 
@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 import re
+import copy
 import inspect
 from functools import partial
 from UserDict import UserDict
@@ -29,6 +30,7 @@ from robot.output import LOGGER
 
 from .isvar import is_var, is_scalar_var, is_list_var
 from .variablesplitter import VariableSplitter
+from .variabletemplate import VariableTemplate
 
 
 class Variables(utils.NormalizedDict):
@@ -65,6 +67,24 @@ class Variables(utils.NormalizedDict):
         if kwargs:
             self.update(kwargs)
 
+    def new_scope(self):
+        """Returns a new scope that falls back to these variables.
+
+        Unlike with :meth:`copy`, creating a scope does not copy variables.
+        The new scope stores only variables set or removed in it, and
+        variables not found from it are got from this object. Changes made
+        to this object are thus visible in the scope unless the scope has
+        its own value for the variable.
+        """
+        scope = copy.copy(self)
+        scope.data = ScopedDict(self.data)
+        scope._keys = ScopedDict(self._keys)
+        return scope
+
+    def __nonzero__(self):
+        # Length of scoped data is expensive to calculate.
+        return bool(self.data)
+
     def __getitem__(self, name):
         self._validate_var_name(name)
         try:
@@ -207,22 +227,17 @@ class Variables(utils.NormalizedDict):
     def _replace_list(self, items):
         results = []
         for item in items:
-            listvar = self._replace_variables_inside_possible_list_var(item)
-            if listvar:
-                results.extend(self[listvar])
+            if self._cannot_have_variables(item):
+                results.append(utils.unescape(item))
+                continue
+            template = VariableTemplate.get(item, self._identifiers)
+            var = template.list_variable
+            if var:
+                results.extend(self['@{%s}' % var.get_replaced_base(self)])
             else:
-                results.append(self.replace_scalar(item))
+                results.append(self._replace_template(template))
         return results
 
-    def _replace_variables_inside_possible_list_var(self, item):
-        if not (isinstance(item, basestring) and
-                item.startswith('@{') and item.endswith('}')):
-            return None
-        var = VariableSplitter(item, self._identifiers)
-        if var.start != 0 or var.end != len(item):
-            return None
-        return '@{%s}' % var.get_replaced_base(self)
-
     def replace_scalar(self, item):
         """Replaces variables from a scalar item.
 
@@ -232,39 +247,44 @@ class Variables(utils.NormalizedDict):
         """
         if self._cannot_have_variables(item):
             return utils.unescape(item)
-        var = VariableSplitter(item, self._identifiers)
-        if var.identifier and var.base and var.start == 0 and var.end == len(item):
-            return self._get_variable(var)
-        return self.replace_string(item, var)
+        return self._replace_template(VariableTemplate.get(item,
+                                                           self._identifiers))
+
+    def _replace_template(self, template):
+        if template.variable:
+            return self._get_variable(template.variable)
+        return self._replace_parts(template.parts)
 
     def _cannot_have_variables(self, item):
         return not (isinstance(item, basestring) and '{' in item)
 
     def replace_string(self, string, splitter=None, ignore_errors=False):
-        """Replaces variables from a string. Result is always a string."""
+        """Replaces variables from a string. Result is always a string.
+
+        `splitter` is accepted for backwards compatibility but ignored.
+        Strings are split using cached templates instead.
+        """
         if self._cannot_have_variables(string):
             return utils.unescape(string)
+        template = VariableTemplate.get(string, self._identifiers)
+        return self._replace_parts(template.parts, ignore_errors)
+
+    def _replace_parts(self, parts, ignore_errors=False):
         result = []
-        if splitter is None:
-            splitter = VariableSplitter(string, self._identifiers)
-        while True:
-            if splitter.identifier is None:
-                result.append(utils.unescape(string))
-                break
-            result.append(utils.unescape(string[:splitter.start]))
+        for part in parts:
+            if isinstance(part, basestring):
+                result.append(part)
+                continue
             try:
-                value = self._get_variable(splitter)
+                value = self._get_variable(part)
             except DataError:
                 if not ignore_errors:
                     raise
-                value = string[splitter.start:splitter.end]
+                value = VariableTemplate.variable_text(part)
             if not isinstance(value, unicode):
                 value = utils.unic(value)
             result.append(value)
-            string = string[splitter.end:]
-            splitter = VariableSplitter(string, self._identifiers)
-        result = ''.join(result)
-        return result
+        return ''.join(result)
 
     def _get_variable(self, var):
         """'var' is an instance of a VariableSplitter"""
@@ -438,3 +458,118 @@ class DelayedVariable(object):
         if is_list_var(name):
             return variables.replace_list(self._value)
         return variables.replace_scalar(self._value[0])
+
+
+class ScopedDict(object):
+    """Dictionary that falls back to a parent dictionary.
+
+    Items set to this dictionary are stored to it and items that are not
+    found are got from the parent. Removing items hides them also from
+    the parent without modifying it. Used by :meth:`Variables.new_scope`.
+    """
+    _removed = object()
+    _missing = object()
+
+    def __init__(self, parent):
+        self._data = {}
+        # Dictionaries to search in order. Nested scopes are flattened so
+        # that lookups do not need to go through parent objects.
+        if isinstance(parent, ScopedDict):
+            self._chain = [self._data] + parent._chain
+        else:
+            self._chain = [self._data, parent]
+
+    def __getitem__(self, key):
+        for data in self._chain:
+            value = data.get(key, self._missing)
+            if value is not self._missing:
+                if value is self._removed:
+                    break
+                return value
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            self[key] = default
+            return default
+
+    def has_key(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    __contains__ = has_key
+
+    def pop(self, key, *default):
+        try:
+            value = self[key]
+        except KeyError:
+            if default:
+                return default[0]
+            raise
+        self._data[key] = self._removed
+        return value
+
+    def update(self, other=None, **kwargs):
+        for items in other, kwargs:
+            if items:
+                for key in items:
+                    self[key] = items[key]
+
+    def clear(self):
+        for key in self.keys():
+            self._data[key] = self._removed
+
+    def __iter__(self):
+        seen = set()
+        for data in self._chain:
+            for key in data:
+                if key not in seen:
+                    seen.add(key)
+                    if data[key] is not self._removed:
+                        yield key
+
+    def keys(self):
+        return [key for key in self]
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def iteritems(self):
+        return ((key, self[key]) for key in self)
+
+    def copy(self):
+        return dict(self.iteritems())
+
+    def __len__(self):
+        return sum(1 for key in self)
+
+    def __nonzero__(self):
+        # Avoids going through all items like __len__ does.
+        for key in self:
+            return True
+        return False
+
+    def __cmp__(self, other):
+        if isinstance(other, ScopedDict):
+            other = other.copy()
+        return cmp(self.copy(), other)
+
+    def __repr__(self):
+        return repr(self.copy())
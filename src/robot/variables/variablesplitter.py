@@ -12,85 +12,78 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import re
+
+from robot.utils import BoundedCache
+
 
 class VariableSplitter:
+    # Splitting is performance optimized. Do not change without profiling!
+    # Results are cached because same strings, typically keyword arguments,
+    # are split over and over again. The cache is emptied when it gets full.
+    _cache = BoundedCache()
+    _scanners = {}
 
     def __init__(self, string, identifiers):
-        self.identifier = None
-        self.base = None
-        self.index = None
-        self.start = -1
-        self.end = -1
-        self._identifiers = identifiers
-        self._may_have_internal_variables = False
+        key = (string, tuple(identifiers))
         try:
-            self._split(string)
-        except ValueError:
-            pass
-        else:
-            self._finalize()
+            split = self._cache[key]
+        except KeyError:
+            split = self._cache[key] = self._split(string, identifiers)
+        (self.identifier, self.base, self.index, self.start, self.end,
+         self._may_have_internal_variables) = split
 
     def get_replaced_base(self, variables):
         if self._may_have_internal_variables:
             return variables.replace_string(self.base)
         return self.base
 
-    def _finalize(self):
-        self.identifier = self._variable_chars[0]
-        self.base = ''.join(self._variable_chars[2:-1])
-        self.end = self.start + len(self._variable_chars)
-        if self._has_list_variable_index():
-            self.index = ''.join(self._list_variable_index_chars[1:-1])
-            self.end += len(self._list_variable_index_chars)
-
-    def _has_list_variable_index(self):
-        return self._list_variable_index_chars \
-            and self._list_variable_index_chars[-1] == ']'
-
-    def _split(self, string):
-        start_index, max_index = self._find_variable(string)
-        self.start = start_index
-        self._open_curly = 1
-        self._state = self._variable_state
-        self._variable_chars = [string[start_index], '{']
-        self._list_variable_index_chars = []
-        self._string = string
-        start_index += 2
-        for index, char in enumerate(string[start_index:]):
-            index += start_index  # Giving start to enumerate only in Py 2.6+
-            try:
-                self._state(char, index)
-            except StopIteration:
-                return
-            if index  == max_index and not self._scanning_list_variable_index():
-                return
-
-    def _scanning_list_variable_index(self):
-        return self._state in [self._waiting_list_variable_index_state,
-                               self._list_variable_index_state]
-
-    def _find_variable(self, string):
+    def _split(self, string, identifiers):
+        try:
+            start, max_index = self._find_variable(string, identifiers)
+        except ValueError:
+            return None, None, None, -1, -1, False
+        scanner = self._get_scanner(identifiers)
+        end, closed, internal = self._find_variable_end(string, start + 2,
+                                                        max_index, scanner)
+        identifier = string[start]
+        base = string[start+2:end-1]
+        index = None
+        if closed and identifier == '@' and string[end:end+1] == '[':
+            index_end = string.find(']', end+1)
+            if index_end != -1:
+                index = string[end+1:index_end]
+                end = index_end + 1
+        return identifier, base, index, start, end, internal
+
+    def _get_scanner(self, identifiers):
+        key = tuple(identifiers)
+        if key not in self._scanners:
+            chars = ''.join(re.escape(i) for i in identifiers)
+            self._scanners[key] = re.compile('[}%s]' % chars).search
+        return self._scanners[key]
+
+    def _find_variable(self, string, identifiers):
         max_end_index = string.rfind('}')
         if max_end_index == -1:
             raise ValueError('No variable end found')
         if self._is_escaped(string, max_end_index):
-            return self._find_variable(string[:max_end_index])
-        start_index = self._find_start_index(string, 1, max_end_index)
+            return self._find_variable(string[:max_end_index], identifiers)
+        start_index = self._find_start_index(string, 1, max_end_index,
+                                             identifiers)
         if start_index == -1:
             raise ValueError('No variable start found')
         return start_index, max_end_index
 
-    def _find_start_index(self, string, start, end):
-        index = string.find('{', start, end) - 1
-        if index < 0:
-            return -1
-        if self._start_index_is_ok(string, index):
-            return index
-        return self._find_start_index(string, index+2, end)
-
-    def _start_index_is_ok(self, string, index):
-        return string[index] in self._identifiers \
-            and not self._is_escaped(string, index)
+    def _find_start_index(self, string, start, end, identifiers):
+        while True:
+            index = string.find('{', start, end) - 1
+            if index < 0:
+                return -1
+            if string[index] in identifiers \
+                    and not self._is_escaped(string, index):
+                return index
+            start = index + 2
 
     def _is_escaped(self, string, index):
         escaped = False
@@ -99,36 +92,23 @@ class VariableSplitter:
             escaped = not escaped
         return escaped
 
-    def _variable_state(self, char, index):
-        self._variable_chars.append(char)
-        if char == '}' and not self._is_escaped(self._string, index):
-            self._open_curly -= 1
-            if self._open_curly == 0:
-                if not self._is_list_variable():
-                    raise StopIteration
-                self._state = self._waiting_list_variable_index_state
-        elif char in self._identifiers:
-            self._state = self._internal_variable_start_state
-
-    def _is_list_variable(self):
-        return self._variable_chars[0] == '@'
-
-    def _internal_variable_start_state(self, char, index):
-        self._state = self._variable_state
-        if char == '{':
-            self._variable_chars.append(char)
-            self._open_curly += 1
-            self._may_have_internal_variables = True
-        else:
-            self._variable_state(char, index)
-
-    def _waiting_list_variable_index_state(self, char, index):
-        if char != '[':
-            raise StopIteration
-        self._list_variable_index_chars.append(char)
-        self._state = self._list_variable_index_state
-
-    def _list_variable_index_state(self, char, index):
-        self._list_variable_index_chars.append(char)
-        if char == ']':
-            raise StopIteration
+    def _find_variable_end(self, string, index, max_index, scanner):
+        # Jumps directly to the next closing curly or identifier. Because
+        # the character at `max_index` is always an unescaped closing curly,
+        # the scanner always finds something.
+        open_curly = 1
+        internal = False
+        while True:
+            index = scanner(string, index, max_index + 1).start()
+            if string[index] == '}':
+                if not self._is_escaped(string, index):
+                    open_curly -= 1
+                    if not open_curly:
+                        return index + 1, True, internal
+                if index == max_index:
+                    return index + 1, False, internal
+            elif string[index+1] == '{':
+                open_curly += 1
+                internal = True
+                index += 1
+            index += 1
@@ -0,0 +1,77 @@
+#  Copyright 2008-2013 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from robot.utils import BoundedCache, unescape
+
+from .variablesplitter import VariableSplitter
+
+
+class VariableTemplate(object):
+    """Pre-parsed string that contains, or may contain, variables.
+
+    Where variables are in a string does not depend on their values, so
+    a string is parsed only once and replacing variables later only needs
+    to resolve the variables themselves. Templates are got using
+    :meth:`get` that caches them similarly as
+    :class:`~.variablesplitter.VariableSplitter` caches its results.
+
+    A template is either a single scalar or list variable that can be
+    replaced with its value as is, or a list of parts that are unescaped
+    literal strings or variables. A string without variables is simply
+    a template with one literal part.
+    """
+    __slots__ = ['parts', 'variable', 'list_variable']
+    _cache = BoundedCache()
+
+    @classmethod
+    def get(cls, string, identifiers):
+        key = (string, tuple(identifiers))
+        try:
+            return cls._cache[key]
+        except KeyError:
+            template = cls._cache[key] = cls(string, identifiers)
+            return template
+
+    def __init__(self, string, identifiers):
+        splitter = VariableSplitter(string, identifiers)
+        whole = splitter.start == 0 and splitter.end == len(string)
+        #: :class:`~.variablesplitter.VariableSplitter` of the variable if
+        #: the whole string is a variable and the value can be used as is.
+        self.variable = splitter if whole and splitter.base else None
+        #: Splitter of the variable if the whole string is a list variable
+        #: like ``@{list}`` that can be expanded to multiple items.
+        self.list_variable = splitter if whole and string[0] == '@' \
+                                         and string[-1] == '}' else None
+        #: Unescaped literal strings and splitters of variables.
+        self.parts = self._split_to_parts(string, splitter, identifiers)
+
+    @staticmethod
+    def variable_text(splitter):
+        """Returns the original text of a variable in :attr:`parts`."""
+        text = '%s{%s}' % (splitter.identifier, splitter.base)
+        if splitter.index is not None:
+            text += '[%s]' % splitter.index
+        return text
+
+    def _split_to_parts(self, string, splitter, identifiers):
+        parts = []
+        while splitter.identifier is not None:
+            if splitter.start:
+                parts.append(unescape(string[:splitter.start]))
+            parts.append(splitter)
+            string = string[splitter.end:]
+            splitter = VariableSplitter(string, identifiers)
+        if string or not parts:
+            parts.append(unescape(string))
+        return parts
@@ -137,6 +137,14 @@ class TestRobotAndRebotSettings(unittest.TestCase):
     def _verify_invalid_log_level(self, input):
         self.assertRaises(DataError, RobotSettings, {'loglevel': input})
 
+    def test_binary_output_with_output_index_or_background_output(self):
+        for options in [{'outputindex': True}, {'backgroundoutput': True}]:
+            self.assertRaises(DataError, RobotSettings, options,
+                              output='out.rbin')
+            RobotSettings(options, output='out.xml')
+        self.assertRaises(DataError, RebotSettings, outputindex=True,
+                          output='out.RBIN')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -65,6 +65,19 @@ class TestItemLists(unittest.TestCase):
         items = ItemList(str, items=('first', 'second'))
         assert_equal(items.index('first'), 0)
         assert_equal(items.index('second'), 1)
+        assert_raises(ValueError, items.index, 'third')
+
+    def test_index_after_modifications(self):
+        items = ItemList(str, items=('first', 'second', 'first'))
+        assert_equal(items.index('first'), 0)
+        items.append('third')
+        items.extend(('second', 'fourth'))
+        assert_equal([items.index(i) for i in 'first second third fourth'.split()],
+                     [0, 1, 3, 5])
+        items.clear()
+        assert_raises(ValueError, items.index, 'first')
+        items.append('fourth')
+        assert_equal(items.index('fourth'), 0)
 
     def test_len(self):
         items = ItemList(object)
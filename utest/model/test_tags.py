@@ -59,6 +59,16 @@ class TestTags(unittest.TestCase):
         tags.remove('*1*')
         assert_equal(list(tags), [])
 
+    def test_remove_matches_tags_one_by_one(self):
+        for pattern, expected in [('aNOTb', ['ab', 'b']),
+                                  ('bNOTa', ['a', 'ab']),
+                                  ('*NOTb', ['b']),
+                                  ('aANDb', ['a', 'ab', 'b']),
+                                  ('aAND*', ['ab', 'b'])]:
+            tags = Tags(['a', 'ab', 'b'])
+            tags.remove(pattern)
+            assert_equal(list(tags), expected)
+
     def test_add_and_remove_none(self):
         tags = Tags(['t'])
         tags.add(None)
@@ -172,6 +182,38 @@ class TestNormalizing(unittest.TestCase):
         assert_equal(list(Tags(tags)), expected)
 
 
+class TestSharing(unittest.TestCase):
+
+    def test_same_tags_are_shared(self):
+        tags = Tags(['a', 'B'])
+        assert_true(Tags(['a', 'B'])._set is tags._set)
+        assert_true(Tags(['B', 'a', 'A_'])._set is tags._set)
+        assert_true(Tags(tags)._set is tags._set)
+        assert_true(Tags(['a'])._set is not tags._set)
+
+    def test_modifying_does_not_affect_other_tags(self):
+        tags1 = Tags(['a', 'b'])
+        tags2 = Tags(['a', 'b'])
+        tags1.add('c')
+        tags2.remove('a')
+        assert_equal(list(tags1), ['a', 'b', 'c'])
+        assert_equal(list(tags2), ['b'])
+        assert_equal(list(Tags(['a', 'b'])), ['a', 'b'])
+        tags2.add('a')
+        assert_true(tags2._set is Tags(['a', 'b'])._set)
+
+    def test_byte_and_unicode_tags_are_not_shared(self):
+        tags = Tags(['a', 'b'])
+        unicode_tags = Tags([u'a', u'b'])
+        assert_true(unicode_tags._set is not tags._set)
+        assert_equal([type(t) for t in unicode_tags], [unicode, unicode])
+        assert_equal([type(t) for t in Tags(['b', 'a'])], [str, str])
+
+    def test_normalized(self):
+        assert_equal(Tags(['A', 'b B', 'c_', 'NONE', ''])._set.normalized,
+                     frozenset(['a', 'bb', 'c']))
+
+
 class TestTagPatterns(unittest.TestCase):
 
     def test_match(self):
@@ -235,6 +277,40 @@ class TestTagPatterns(unittest.TestCase):
         assert_false(patterns.match(['a', 'b', 'c', 'd', 'e', 'f']))
         assert_false(patterns.match(['a', 'b', 'c', 'd', 'e']))
 
+    def test_match_with_many_exact_and_wildcard_patterns(self):
+        patterns = TagPatterns(['t%d' % i for i in range(100)] +
+                               ['w%d*' % i for i in range(100)] +
+                               ['x?y', 'a.b', 'c+', 'xANDy'])
+        assert_true(patterns.match(['T 42']))
+        assert_true(patterns.match(['t_99']))
+        assert_false(patterns.match(['t100']))
+        assert_true(patterns.match(['w99 and more']))
+        assert_true(patterns.match(['X-Y']))
+        assert_false(patterns.match(['x--y', 'a-b', 'c']))
+        assert_true(patterns.match(['A.B']))
+        assert_true(patterns.match(['C+']))
+        assert_true(patterns.match(['x', 'y']))
+        assert_false(patterns.match(['x']))
+
+    def test_none_and_empty_tags_are_ignored(self):
+        assert_false(TagPatterns('*').match(['', 'NONE', 'none']))
+
+    def test_results_are_cached_by_normalized_tags(self):
+        patterns = TagPatterns(['x*NOTy'])
+        assert_true(patterns.match(['X', 'z']))
+        assert_true(patterns.match(Tags(['Z', 'x_'])))
+        assert_equal(len(patterns._cache), 1)
+        assert_false(patterns.match(['X', 'Y']))
+        assert_true(patterns.match('x'))
+        assert_equal(len(patterns._cache), 3)
+
+    def test_cache_is_cleared_when_full(self):
+        patterns = TagPatterns('x')
+        patterns._cache.max_size = 5
+        for index in range(12):
+            assert_false(patterns.match('tag%d' % index))
+        assert_equal(len(patterns._cache), 2)
+
     def test_seq2str(self):
         patterns = TagPatterns([u'is\xe4', u'\xe4iti'])
         assert_equal(utils.seq2str(patterns), u"'is\xe4' and '\xe4iti'")
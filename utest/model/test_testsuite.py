@@ -98,6 +98,38 @@ class TestSuiteId(unittest.TestCase):
         suite.suites = [sub]
         assert_equal(sub.id, 's1-s1')
 
+    def test_id_is_updated_recursively(self):
+        suite = TestSuite()
+        sub = suite.suites.create()
+        test = sub.suites.create().tests.create()
+        kw = test.keywords.create()
+        assert_equal(kw.id, 's1-s1-s1-t1-k1')
+        suite.suites.create().suites.append(sub)
+        assert_equal(kw.id, 's1-s2-s1-s1-t1-k1')
+        sub.parent = None
+        assert_equal(kw.id, 's1-s1-t1-k1')
+
+
+class TestSuiteLongname(unittest.TestCase):
+
+    def test_longname_is_updated_when_names_change(self):
+        root = TestSuite(name='Root')
+        test = root.suites.create(name='Sub').tests.create(name='Test')
+        assert_equal(test.longname, 'Root.Sub.Test')
+        root.name = 'New'
+        assert_equal(test.longname, 'New.Sub.Test')
+        test.name = 'Name'
+        assert_equal(test.longname, 'New.Sub.Name')
+
+    def test_longname_of_suite_without_name(self):
+        root = TestSuite()
+        first = root.suites.create(name='A').suites.create(name='X')
+        assert_equal(first.longname, 'A.A.X')
+        second = root.suites.create(name='B')
+        assert_equal(first.longname, 'A & B.A.X')
+        second.name = 'C'
+        assert_equal(first.longname, 'A & C.A.X')
+
 
 class TestStringRepresentation(unittest.TestCase):
 
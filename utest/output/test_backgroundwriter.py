@@ -0,0 +1,112 @@
+from __future__ import with_statement
+
+import os
+import tempfile
+import time
+import unittest
+
+from robot.errors import DataError
+from robot.output.backgroundwriter import BackgroundWriter
+from robot.output.xmllogger import XmlLogger
+from robot.result.testsuite import TestSuite
+from robot.utils.asserts import assert_equals, assert_raises_with_msg
+
+
+class Recorder(object):
+
+    def __init__(self, delay=0):
+        self.calls = []
+        self.output = 'not queued'
+        self._delay = delay
+
+    def write(self, *args, **kwargs):
+        time.sleep(self._delay)
+        self.calls.append(('write', args, kwargs))
+
+    def flush(self):
+        self.calls.append(('flush', (), {}))
+
+    def fail(self):
+        raise IOError('Bang!')
+
+
+class TestBackgroundWriter(unittest.TestCase):
+
+    def test_calls_are_made_in_order_before_close_returns(self):
+        writer = BackgroundWriter(queue_size=2)
+        recorder = Recorder(delay=0.0001)
+        proxy = writer.wrap(recorder)
+        for index in range(1000):
+            proxy.write(index, key=index)
+        proxy.flush()
+        writer.close()
+        assert_equals(recorder.calls,
+                      [('write', (i,), {'key': i}) for i in range(1000)]
+                      + [('flush', (), {})])
+
+    def test_flush_sends_calls_to_writer_thread(self):
+        writer = BackgroundWriter()
+        recorder = Recorder()
+        proxy = writer.wrap(recorder)
+        proxy.write('x')
+        proxy.flush()
+        for _ in range(100):
+            if len(recorder.calls) == 2:
+                break
+            time.sleep(0.01)
+        assert_equals(len(recorder.calls), 2)
+        writer.close()
+
+    def test_other_attributes_are_not_queued(self):
+        writer = BackgroundWriter()
+        assert_equals(writer.wrap(Recorder()).output, 'not queued')
+        writer.close()
+
+    def test_error_is_reported_when_closing(self):
+        writer = BackgroundWriter()
+        recorder = Recorder()
+        proxy = writer.wrap(recorder)
+        proxy.fail()
+        proxy.write('not written')
+        assert_raises_with_msg(DataError,
+                               'Writing output failed: IOError: Bang!',
+                               writer.close)
+        assert_equals(recorder.calls, [])
+
+
+class TestBackgroundXmlLogger(unittest.TestCase):
+
+    def setUp(self):
+        self.paths = []
+
+    def tearDown(self):
+        for path in self.paths:
+            os.remove(path)
+
+    def test_output_is_same_as_when_writing_normally(self):
+        assert_equals(self._write(background=True),
+                      self._write(background=False))
+
+    def _write(self, background):
+        path = tempfile.mktemp(suffix='.xml')
+        self.paths.append(path)
+        logger = XmlLogger(path, background=background)
+        self._create_suite().visit(logger)
+        logger.close()
+        with open(path) as output:
+            return output.read().split('\n', 2)[2]
+
+    def _create_suite(self):
+        suite = TestSuite(name='Root', doc='Doc')
+        for index in range(100):
+            test = suite.tests.create(name='T%d' % index, tags=['t%d' % index],
+                                      status='PASS')
+            kw = test.keywords.create(name='K', args=['a', 'b'],
+                                      status='PASS')
+            for msg in range(20):
+                kw.messages.create(u'Hyv\xe4 %d' % msg, 'INFO')
+        return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
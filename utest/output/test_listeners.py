@@ -107,6 +107,46 @@ class ListenAllNewStyle(ListenOutputs):
         print 'Closing...'
 
 
+class EndTestOnly(object):
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def __init__(self):
+        self.attrs = []
+
+    def end_test(self, name, attrs):
+        self.attrs.append(attrs)
+
+
+class MutatingNewStyle(object):
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def __init__(self):
+        self.seen = []
+
+    def start_test(self, name, attrs):
+        self.seen.append((list(attrs['tags']), attrs['doc']))
+        attrs['tags'].append('X')
+        attrs['doc'] = 'changed'
+
+
+class MutatingOldStyle(object):
+
+    def __init__(self):
+        self.seen = []
+
+    def start_test(self, name, doc, tags):
+        self.seen.append((list(tags), doc))
+        tags.append('X')
+
+
+class RecordingKwMock(_Mock):
+    accessed = []
+
+    def __getattr__(self, name):
+        self.accessed.append(name)
+        return 'kw' if name == 'type' else ''
+
+
 class InvalidListenerOldStyle:
 
     def start_suite(self, wrong, number, of, args):
@@ -211,6 +251,39 @@ class TestInvalidOldStyleListener(unittest.TestCase):
             getattr(listenres, name)(*args)
 
 
+class TestDispatching(unittest.TestCase):
+
+    def test_only_implemented_methods_are_recorded(self):
+        listeners = Listeners([('test_listeners.EndTestOnly', [])])
+        assert_equals(listeners._listeners[0].methods,
+                      frozenset(['end_test']))
+
+    def test_attributes_are_not_built_if_method_not_implemented(self):
+        listeners = Listeners([('test_listeners.EndTestOnly', [])])
+        listeners.start_keyword(RecordingKwMock())
+        listeners.end_keyword(RecordingKwMock())
+        assert_equals(RecordingKwMock.accessed, [])
+
+    def test_attributes_are_built_once_and_copied(self):
+        listeners = Listeners([('test_listeners.EndTestOnly', []),
+                               ('test_listeners.EndTestOnly', [])])
+        listeners.end_test(TestMock())
+        first = listeners._listeners[0].logger.attrs[0]
+        second = listeners._listeners[1].logger.attrs[0]
+        assert_equals(first, second)
+        assert_equals(first['tags'], ['foo', 'bar'])
+        assert_true(first is not second)
+        assert_true(first['tags'] is not second['tags'])
+
+    def test_listeners_cannot_affect_each_other(self):
+        for name in 'MutatingNewStyle', 'MutatingOldStyle':
+            name = 'test_listeners.' + name
+            listeners = Listeners([(name, []), (name, []), (name, [])])
+            listeners.start_test(TestMock())
+            for li in listeners._listeners:
+                assert_equals(li.logger.seen, [(['foo', 'bar'], 'cod')])
+
+
 if utils.is_jython:
 
     class TestJavaListener(_BaseListenerTest, unittest.TestCase):
@@ -0,0 +1,127 @@
+from __future__ import with_statement
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from robot.errors import DataError
+from robot.parsing import datacache
+from robot.parsing.model import TestCaseFile, TestDataDirectory, ResourceFile
+from robot.utils.asserts import assert_equals, assert_raises, assert_true
+
+
+DATA = '''\
+*** Settings ***
+Documentation    Cached
+Invalid          Setting
+
+*** Test Cases ***
+Test
+    Log    ${CURDIR}
+
+*** Keywords ***
+Keyword
+    No Operation
+'''
+CACHE = os.path.join(tempfile.gettempdir(), 'robot-utest-datacache')
+SOURCE = os.path.join(tempfile.gettempdir(), 'robot-utest-datacache.txt')
+
+
+class RecordingTestCaseFile(TestCaseFile):
+    errors = []
+
+    def report_invalid_syntax(self, message, level='ERROR'):
+        self.errors.append(message)
+
+
+class TestDataCache(unittest.TestCase):
+
+    def setUp(self):
+        os.environ[datacache.CACHE_DIRECTORY_ENV_VAR] = CACHE
+        self._write_source(DATA)
+
+    def tearDown(self):
+        del os.environ[datacache.CACHE_DIRECTORY_ENV_VAR]
+        os.remove(SOURCE)
+        if os.path.exists(CACHE):
+            shutil.rmtree(CACHE)
+
+    def _write_source(self, data):
+        with open(SOURCE, 'w') as source:
+            source.write(data)
+
+    def _parse(self, parent=None):
+        RecordingTestCaseFile.errors[:] = []
+        return RecordingTestCaseFile(parent, SOURCE).populate()
+
+    def test_cached_data_is_used(self):
+        self._parse()
+        assert_equals(len(os.listdir(CACHE)), 1)
+        os.environ[datacache.CACHE_DIRECTORY_ENV_VAR] += '-not-used'
+        self._verify(self._parse())
+        os.environ[datacache.CACHE_DIRECTORY_ENV_VAR] = CACHE
+        self._verify(self._parse())
+
+    def _verify(self, tcf):
+        assert_equals(tcf.setting_table.doc.value, 'Cached')
+        assert_equals(tcf.testcase_table.tests[0].name, 'Test')
+        assert_equals(tcf.testcase_table.tests[0].steps[0].args,
+                      [os.path.dirname(SOURCE)])
+        assert_equals(tcf.keyword_table.keywords[0].name, 'Keyword')
+        assert_equals(tcf.errors, ["Non-existing setting 'Invalid'."])
+
+    def test_tables_refer_to_new_datafile_and_parent(self):
+        self._parse(TestDataDirectory(source=tempfile.gettempdir()))
+        parent = TestDataDirectory(source=tempfile.gettempdir())
+        tcf = self._parse(parent)
+        assert_true(tcf.parent is parent)
+        for table in tcf:
+            assert_true(table.parent is tcf)
+        assert_equals(tcf.testcase_table.tests[0].source, SOURCE)
+
+    def test_modified_file_is_parsed_again(self):
+        self._parse()
+        self._write_source(DATA.replace('Cached', 'Modified'))
+        assert_equals(self._parse().setting_table.doc.value, 'Modified')
+
+    def test_resource_files_are_cached_separately(self):
+        self._write_source(DATA.replace('Invalid          Setting', '')
+                               .replace('*** Test Cases ***', ''))
+        for round in range(2):
+            resource = ResourceFile(SOURCE).populate()
+            assert_equals(resource.setting_table.doc.value, 'Cached')
+            assert_equals(resource.keyword_table.keywords[-1].name, 'Keyword')
+        assert_raises(DataError, self._parse)
+        assert_equals(len(os.listdir(CACHE)), 2)
+
+    def test_invalid_cache_file_is_ignored(self):
+        self._parse()
+        for name in os.listdir(CACHE):
+            with open(os.path.join(CACHE, name), 'wb') as cache:
+                cache.write('invalid')
+        self._verify(self._parse())
+
+    if hasattr(os, 'getuid'):
+
+        def test_cache_directory_is_created_private(self):
+            self._parse()
+            assert_equals(os.stat(CACHE).st_mode & 0777, 0700)
+
+        def test_cache_file_writable_by_others_is_not_used(self):
+            self._parse()
+            path = os.path.join(CACHE, os.listdir(CACHE)[0])
+            os.chmod(path, 0666)
+            self._verify(self._parse())
+            # Data is parsed again and written to a new private file.
+            assert_equals(os.stat(path).st_mode & 0777, 0600)
+
+        def test_cache_directory_writable_by_others_is_not_used(self):
+            os.mkdir(CACHE)
+            os.chmod(CACHE, 0777)
+            self._verify(self._parse())
+            assert_equals(os.listdir(CACHE), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
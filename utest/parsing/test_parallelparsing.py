@@ -0,0 +1,119 @@
+from __future__ import with_statement
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from robot.output import LOGGER
+from robot.parsing import TestData, datacache
+from robot.parsing.populators import FromDirectoryPopulator
+from robot.utils.asserts import assert_equals, assert_true
+
+
+LOGGER.disable_automatic_console_logger()
+
+ROOT = os.path.join(tempfile.gettempdir(), 'robot-utest-parallel')
+CACHE = os.path.join(tempfile.gettempdir(), 'robot-utest-parallel-cache')
+FILES = {
+    '__init__.txt': '*** Settings ***\nDocumentation    Root\n',
+    'a.txt': '*** Test Cases ***\nA\n    Log    ${CURDIR}\n',
+    'b.txt': '*** Settings ***\nInvalid    a\n*** Test Cases ***\nB\n    No Op\n',
+    'c.txt': '*** Keywords ***\nNo tests\n    No Op\n',
+    'c.html': '<html></html>',
+    'ignored.py': '',
+    '_ignored.txt': '*** Test Cases ***\nIgnored\n    No Op\n',
+    os.path.join('sub', 'd.txt'): '*** Settings ***\nBad    b\n'
+                                  '*** Test Cases ***\nD\n    No Op\n',
+    os.path.join('sub', 'e.tsv'): '*** Test Cases ***\nE\tNo Op\n',
+}
+
+
+class _MessageLogger(object):
+
+    def __init__(self):
+        self.messages = []
+
+    def message(self, msg):
+        self.messages.append((msg.level, msg.message))
+
+
+class TestParsingInParallel(unittest.TestCase):
+
+    def setUp(self):
+        os.makedirs(os.path.join(ROOT, 'sub'))
+        for name, content in FILES.items():
+            with open(os.path.join(ROOT, name), 'w') as f:
+                f.write(content)
+        LOGGER.disable_message_cache()
+
+    def tearDown(self):
+        shutil.rmtree(ROOT)
+
+    def test_get_test_case_files(self):
+        files = FromDirectoryPopulator().get_test_case_files(ROOT)
+        assert_equals([f[len(ROOT)+1:] for f in files],
+                      ['a.txt', 'b.txt', 'c.html', 'c.txt',
+                       os.path.join('sub', 'd.txt'),
+                       os.path.join('sub', 'e.tsv')])
+
+    def test_same_model_and_messages_as_when_parsing_serially(self):
+        expected, expected_messages = self._parse(processes=1)
+        data, messages = self._parse(processes=3)
+        assert_equals(self._model(data), self._model(expected))
+        assert_equals(messages, expected_messages)
+        assert_equals([m for l, m in messages if l == 'ERROR'],
+                      ["Error in file '%s': Non-existing setting 'Invalid'."
+                       % os.path.join(ROOT, 'b.txt'),
+                       "Error in file '%s': Non-existing setting 'Bad'."
+                       % os.path.join(ROOT, 'sub', 'd.txt')])
+
+    def test_parent_is_set(self):
+        data, _ = self._parse(processes=2)
+        for child in data.children:
+            assert_true(child.parent is data)
+            assert_true(child.testcase_table.parent is child)
+        assert_equals(data.children[0].testcase_table.tests[0].steps[0].args,
+                      [ROOT])
+
+    def test_cache_is_used_and_updated(self):
+        expected, expected_messages = self._parse(processes=1)
+        os.environ[datacache.CACHE_DIRECTORY_ENV_VAR] = CACHE
+        try:
+            for round in range(2):
+                data, messages = self._parse(processes=3)
+                assert_equals(self._model(data), self._model(expected))
+                assert_equals(self._errors(messages),
+                              self._errors(expected_messages))
+                cached = dict((name, os.stat(os.path.join(CACHE, name)).st_ino)
+                              for name in os.listdir(CACHE))
+                if round == 0:
+                    written = cached
+            assert_equals(len(written), 6)
+            # Cache files are replaced when written, changing their inodes.
+            assert_equals(cached, written)
+        finally:
+            del os.environ[datacache.CACHE_DIRECTORY_ENV_VAR]
+            if os.path.exists(CACHE):
+                shutil.rmtree(CACHE)
+
+    def _errors(self, messages):
+        return [m for l, m in messages if l == 'ERROR']
+
+    def _parse(self, processes):
+        logger = _MessageLogger()
+        LOGGER.register_logger(logger)
+        try:
+            data = TestData(source=ROOT, processes=processes)
+        finally:
+            LOGGER.unregister_logger(logger)
+        return data, logger.messages
+
+    def _model(self, data):
+        return (data.name, data.setting_table.doc.value,
+                [t.name for t in data.testcase_table.tests],
+                [self._model(child) for child in data.children])
+
+
+if __name__ == '__main__':
+    unittest.main()
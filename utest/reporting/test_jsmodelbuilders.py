@@ -7,6 +7,7 @@ from robot.result.testcase import TestCase
 from robot.result.keyword import Keyword
 from robot.result.message import Message
 from robot.result.executionerrors import ExecutionErrors
+from robot.result import ExecutionResult
 from robot.model import Statistics
 from robot.reporting.jsmodelbuilders import *
 from robot.reporting.stringcache import StringIndex
@@ -270,6 +271,74 @@ class TestSplitting(unittest.TestCase):
             assert_true('*s1-k1-k1' not in res[1])
 
 
+class TestBuildFromStream(unittest.TestCase):
+    xml = """
+<robot generator="Robot">
+<suite name="Root" source="root">
+<suite name="Sub" source="sub">
+<kw type="setup" name="Setup">
+<kw type="kw" name="Nested"><msg level="WARN">Setup warn</msg>
+<status status="PASS"></status></kw>
+<msg level="INFO">Setup info</msg>
+<status status="PASS"></status>
+</kw>
+<test name="T1">
+<kw type="kw" name="K1"><arguments><arg>a1</arg></arguments>
+<kw type="kw" name="K2"><msg level="DEBUG">Deep</msg>
+<status status="PASS"></status></kw>
+<status status="PASS"></status></kw>
+<doc>*doc*</doc><tags><tag>t1</tag></tags>
+<status status="PASS" critical="yes"></status>
+</test>
+<test name="T2">
+<kw type="kw" name="K3"><msg level="FAIL">Oops</msg>
+<status status="FAIL"></status></kw>
+<status status="FAIL" critical="yes">Oops</status>
+</test>
+<kw type="teardown" name="Teardown"><msg level="FAIL">TD</msg>
+<status status="FAIL">TD</status></kw>
+<doc>Sub doc</doc>
+<status status="FAIL"></status>
+</suite>
+<status status="FAIL"></status>
+</suite>
+<errors><msg level="WARN">Setup warn</msg></errors>
+</robot>
+"""
+
+    def test_same_model_as_when_building_from_result(self):
+        self._verify_same_model()
+
+    def test_same_model_with_split_log(self):
+        self._verify_same_model(split_log=True)
+
+    def test_configuring(self):
+        def configure(result):
+            result.configure(suite_config={'name': 'New', 'set_tags': ['x']})
+        model = self._build_from_stream(configure=configure)
+        strings = model.strings
+        assert_equals(remap(model.suite[0], strings), 'New')
+        assert_equals(remap(model.suite[6][0][7][1][4], strings), ('x',))
+
+    def _verify_same_model(self, split_log=False):
+        expected = JsModelBuilder(split_log=split_log).build_from(
+            ExecutionResult(self.xml))
+        model = self._build_from_stream(split_log=split_log)
+        assert_equals(self._remap(model), self._remap(expected))
+        assert_equals(model.min_level, expected.min_level)
+
+    def _build_from_stream(self, split_log=False, configure=None):
+        result = ExecutionResult(self.xml, streaming=True)
+        return JsModelBuilder(split_log=split_log).build_from_stream(result,
+                                                                     configure)
+
+    def _remap(self, model):
+        splits = [remap(*split) for split in model.split_results]
+        return (remap(model.suite, model.strings),
+                remap(model.data['errors'], model.strings),
+                model.data['stats'], splits)
+
+
 class TestPruneInput(unittest.TestCase):
 
     def setUp(self):
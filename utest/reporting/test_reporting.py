@@ -75,6 +75,22 @@ class TestReporting(unittest.TestCase):
         for test in result.suite.tests:
             assert_equals(len(test.keywords), 0)
 
+    def test_js_result_is_built_while_parsing_when_possible(self):
+        results = Results(StubSettings(log='log.html'), 'output.xml')
+        assert_true(results._can_build_js_result_while_parsing())
+        for settings in [StubSettings(),
+                         StubSettings(log='log.html', output='output.xml'),
+                         StubSettings(log='log.html',
+                                      suite_config={'include_tags': ['x']}),
+                         StubSettings(log='log.html',
+                                      suite_config={'log_level': 'INFO'})]:
+            results = Results(settings, 'output.xml')
+            if settings.output:
+                results._result = self._get_execution_result()
+            assert_true(not results._can_build_js_result_while_parsing())
+        results = Results(StubSettings(log='log.html'), 'o1.xml', 'o2.xml')
+        assert_true(not results._can_build_js_result_while_parsing())
+
     def _write_results(self, **settings):
         result = self._get_execution_result()
         settings = StubSettings(**settings)
@@ -126,6 +142,7 @@ class StubSettings(object):
     log = None
     log_config = {}
     split_log = False
+    output_index = False
     report = None
     report_config = None
     output = None
@@ -134,6 +151,7 @@ class StubSettings(object):
     suite_config = {}
     statistics_config = {}
     xunit_skip_noncritical = False
+    parse_processes = 1
 
     def __init__(self, **settings):
         self.__dict__.update(settings)
@@ -0,0 +1,42 @@
+"""Micro-benchmark for building result models with many child items.
+
+Run with `src` in PYTHONPATH like `python benchmark_resultmodel.py`.
+Builds a keyword with many messages and a suite with many tests and
+reports the time per added item. The time per item should not grow with
+the number of items.
+"""
+
+import sys
+import time
+
+from robot.result.keyword import Keyword
+from robot.result.testsuite import TestSuite
+
+
+def add_messages(count):
+    kw = Keyword()
+    for index in xrange(count):
+        kw.messages.create('Message %d' % index)
+    return kw
+
+
+def add_tests(count):
+    suite = TestSuite()
+    for index in xrange(count):
+        suite.tests.create('Test %d' % index, status='PASS')
+    return suite
+
+
+def measure(func, count):
+    start = time.time()
+    func(count)
+    return time.time() - start
+
+
+if __name__ == '__main__':
+    counts = [int(c) for c in sys.argv[1:]] or [10**5, 10**6]
+    for func in add_messages, add_tests:
+        for count in counts:
+            elapsed = measure(func, count)
+            print '%-13s %8d items: %6.2fs (%.2fus per item)' \
+                % (func.__name__, count, elapsed, elapsed * 10**6 / count)
@@ -0,0 +1,129 @@
+from __future__ import with_statement
+
+import os
+import tempfile
+import unittest
+from StringIO import StringIO
+
+from robot.errors import DataError
+from robot.output.binarylogger import BinaryLogger
+from robot.reporting.outputwriter import BinaryOutputWriter
+from robot.result import ExecutionResult
+from robot.result import binaryformat as rbin
+from robot.result.binaryformat import BinaryReader, is_binary_source
+from robot.utils.asserts import assert_equals, assert_true, assert_raises
+
+import test_resultbuilder
+from test_resultbuilder import (GOLDEN_XML, SUITE_TEARDOWN_FAILED,
+                                StreamingRecorder)
+
+
+PATH = os.path.join(tempfile.gettempdir(), 'test_binaryformat.rbin')
+
+
+class RobotBinaryWriter(BinaryOutputWriter):
+
+    def __init__(self, output):
+        BinaryLogger.__init__(self, output)
+
+
+def create_binary(xml=GOLDEN_XML):
+    # Results are read as if they were created by Rebot to avoid handling
+    # suite teardown failures twice.
+    xml = xml.replace('generator="Robot', 'generator="Rebot')
+    ExecutionResult(StringIO(xml)).visit(RobotBinaryWriter(PATH))
+    return PATH
+
+
+class TestBuildingFromBinary(
+        test_resultbuilder.TestBuildingSuiteExecutionResult):
+
+    def setUp(self):
+        result = ExecutionResult(create_binary())
+        self._suite = result.suite
+        self._test = self._suite.tests[0]
+        self._keyword = self._test.keywords[0]
+        self._user_keyword = self._test.keywords[1]
+        self._message = self._keyword.messages[0]
+        self._setup = self._suite.keywords[0]
+        self._errors = result.errors
+
+    def tearDown(self):
+        os.remove(PATH)
+
+    def test_binary_source_is_detected(self):
+        assert_true(is_binary_source(PATH))
+        assert_true(is_binary_source('non-existing.rbin'))
+        assert_true(not is_binary_source(GOLDEN_XML))
+        assert_true(not is_binary_source(StringIO(GOLDEN_XML)))
+
+    def test_omit_keywords(self):
+        result = ExecutionResult(PATH, include_keywords=False)
+        assert_equals(len(result.suite.keywords), 0)
+        assert_equals(len(result.suite.tests[0].keywords), 0)
+        assert_equals(result.suite.tests[0].status, 'PASS')
+        assert_equals(len(result.errors), 1)
+
+    def test_converting_to_xml_and_back(self):
+        xml = os.path.splitext(PATH)[0] + '.xml'
+        try:
+            ExecutionResult(PATH).save(xml)
+            ExecutionResult(xml).save(PATH)
+        finally:
+            os.remove(xml)
+        result = ExecutionResult(PATH)
+        assert_equals(result.suite.tests[0].keywords[0].messages[0].message,
+                      self._message.message)
+        assert_equals(result.suite.stat_message, self._suite.stat_message)
+
+    def test_suite_teardown_failures_are_handled(self):
+        tc1, tc2 = ExecutionResult(create_binary(SUITE_TEARDOWN_FAILED)).suite.tests
+        assert_equals(tc1.status, 'FAIL')
+        assert_equals(tc1.message, 'Parent suite teardown failed:\nXXX')
+        assert_equals(tc2.message, 'Message\n\n'
+                                   'Also parent suite teardown failed:\nXXX')
+
+    def test_records_spanning_multiple_chunks(self):
+        expected = list(BinaryReader(PATH))
+        for chunk_size in 1, 2, 7, 64:
+            reader = BinaryReader(PATH)
+            reader._chunk_size = chunk_size
+            assert_equals(list(reader), expected)
+
+    def test_statistics_and_criticality_are_written(self):
+        records = list(BinaryReader(PATH))
+        stats = [payload for type, payload in records
+                 if type == rbin.STATISTIC]
+        assert_equals([rbin.STATISTIC_TYPES[s[0]] for s in stats],
+                      ['total', 'total', 'tag', 'suite'])
+        end_test = [payload for type, payload in records
+                    if type == rbin.END_TEST][0]
+        assert_equals(end_test[5], 1)
+
+    def test_other_format_version_is_not_read(self):
+        with open(PATH, 'r+b') as binary:
+            binary.seek(len(rbin.MAGIC))
+            binary.write('\x00\x01')
+        assert_true(is_binary_source(PATH))
+        assert_raises(DataError, ExecutionResult, PATH)
+
+    def test_invalid_file(self):
+        truncated = open(PATH, 'rb').read(20)
+        with open(PATH, 'wb') as output:
+            output.write(truncated)
+        assert_raises(DataError, ExecutionResult, PATH)
+
+
+class TestStreamingBinary(test_resultbuilder.TestStreaming):
+
+    def _stream(self, xml=GOLDEN_XML, visitor=None):
+        visitor = visitor or StreamingRecorder()
+        try:
+            ExecutionResult(create_binary(xml), streaming=True).visit(visitor)
+        finally:
+            os.remove(PATH)
+        return visitor
+
+
+if __name__ == '__main__':
+    unittest.main()
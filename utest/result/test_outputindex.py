@@ -0,0 +1,111 @@
+from __future__ import with_statement
+
+import os
+import tempfile
+import unittest
+from StringIO import StringIO
+
+from robot.conf.gatherfailed import gather_failed_tests
+from robot.errors import DataError
+from robot.result import ExecutionResult
+from robot.result.outputindex import OutputIndex, index_path
+from robot.utils.asserts import assert_equals, assert_true, assert_raises
+
+from test_resultbuilder import GOLDEN_XML, GOLDEN_XML_TWICE
+
+
+PATH = os.path.join(tempfile.gettempdir(), 'test_outputindex.xml')
+
+
+class TestOutputIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.result = ExecutionResult(StringIO(GOLDEN_XML_TWICE))
+        self.result.save(PATH, index=True)
+        self.index = OutputIndex(PATH)
+
+    def tearDown(self):
+        for path in PATH, index_path(PATH):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_suites_and_tests(self):
+        assert_equals([(s.id, s.longname, s.status) for s in self.index.suites],
+                      [('s1', 'Normal & Normal', 'PASS'),
+                       ('s1-s1', 'Normal & Normal.Normal', 'PASS'),
+                       ('s1-s2', 'Normal & Normal.Normal', 'PASS')])
+        assert_equals([(t.id, t.longname, t.passed) for t in self.index.tests],
+                      [('s1-s1-t1', 'Normal & Normal.Normal.First One', True),
+                       ('s1-s2-t1', 'Normal & Normal.Normal.First One', True)])
+
+    def test_offsets(self):
+        with open(PATH) as output:
+            content = output.read()
+        test = self.index.get('s1-s2-t1')
+        assert_true(content[test.start:].startswith('<test '))
+        assert_true(content[:test.end].endswith('</test>\n'))
+
+    def test_build_test(self):
+        test = self.index.build('s1-s2-t1')
+        expected = self.result.suite.suites[1].tests[0]
+        assert_equals(test.longname, expected.longname)
+        assert_equals(test.doc, expected.doc)
+        assert_equals(list(test.tags), list(expected.tags))
+        assert_equals(test.status, expected.status)
+        assert_equals(len(test.keywords), len(expected.keywords))
+        assert_equals(test.keywords[0].messages[0].message,
+                      expected.keywords[0].messages[0].message)
+
+    def test_build_suite(self):
+        suite = self.index.build('s1-s1')
+        assert_equals(suite.longname, 'Normal & Normal.Normal')
+        assert_equals(suite.metadata, {'Something': 'My Value'})
+        assert_equals(suite.stat_message,
+                      self.result.suite.suites[0].stat_message)
+
+    def test_build_root_suite(self):
+        suite = self.index.build('s1', include_keywords=False)
+        assert_equals(suite.id, 's1')
+        assert_equals(suite.longname, 'Normal & Normal')
+        assert_equals(len(suite.suites[0].keywords), 0)
+        assert_equals(suite.stat_message, self.result.suite.stat_message)
+
+    def test_unknown_id(self):
+        assert_raises(DataError, self.index.get, 's1-s3')
+
+    def test_non_existing_index(self):
+        os.remove(index_path(PATH))
+        assert_raises(DataError, OutputIndex, PATH)
+
+    def test_outdated_index(self):
+        ExecutionResult(StringIO(GOLDEN_XML)).save(PATH)
+        assert_raises(DataError, OutputIndex, PATH)
+
+    def test_output_modified_without_changing_size(self):
+        with open(PATH, 'rb') as output:
+            content = output.read()
+        mtime = os.path.getmtime(PATH)
+        with open(PATH, 'wb') as output:
+            output.write(content.replace('PASS', 'FAIL'))
+        os.utime(PATH, (mtime, mtime))
+        assert_raises(DataError, OutputIndex, PATH)
+
+    def test_output_modification_time_changed(self):
+        mtime = os.path.getmtime(PATH) - 60
+        os.utime(PATH, (mtime, mtime))
+        assert_raises(DataError, OutputIndex, PATH)
+
+    def test_failed_tests_are_gathered_from_output_if_index_outdated(self):
+        with open(index_path(PATH)) as index:
+            header = index.readline()
+            content = index.read()
+        with open(index_path(PATH), 'w') as index:
+            index.write(header + content.replace('PASS', 'FAIL'))
+        assert_equals(len(gather_failed_tests(PATH)), 2)
+        mtime = os.path.getmtime(PATH) - 60
+        os.utime(PATH, (mtime, mtime))
+        assert_raises(DataError, gather_failed_tests, PATH)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,7 @@ import unittest
 from StringIO import StringIO
 from robot.errors import DataError
 
-from robot.result import ExecutionResult
+from robot.result import ExecutionResult, ResultVisitor
 from robot.utils.asserts import assert_equals, assert_true, assert_raises
 
 def _read_file(name):
@@ -99,6 +99,28 @@ class TestCombiningSuites(unittest.TestCase):
         assert_equals(self.result.suite.name, 'Normal & Normal')
 
 
+class TestCombiningSuitesInParallel(unittest.TestCase):
+
+    def test_same_result_as_when_parsing_serially(self):
+        sources = [join(dirname(__file__), name) for name in
+                   ('golden.xml', 'suite_teardown_failed.xml', 'goldenTwice.xml')]
+        expected = ExecutionResult(*sources)
+        result = ExecutionResult(processes=2, *sources)
+        assert_equals([s.name for s in result.suite.suites],
+                      [s.name for s in expected.suite.suites])
+        assert_equals([t.longname for t in result.suite.suites[1].tests],
+                      [t.longname for t in expected.suite.suites[1].tests])
+        assert_equals(result.suite.suites[1].tests[0].message,
+                      'Parent suite teardown failed:\nXXX')
+        assert_equals(result.suite.stat_message, expected.suite.stat_message)
+        assert_equals(len(result.errors), len(expected.errors))
+        assert_true(result.suite.suites[0].parent is result.suite)
+
+    def test_errors_are_reported_like_when_parsing_serially(self):
+        sources = [join(dirname(__file__), 'golden.xml'), 'non-existing.xml']
+        assert_raises(DataError, ExecutionResult, processes=2, *sources)
+
+
 class TestElements(unittest.TestCase):
 
     def test_nested_suites(self):
@@ -172,6 +194,124 @@ class TestSuiteTeardownFailed(unittest.TestCase):
         assert_equals(tc2.message, 'Message')
 
 
+class TestStreaming(unittest.TestCase):
+
+    def _stream(self, xml=GOLDEN_XML, visitor=None):
+        visitor = visitor or StreamingRecorder()
+        ExecutionResult(StringIO(xml), streaming=True).visit(visitor)
+        return visitor
+
+    def test_events_are_in_output_file_order(self):
+        assert_equals(self._stream().events,
+                      ['start_result', 'start_suite Normal',
+                       'start_keyword my setup', 'end_keyword my setup',
+                       'start_test First One',
+                       'start_keyword BuiltIn.Log', 'message Test 1',
+                       'end_keyword BuiltIn.Log',
+                       'start_keyword logs on trace',
+                       'start_keyword BuiltIn.Log', 'end_keyword BuiltIn.Log',
+                       'end_keyword logs on trace',
+                       'end_test First One PASS', 'end_suite Normal PASS',
+                       'start_errors', 'message Error in file \'normal.html\' '
+                       'in table \'Settings\': Resource file \'nope\' does '
+                       'not exist.', 'end_errors', 'end_result'])
+
+    def test_same_information_as_without_streaming(self):
+        visitor = self._stream()
+        test = visitor.tests[0]
+        assert_equals(test.name, 'First One')
+        assert_equals(test.doc, 'Test case documentation')
+        assert_equals(list(test.tags), ['t1'])
+        assert_equals(test.id, 's1-t1')
+        assert_equals(test.longname, 'Normal.First One')
+        suite = visitor.suites[0]
+        assert_equals(suite.doc, 'Normal test cases')
+        assert_equals(suite.metadata, {'Something': 'My Value'})
+        assert_equals(suite.statistics.critical.passed, 1)
+
+    def test_keywords_and_messages_are_released_after_visiting(self):
+        visitor = self._stream()
+        assert_equals(len(visitor.tests[0].keywords), 0)
+        assert_equals(len(visitor.suites[0].keywords), 1)
+        for kw in visitor.keywords:
+            assert_equals(len(kw.keywords), 0)
+            assert_equals(len(kw.messages), 0)
+
+    def test_skipping_subtree(self):
+        visitor = self._stream(visitor=StreamingRecorder(skip='start_test'))
+        assert_true('start_test First One' in visitor.events)
+        assert_true('end_test First One PASS' not in visitor.events)
+        assert_true('message Test 1' not in visitor.events)
+        assert_true('end_suite Normal PASS' in visitor.events)
+
+    def test_suite_teardown_failures_are_handled_before_end_suite(self):
+        visitor = self._stream(SUITE_TEARDOWN_FAILED)
+        assert_true('end_test Pass PASS' in visitor.events)
+        assert_equals([t.status for t in visitor.suites[0].tests],
+                      ['FAIL', 'FAIL'])
+        assert_equals(visitor.suites[0].tests[0].message,
+                      'Parent suite teardown failed:\nXXX')
+
+    def test_errors_are_reported_when_visiting(self):
+        result = ExecutionResult(StringIO('<some_tag/>'), streaming=True)
+        assert_raises(DataError, result.visit, StreamingRecorder())
+
+    def test_streaming_multiple_sources_is_not_supported(self):
+        assert_raises(DataError, ExecutionResult, StringIO(GOLDEN_XML),
+                      StringIO(GOLDEN_XML), streaming=True)
+
+
+class StreamingRecorder(ResultVisitor):
+
+    def __init__(self, skip=None):
+        self.events = []
+        self.suites = []
+        self.tests = []
+        self.keywords = []
+        self._skip = skip
+
+    def _record(self, event, item=None, *extra):
+        self.events.append(' '.join((event,) + ((item.name,) if item else ())
+                                    + extra))
+        return event != self._skip
+
+    def start_result(self, result):
+        return self._record('start_result')
+
+    def end_result(self, result):
+        self._record('end_result')
+
+    def start_suite(self, suite):
+        return self._record('start_suite', suite)
+
+    def end_suite(self, suite):
+        self.suites.append(suite)
+        self._record('end_suite', suite, suite.status)
+
+    def start_test(self, test):
+        return self._record('start_test', test)
+
+    def end_test(self, test):
+        self.tests.append(test)
+        self._record('end_test', test, test.status)
+
+    def start_keyword(self, kw):
+        return self._record('start_keyword', kw)
+
+    def end_keyword(self, kw):
+        self.keywords.append(kw)
+        self._record('end_keyword', kw)
+
+    def visit_message(self, msg):
+        self.events.append('message ' + msg.message)
+
+    def start_errors(self, errors):
+        self._record('start_errors')
+
+    def end_errors(self, errors):
+        self._record('end_errors')
+
+
 class TestBuildingFromXmlStringAndHandlingMissingInformation(unittest.TestCase):
 
     def setUp(self):
@@ -87,6 +87,61 @@ class TestSuiteStatus(unittest.TestCase):
         assert_true(suite.passed)
 
 
+class TestSuiteStatsAreUpdated(unittest.TestCase):
+
+    def setUp(self):
+        self.root = TestSuite()
+        self.root.set_criticality(non_critical_tags='nc')
+        self.child = self.root.suites.create().suites.create()
+        self.test = self.child.tests.create(status='PASS')
+        assert_equal(self.root.status, 'PASS')
+
+    def test_status_changed(self):
+        self.test.status = 'FAIL'
+        assert_equal(self.root.status, 'FAIL')
+        assert_equal(self.child.status, 'FAIL')
+
+    def test_tags_changed(self):
+        self.test.status = 'FAIL'
+        self.test.tags.add('nc')
+        assert_equal(self.root.status, 'PASS')
+        self.test.tags.remove('n?')
+        assert_equal(self.root.status, 'FAIL')
+        self.test.tags = ['NC']
+        assert_equal(self.root.status, 'PASS')
+
+    def test_tests_added_and_removed(self):
+        failed = self.child.tests.create(status='FAIL')
+        assert_equal(self.root.stat_message.splitlines()[1],
+                     '2 tests total, 1 passed, 1 failed')
+        self.child.tests = [self.test]
+        assert_equal(self.root.status, 'PASS')
+        self.root.suites[0].suites.create().tests.append(failed)
+        assert_equal(self.root.status, 'FAIL')
+        self.root.suites[0].suites.clear()
+        assert_equal(self.root.statistics.all.total, 0)
+
+    def test_criticality_changed(self):
+        self.test.status = 'FAIL'
+        self.root.set_criticality(critical_tags='crit')
+        assert_equal(self.root.status, 'PASS')
+        other = TestSuite()
+        other.suites.append(self.child)
+        assert_equal(other.status, 'FAIL')
+        assert_equal(self.child.status, 'FAIL')
+
+    def test_elapsed_changed(self):
+        self.test.starttime = '20130101 12:00:00.000'
+        self.test.endtime = '20130101 12:00:01.000'
+        assert_equal(self.root.statistics.all.elapsed, 1000)
+        self.test.endtime = '20130101 12:00:02.000'
+        assert_equal(self.root.statistics.all.elapsed, 2000)
+
+    def test_returned_statistics_are_copies(self):
+        self.root.statistics.critical.failed += 1
+        assert_equal(self.root.status, 'PASS')
+
+
 class TestElapsedTime(unittest.TestCase):
 
     def test_suite_elapsed_time_when_start_and_end_given(self):
@@ -2,12 +2,37 @@ import unittest
 import os
 from os.path import abspath, join
 
-from robot.running.importer import ImportCache
+from robot.running.importer import ImportCache, Importer
 from robot.errors import FrameworkError
 from robot.utils.asserts import assert_equals, assert_true, assert_raises
 from robot.utils import normpath
 
 
+class ResourceStub(object):
+
+    def __init__(self, source, keywords):
+        self.source = source
+        self.keyword_table = KeywordTableStub(keywords)
+
+
+class KeywordTableStub(object):
+
+    def __init__(self, keywords):
+        self.keywords = keywords
+
+
+class TestImportUserLibrary(unittest.TestCase):
+
+    def test_user_library_is_shared(self):
+        importer = Importer()
+        resource = ResourceStub(abspath('res.txt'), [])
+        lib = importer.import_user_library(resource)
+        assert_equals(lib.name, 'res')
+        assert_true(importer.import_user_library(resource) is lib)
+        other = ResourceStub(abspath('other.txt'), [])
+        assert_true(importer.import_user_library(other) is not lib)
+
+
 class TestImportCache(unittest.TestCase):
 
     def setUp(self):
@@ -68,6 +93,34 @@ class TestImportCache(unittest.TestCase):
         assert_equals(cache[path], value)
         assert_equals(cache._keys[0], path)
 
+    def test_keys_with_lists_and_dicts(self):
+        cache = ImportCache()
+        cache[('lib', ['a'], {'x': ['1']})] = 1
+        cache[('lib', ('a',), {'x': ['1']})] = 2
+        cache[('lib', ['a'], {'x': ['2']})] = 3
+        assert_equals(cache[('lib', ['a'], {'x': ['1']})], 1)
+        assert_equals(cache[('lib', ('a',), {'x': ['1']})], 2)
+        assert_equals(cache[('lib', ['a'], {'x': ['2']})], 3)
+        assert_true(('lib', ['a'], {}) not in cache)
+
+    def test_unhashable_keys(self):
+        cache = ImportCache()
+        cache[('lib', set(['a']))] = 1
+        cache['res'] = 2
+        cache[('lib', set(['a']))] = 3
+        assert_equals(cache[('lib', set(['a']))], 3)
+        assert_equals(cache['res'], 2)
+        assert_true(('lib', set(['b'])) not in cache)
+        assert_equals(cache.values(), [3, 2])
+
+    def test_insertion_order_is_preserved(self):
+        cache = ImportCache()
+        for index in range(100):
+            cache['item%d' % (99 - index)] = index
+        cache['item50'] = 'new'
+        assert_equals(cache._keys, ['item%d' % (99 - i) for i in range(100)])
+        assert_equals(cache.values()[49], 'new')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,7 +5,8 @@ import pkgutil
 from robot.running import namespace
 from robot.running.namespace import _VariableScopes, GLOBAL_VARIABLES
 from robot import libraries
-from robot.utils.asserts import assert_equals
+from robot.variables import Variables
+from robot.utils.asserts import assert_equals, assert_true
 
 
 class TestNamespace(unittest.TestCase):
@@ -24,3 +25,57 @@ class TestVariableScopes(unittest.TestCase):
         assert_equals(len(_VariableScopes(None, None)), 0)
         assert_equals(len(_VariableScopes(variables, None)), 2 + len(GLOBAL_VARIABLES))
         assert_equals(len(_VariableScopes(None, _VariableScopes(variables, None))), 0)
+
+    def test_truth_does_not_require_length(self):
+        scopes = _VariableScopes(None, None)
+        assert_true(not scopes)
+        scopes.current = NoLenVariables()
+        assert_true(scopes)
+
+
+class NoLenVariables(Variables):
+
+    def __len__(self):
+        raise AssertionError('Length should not be calculated.')
+
+
+class _FakeSuite(object):
+    longname = 'Suite'
+
+
+class TestHandlerCache(unittest.TestCase):
+
+    def setUp(self):
+        self.ns = namespace.Namespace(_FakeSuite(), Variables(), None, [], [])
+        self.ns.handle_imports()
+
+    def test_found_handlers_are_cached(self):
+        handler = self.ns.get_handler('No Operation')
+        assert_true(self.ns.get_handler('No Operation') is handler)
+        assert_true(self.ns.get_handler('BuiltIn.No Operation') is handler)
+        assert_equals(self.ns._handler_cache.hits, 1)
+        assert_equals(self.ns._handler_cache.misses, 2)
+
+    def test_cache_key_is_not_normalized(self):
+        handler = self.ns.get_handler('Given No Operation')
+        assert_equals(handler.name, 'Given No Operation')
+        handler = self.ns.get_handler('given no operation')
+        assert_equals(handler.name, 'given no operation')
+
+    def test_not_found_handlers_are_not_cached(self):
+        self.ns.get_handler('Non Existing')
+        assert_equals(len(self.ns._handler_cache), 0)
+
+    def test_importing_library_clears_cache(self):
+        self.ns.get_handler('No Operation')
+        self.ns.import_library('OperatingSystem')
+        assert_equals(len(self.ns._handler_cache), 0)
+
+    def test_setting_library_search_order_clears_cache(self):
+        self.ns.get_handler('No Operation')
+        self.ns.library_search_order = ('BuiltIn',)
+        assert_equals(len(self.ns._handler_cache), 0)
+        assert_equals(self.ns.library_search_order, ('BuiltIn',))
+
+if __name__ == '__main__':
+    unittest.main()
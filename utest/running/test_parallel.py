@@ -0,0 +1,150 @@
+from __future__ import with_statement
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from robot.output import LOGGER
+from robot.result import Result
+from robot.running import TestSuite
+from robot.running.parallel import (OWN_TESTS, ParallelRunner, UnitSplitter,
+                                    select_unit)
+from robot.utils.asserts import assert_equals, assert_true
+
+
+LOGGER.disable_automatic_console_logger()
+
+
+def create_suite():
+    root = TestSuite(name='Root')
+    for name in 'A', 'B':
+        suite = root.suites.create(name=name)
+        for index in range(3):
+            suite.tests.create(name='%s%d' % (name, index))
+    root.suites[1].suites.create(name='C').tests.create(name='C0')
+    return root
+
+
+class TestUnitSplitter(unittest.TestCase):
+
+    def test_child_suites_are_units_by_default(self):
+        assert_equals(UnitSplitter().split(create_suite()),
+                      [((0,), None), ((1,), None)])
+
+    def test_file_suite_is_single_unit(self):
+        suite = TestSuite(name='File')
+        suite.tests.create(name='T')
+        assert_equals(UnitSplitter().split(suite), [((), None)])
+
+    def test_split_tests(self):
+        assert_equals(UnitSplitter(['A']).split(create_suite()),
+                      [((0,), 0), ((0,), 1), ((0,), 2), ((1,), None)])
+
+    def test_split_tests_with_child_suites(self):
+        assert_equals(UnitSplitter(['Root.B']).split(create_suite()),
+                      [((0,), None), ((1,), 0), ((1,), 1), ((1,), 2),
+                       ((1, 0), None)])
+
+    def test_parents_of_matching_suites_are_split(self):
+        assert_equals(UnitSplitter(['C']).split(create_suite()),
+                      [((0,), None), ((1,), OWN_TESTS), ((1, 0), 0)])
+
+    def test_tests_of_top_level_suite_with_child_suites(self):
+        root = create_suite()
+        root.tests.create(name='Root test')
+        assert_equals(UnitSplitter().split(root),
+                      [((), OWN_TESTS), ((0,), None), ((1,), None)])
+
+    def test_units_refer_to_original_order_after_randomizing(self):
+        units = UnitSplitter(['*']).split(create_suite(), True, True)
+        assert_equals(sorted(units),
+                      [((0,), 0), ((0,), 1), ((0,), 2), ((1,), 0), ((1,), 1),
+                       ((1,), 2), ((1, 0), 0)])
+
+
+class TestSelectUnit(unittest.TestCase):
+
+    def test_select_suite(self):
+        root = create_suite()
+        unit = select_unit(root, (1, 0))
+        assert_equals(unit.longname, 'Root.B.C')
+        assert_equals(list(root.suites), [unit.parent])
+        assert_equals(list(unit.parent.suites), [unit])
+        assert_equals(list(unit.parent.tests), [])
+        assert_equals(root.test_count, 1)
+
+    def test_select_test(self):
+        root = create_suite()
+        unit = select_unit(root, (1,), 2)
+        assert_equals([t.name for t in unit.tests], ['B2'])
+        assert_equals(list(unit.suites), [])
+        assert_equals(root.test_count, 1)
+
+    def test_select_own_tests(self):
+        root = create_suite()
+        unit = select_unit(root, (1,), OWN_TESTS)
+        assert_equals([t.name for t in unit.tests], ['B0', 'B1', 'B2'])
+        assert_equals(list(unit.suites), [])
+        assert_equals(root.test_count, 3)
+
+    def test_select_top_level_suite(self):
+        root = create_suite()
+        assert_equals(select_unit(root, ()), root)
+        assert_equals(root.test_count, 7)
+
+
+class _ErrorRecorder(object):
+
+    def __init__(self):
+        self.errors = []
+
+    def message(self, msg):
+        if msg.level == 'ERROR':
+            self.errors.append(msg.message)
+
+
+class TestReportingUnits(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.runner = ParallelRunner(None, [], {})
+        self.recorder = _ErrorRecorder()
+        LOGGER.disable_message_cache()
+        LOGGER.register_logger(self.recorder)
+
+    def tearDown(self):
+        LOGGER.unregister_logger(self.recorder)
+        shutil.rmtree(self.directory)
+
+    def test_failing_tests_are_not_errors(self):
+        self._write_output()
+        self.runner._report_unit(self.directory, 0, 3)
+        assert_equals(self.recorder.errors, [])
+        assert_equals(self.runner._result.suite.name, 'Unit')
+
+    def test_error_status_is_reported(self):
+        self._write_output()
+        self.runner._report_unit(self.directory, 0, 255)
+        self._verify_error('Worker process exited with status 255.')
+        assert_equals(self.runner._result.suite.name, 'Unit')
+
+    def test_killed_worker_without_output(self):
+        self.runner._report_unit(self.directory, 0, -9)
+        assert_equals(len(self.recorder.errors), 2)
+        self._verify_error('Worker process exited with status -9.')
+        assert_true(self.runner._result is None)
+
+    def _write_output(self):
+        result = Result()
+        result.suite.name = 'Unit'
+        result.save(os.path.join(self.directory, 'unit-1.xml'))
+
+    def _verify_error(self, message):
+        assert_equals(self.recorder.errors[0],
+                      "Executing unit 1 failed: %s See '%s' for details."
+                      % (message, os.path.join(self.directory, 'unit-1.txt')))
+
+
+if __name__ == '__main__':
+    unittest.main()
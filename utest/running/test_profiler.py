@@ -0,0 +1,129 @@
+from __future__ import with_statement
+
+import csv
+import os
+import tempfile
+import unittest
+from StringIO import StringIO
+
+from robot.running import TestSuite
+from robot.running.keywords import Keyword
+from robot.running.namespace import Namespace
+from robot.running.profiler import Profiler
+from robot.utils.asserts import assert_equals, assert_true
+from robot.variables.variables import Variables
+
+
+PROFILE = os.path.join(tempfile.gettempdir(), 'robot-utest-profile.txt')
+CSV = os.path.splitext(PROFILE)[0] + '.csv'
+
+
+def create_suite():
+    suite = TestSuite(name='Suite')
+    uk = suite.user_keywords.create(name='User Keyword')
+    uk.keywords.create('Log', args=['${TEST NAME}'])
+    uk.keywords.create('No Operation')
+    test = suite.tests.create(name='Test')
+    test.keywords.create('User Keyword')
+    test.keywords.create('User Keyword')
+    test.keywords.create('Log', args=['Hello, world!'])
+    return suite
+
+
+def run(suite, **kwargs):
+    return suite.run(output='NONE', stdout=StringIO(), stderr=StringIO(),
+                     **kwargs)
+
+
+class TestProfiler(unittest.TestCase):
+
+    def tearDown(self):
+        for path in PROFILE, CSV:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_calls_are_counted(self):
+        profiler = Profiler()
+        with profiler.enabled():
+            run(create_suite())
+        self._verify_calls(profiler.keywords, {'User Keyword': 2,
+                                               'BuiltIn.Log': 3,
+                                               'BuiltIn.No Operation': 2})
+        self._verify_calls(profiler.libraries, {'BuiltIn': 5})
+
+    def _verify_calls(self, stats, expected):
+        assert_equals(dict((name, stats[name].calls) for name in stats),
+                      expected)
+
+    def test_times(self):
+        profiler = Profiler()
+        with profiler.enabled():
+            run(create_suite())
+        uk = profiler.keywords['User Keyword']
+        log = profiler.keywords['BuiltIn.Log']
+        assert_true(0 < uk.own < uk.total <= profiler.elapsed)
+        assert_true(0 < log.own <= log.total)
+        assert_true(uk.lookup > 0)
+        assert_true(log.variables > 0)
+
+    def test_recursive_calls_are_counted_once_in_total_time(self):
+        suite = TestSuite(name='Suite')
+        uk = suite.user_keywords.create(name='Recursive', args=['${n}'])
+        uk.keywords.create('Run Keyword If', args=['${n} > 0', 'Recursive',
+                                                   '${n-1}'])
+        suite.tests.create(name='Test').keywords.create('Recursive',
+                                                        args=['${3}'])
+        profiler = Profiler()
+        with profiler.enabled():
+            run(suite)
+        recursive = profiler.keywords['Recursive']
+        run_kw_if = profiler.keywords['BuiltIn.Run Keyword If']
+        assert_equals(recursive.calls, 4)
+        assert_equals(run_kw_if.calls, 4)
+        assert_true(recursive.total <= profiler.elapsed)
+        assert_true(run_kw_if.total < recursive.total)
+
+    def test_original_methods_are_restored(self):
+        methods = [Keyword.__dict__['run'],
+                   Namespace.__dict__['get_handler'],
+                   Variables.__dict__['replace_list'],
+                   Variables.__dict__['replace_scalar'],
+                   Variables.__dict__['replace_string']]
+        profiler = Profiler()
+        try:
+            with profiler.enabled():
+                assert_true(Keyword.__dict__['run'] is not methods[0])
+                raise ValueError
+        except ValueError:
+            pass
+        assert_equals([Keyword.__dict__['run'],
+                       Namespace.__dict__['get_handler'],
+                       Variables.__dict__['replace_list'],
+                       Variables.__dict__['replace_scalar'],
+                       Variables.__dict__['replace_string']], methods)
+
+    def test_profile_is_written_when_running(self):
+        result = run(create_suite(), profile=PROFILE)
+        assert_equals(result.suite.status, 'PASS')
+        with open(PROFILE) as report:
+            content = report.read()
+        assert_true(content.startswith('Total time: '))
+        assert_true('User Keyword' in content)
+        with open(CSV, 'rb') as data:
+            rows = list(csv.reader(data))
+        assert_equals(rows[0], ['TYPE', 'NAME', 'CALLS', 'TOTAL', 'OWN',
+                                'LOOKUP', 'VARIABLES'])
+        assert_equals(sorted((row[0], row[1], row[2]) for row in rows[1:]),
+                      [('Keyword', 'BuiltIn.Log', '3'),
+                       ('Keyword', 'BuiltIn.No Operation', '2'),
+                       ('Keyword', 'User Keyword', '2'),
+                       ('Library', 'BuiltIn', '5')])
+
+    def test_profile_is_not_written_by_default(self):
+        run(create_suite())
+        assert_true(not os.path.exists(PROFILE))
+        assert_true(not os.path.exists(CSV))
+
+
+if __name__ == '__main__':
+    unittest.main()
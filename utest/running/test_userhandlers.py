@@ -1,7 +1,7 @@
 import unittest
 
 from robot.running.userkeyword import UserKeywordHandler, \
-    EmbeddedArgsTemplate, EmbeddedArgs
+    EmbeddedArgsTemplate, EmbeddedArgs, EmbeddedArgsMatcher
 from robot.running.arguments import UserKeywordArgumentParser
 from robot.utils.asserts import *
 from robot.errors import DataError
@@ -115,6 +115,12 @@ class TestEmbeddedArgs(unittest.TestCase):
         assert_equals(handler.name, 'User SELECts book frOm liST')
         assert_equals(handler.longname, 'resource.User SELECts book frOm liST')
 
+    def test_keywords_are_created_lazily_and_shared_with_template(self):
+        assert_none(self.tmp1._keywords)
+        handler = EmbeddedArgs('User selects book from list', self.tmp1)
+        assert_true(handler.keywords is self.tmp1.keywords)
+        assert_true(self.tmp1._keywords is not None)
+
     def test_embedded_args_handler_has_all_needed_attributes(self):
         normal = UserKeywordHandler(HandlerDataMock('My name'), None)
         embedded = EmbeddedArgs('My name', EAT('My ${name}'))
@@ -122,6 +128,38 @@ class TestEmbeddedArgs(unittest.TestCase):
             assert_true(hasattr(embedded, attr), "'%s' missing" % attr)
 
 
+class TestEmbeddedArgsMatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.templates = [EAT('User selects ${item} from list'),
+                          EAT('${x} * ${y} from "${z}"'),
+                          EAT('User selects ${item:\d+} from ${list}'),
+                          EAT('${a} and ${b:\\1}')]
+        self.matcher = EmbeddedArgsMatcher(self.templates)
+
+    def test_no_match(self):
+        assert_equals(self.matcher.match('Not matching'), [])
+
+    def test_one_match(self):
+        assert_equals(self.matcher.match('Janne * Heikki from "x"'),
+                      [self.templates[1]])
+
+    def test_multiple_matches_are_returned_in_definition_order(self):
+        assert_equals(self.matcher.match('user selects 42 from list'),
+                      [self.templates[0], self.templates[2]])
+
+    def test_templates_with_backreferences(self):
+        assert_equals(self.matcher.match('x and x'), [self.templates[3]])
+        assert_equals(self.matcher.match('x and y'), [])
+
+    def test_more_templates_than_regexp_groups(self):
+        templates = [EAT('Keyword %d ${arg}' % i) for i in range(250)]
+        matcher = EmbeddedArgsMatcher(templates)
+        assert_equals(matcher.match('Keyword 0 x'), [templates[0]])
+        assert_equals(matcher.match('Keyword 249 x'), [templates[249]])
+        assert_equals(matcher.match('Keyword 250 x'), [])
+
+
 class TestGetArgSpec(unittest.TestCase):
 
     def test_no_args(self):
@@ -0,0 +1,44 @@
+"""Micro-benchmark for setting and getting items in `NormalizedDict`.
+
+Run with `src` in PYTHONPATH like `python benchmark_normalizing.py`.
+Compares normalizing keys with the `normalize` function on every access,
+normalizing them when the cache is empty, and getting them from the cache.
+"""
+
+import timeit
+from functools import partial
+
+from robot.utils import normalize, NormalizedDict
+from robot.utils.normalizing import Normalizer
+
+
+KEYS = ['${greeting}', '${OUTPUT DIR}', '${TEST_NAME}', '@{items}',
+        'Log Many', 'Should Be Equal', 'Run Keyword If', 'My Keyword',
+        'User Keyword With Long Name', 'tag_1', 'Tag 2', 'smoke']
+
+
+def use_dict(memoize=True, clear_cache=False):
+    nd = NormalizedDict(ignore=['_'])
+    if not memoize:
+        nd._normalize = partial(normalize, ignore=['_'])
+    if clear_cache:
+        Normalizer.get(ignore=['_'])._cache.clear()
+    for key in KEYS:
+        nd[key] = key
+    for key in KEYS:
+        nd[key]
+        key in nd
+    nd.items()
+
+
+def measure(func, number=10000, repeat=3):
+    return min(timeit.repeat(func, number=number, repeat=repeat))
+
+
+if __name__ == '__main__':
+    plain = measure(lambda: use_dict(memoize=False))
+    uncached = measure(lambda: use_dict(clear_cache=True))
+    cached = measure(lambda: use_dict())
+    print 'No memo:     %.3fs' % plain
+    print 'Empty cache: %.3fs (%.1fx faster)' % (uncached, plain / uncached)
+    print 'Cached:      %.3fs (%.1fx faster)' % (cached, plain / cached)
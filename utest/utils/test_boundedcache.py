@@ -0,0 +1,39 @@
+import pickle
+import unittest
+
+from robot.utils import BoundedCache
+from robot.utils.asserts import assert_equals, assert_true
+
+
+class TestBoundedCache(unittest.TestCase):
+
+    def test_default_size(self):
+        assert_equals(BoundedCache().max_size, 10000)
+
+    def test_emptied_when_full(self):
+        cache = BoundedCache(3)
+        for key in 'abc':
+            cache[key] = key.upper()
+        assert_equals(cache, {'a': 'A', 'b': 'B', 'c': 'C'})
+        cache['d'] = 'D'
+        assert_equals(cache, {'d': 'D'})
+
+    def test_setdefault(self):
+        cache = BoundedCache(2)
+        assert_equals(cache.setdefault('a', 1), 1)
+        assert_equals(cache.setdefault('a', 2), 1)
+        cache['b'] = 2
+        assert_equals(cache.setdefault('c', 3), 3)
+        assert_equals(cache, {'c': 3})
+
+    def test_pickling(self):
+        cache = BoundedCache(2)
+        cache['a'] = 1
+        copy = pickle.loads(pickle.dumps(cache, pickle.HIGHEST_PROTOCOL))
+        assert_true(isinstance(copy, BoundedCache))
+        assert_equals(copy, {'a': 1})
+        assert_equals(copy.max_size, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
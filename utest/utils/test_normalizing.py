@@ -1,7 +1,10 @@
 import unittest
 from UserDict import UserDict
 
+import pickle
+
 from robot.utils import normalize, NormalizedDict
+from robot.utils.normalizing import Normalizer
 from robot.utils.asserts import (assert_equals, assert_true, assert_false,
                                  assert_raises)
 
@@ -44,6 +47,45 @@ class TestNormalizing(unittest.TestCase):
                                 spaceless=False), 'foo_ bar')
 
 
+class TestNormalizer(unittest.TestCase):
+
+    def test_same_result_as_with_normalize(self):
+        for ignore in [(), ['_'], ['_', 'X'], ['ab']]:
+            for caseless in True, False:
+                for spaceless in True, False:
+                    normalizer = Normalizer(ignore, caseless, spaceless)
+                    for string in ['', 'Ab_C D', u'\xc4 B\tx_', 'aabb Xab']:
+                        exp = normalize(string, ignore, caseless, spaceless)
+                        assert_equals(normalizer(string), exp)
+                        assert_equals(normalizer(string), exp)
+                        assert_equals(normalizer(exp),
+                                      normalize(exp, ignore, caseless, spaceless))
+
+    def test_normalizers_are_shared(self):
+        normalizer = Normalizer.get(['_'])
+        assert_true(Normalizer.get('_') is normalizer)
+        assert_true(Normalizer.get(['_'], caseless=False) is not normalizer)
+        assert_true(NormalizedDict(ignore='_')._normalize is normalizer)
+
+    def test_cache_is_cleared_when_full(self):
+        normalizer = Normalizer()
+        normalizer._cache.max_size = 2
+        for string in ['A', 'B', 'C']:
+            assert_equals(normalizer(string), string.lower())
+        assert_equals(normalizer._cache, {(str, 'C'): 'c', (str, 'c'): 'c'})
+
+    def test_byte_and_unicode_strings_are_cached_separately(self):
+        normalizer = Normalizer()
+        for string in ['A B', u'A B', u'ab', 'ab']:
+            assert_equals(type(normalizer(string)), type(string))
+
+    def test_pickling(self):
+        nd = NormalizedDict({'A B': 1}, ignore=['_'])
+        copy = pickle.loads(pickle.dumps(nd))
+        assert_equals(copy._normalize._cache, {})
+        assert_equals(copy['a_b'], 1)
+
+
 class TestNormalizedDict(unittest.TestCase):
 
     def test_default_constructor(self):
@@ -2,6 +2,7 @@ from __future__ import with_statement
 import os
 import unittest
 import tempfile
+from StringIO import StringIO
 
 from robot.utils import XmlWriter, ET, ETSource
 from robot.utils.asserts import *
@@ -125,5 +126,46 @@ class TestXmlWriter(unittest.TestCase):
         assert_equals(node.attrib, attrs)
 
 
+class TestBufferedXmlWriter(TestXmlWriter):
+
+    def setUp(self):
+        self.writer = XmlWriter(PATH, encoding='UTF-8', buffer_size=100)
+
+
+class TestBuffering(unittest.TestCase):
+
+    def setUp(self):
+        self.output = StringIO()
+        self.writer = XmlWriter(self.output, buffer_size=100)
+
+    def test_text_is_written_when_buffer_is_full(self):
+        self.writer.start('root')
+        self.writer.element('e', u'\xe4' * 40)
+        assert_equals(self.output.getvalue(), '')
+        self.writer.element('e', u'\xe4' * 40)
+        assert_equals(self.output.getvalue().decode('UTF-8'),
+                      '<?xml version="1.0" encoding="UTF-8"?>\n<root>\n'
+                      + '<e>%s</e>\n<e>%s' % (u'\xe4' * 40, u'\xe4' * 40))
+
+    def test_flush(self):
+        self.writer.element('e', 'content')
+        self.writer.flush()
+        assert_true(self.output.getvalue().endswith('<e>content</e>\n'))
+        self.writer.flush()
+        assert_true(self.output.getvalue().endswith('<e>content</e>\n'))
+
+    def test_text_is_written_when_flush_interval_has_passed(self):
+        writer = XmlWriter(self.output, buffer_size=100, flush_interval=0)
+        writer.element('e', 'content')
+        assert_true(self.output.getvalue().endswith('<e>content</e>\n'))
+
+    def test_close(self):
+        output = []
+        self.output.close = lambda: output.append(self.output.getvalue())
+        self.writer.element('e', 'content')
+        self.writer.close()
+        assert_true(output[0].endswith('<e>content</e>\n'))
+
+
 if __name__ == '__main__':
     unittest.main()
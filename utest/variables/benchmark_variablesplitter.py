@@ -0,0 +1,39 @@
+"""Micro-benchmark for splitting typical keyword arguments into variables.
+
+Run with `src` in PYTHONPATH like `python benchmark_variablesplitter.py`.
+Compares splitting when results are found from the cache to splitting
+when the cache is empty and strings need to be scanned.
+"""
+
+import timeit
+
+from robot.variables import VariableSplitter
+
+
+IDENTIFIERS = ['$', '@', '%', '&', '*']
+ARGUMENTS = ['${greeting}', 'Hello, ${name}!', '@{items}[1]', '${count}',
+             'no variables here', '${x} and ${y}', '%{HOME}/${path}.txt',
+             '${var_${index}}', 'escaped \\${not a variable}',
+             '${a}:${b}:${c}', '${expected}', 'timeout=${TIMEOUT}']
+
+
+def split_cached():
+    for arg in ARGUMENTS:
+        VariableSplitter(arg, IDENTIFIERS)
+
+
+def split_uncached():
+    VariableSplitter._cache.clear()
+    for arg in ARGUMENTS:
+        VariableSplitter(arg, IDENTIFIERS)
+
+
+def measure(func, number=10000, repeat=3):
+    return min(timeit.repeat(func, number=number, repeat=repeat))
+
+
+if __name__ == '__main__':
+    cached = measure(split_cached)
+    uncached = measure(split_uncached)
+    print 'Scanning: %.3fs' % uncached
+    print 'Cached:   %.3fs (%.1fx faster)' % (cached, uncached / cached)
@@ -288,6 +288,16 @@ class TestVariables(unittest.TestCase):
         assert_equals(self.varz.replace_string('${name}'), str(exp))
         assert_true(self.varz.has_key('${name}'))
 
+    def test_replace_string_accepts_deprecated_splitter(self):
+        self.varz['${name}'] = 'value'
+        string = 'Hello ${name} and ${nonex}!'
+        splitter = variables.VariableSplitter(string, ['$'])
+        assert_equals(self.varz.replace_string(string, splitter, True),
+                      'Hello value and ${nonex}!')
+        assert_equals(self.varz.replace_string(string, splitter=None,
+                                               ignore_errors=True),
+                      'Hello value and ${nonex}!')
+
     def test_copy(self):
         varz = variables.Variables(identifiers=['$'])
         varz['${foo}'] = 'bar'
@@ -295,6 +305,63 @@ class TestVariables(unittest.TestCase):
         assert_equals(copy['${foo}'], 'bar')
         assert_equals(copy._identifiers, ['$'])
 
+    def test_new_scope(self):
+        self.varz['${foo}'] = 'bar'
+        self.varz['@{list}'] = [1, 2]
+        scope = self.varz.new_scope()
+        scope['${new}'] = 'value'
+        scope['${FOO}'] = 'new bar'
+        assert_equals(scope.replace_list(['${foo}', '@{list}', '${new}']),
+                      ['new bar', 1, 2, 'value'])
+        assert_equals(scope.keys(), ['${foo}', '${new}', '@{list}'])
+        assert_equals(self.varz['${foo}'], 'bar')
+        assert_false(self.varz.has_key('${new}'))
+
+    def test_new_scope_falls_back_to_parent(self):
+        scope = self.varz.new_scope().new_scope()
+        self.varz['${late}'] = 'value'
+        assert_equals(scope['${late}'], 'value')
+        assert_equals(len(scope), 1)
+
+    def test_removing_from_new_scope(self):
+        self.varz['${foo}'] = 'bar'
+        scope = self.varz.new_scope()
+        assert_equals(scope.pop('${foo}'), 'bar')
+        assert_false(scope.has_key('${foo}'))
+        assert_equals(scope.keys(), [])
+        assert_raises(KeyError, scope.pop, '${foo}')
+        assert_equals(self.varz['${foo}'], 'bar')
+        scope['${foo}'] = 'new'
+        assert_equals(scope['${foo}'], 'new')
+
+    def test_truth_of_new_scope_does_not_require_length(self):
+        for i in range(1000):
+            self.varz['${var%d}' % i] = i
+        scope = self.varz.new_scope().new_scope()
+        removed = self.varz.new_scope()
+        for name in removed.keys():
+            removed.pop(name)
+        empty = variables.Variables().new_scope()
+        len_ = variables.ScopedDict.__len__
+        def fail(self):
+            raise AssertionError('Length should not be calculated.')
+        variables.ScopedDict.__len__ = fail
+        try:
+            assert_true(scope)
+            assert_false(removed)
+            assert_false(empty)
+        finally:
+            variables.ScopedDict.__len__ = len_
+
+    def test_copy_of_new_scope(self):
+        self.varz['${foo}'] = 'bar'
+        scope = self.varz.new_scope()
+        scope['${x}'] = 'y'
+        copy = scope.copy()
+        self.varz['${foo}'] = 'changed'
+        assert_equals(copy['${foo}'], 'bar')
+        assert_equals(copy.keys(), ['${foo}', '${x}'])
+
     if utils.is_jython:
 
         def test_variable_as_object_in_java(self):
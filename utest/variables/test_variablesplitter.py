@@ -154,5 +154,27 @@ class TestVariableSplitter(unittest.TestCase):
                       "'%s' internal" % inp)
 
 
+class TestSplitCache(unittest.TestCase):
+
+    def setUp(self):
+        VariableSplitter._cache.clear()
+
+    def test_cached_result_is_same_as_original(self):
+        for _ in range(2):
+            var = VariableSplitter('x @{y}[${i}] z', ['$', '@'])
+            assert_equals((var.identifier, var.base, var.index, var.start,
+                           var.end), ('@', 'y', '${i}', 2, 12))
+
+    def test_identifiers_are_part_of_cache_key(self):
+        assert_equals(VariableSplitter('@{x}', ['$', '@']).identifier, '@')
+        assert_equals(VariableSplitter('@{x}', ['$']).identifier, None)
+
+    def test_cache_is_emptied_when_full(self):
+        size = VariableSplitter._cache.max_size
+        for index in range(size + 1):
+            VariableSplitter('${%d}' % index, ['$'])
+        assert_equals(len(VariableSplitter._cache), 1)
+
+
 if __name__ == '__main__':
     unittest.main()
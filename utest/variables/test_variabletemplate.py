@@ -0,0 +1,64 @@
+import unittest
+
+from robot.variables.variabletemplate import VariableTemplate
+from robot.utils.asserts import assert_equals, assert_none, assert_true
+
+
+IDENTIFIERS = ('$', '@', '%', '&', '*')
+
+
+def template(string):
+    return VariableTemplate(string, IDENTIFIERS)
+
+
+def parts(string):
+    return [part if isinstance(part, basestring)
+            else VariableTemplate.variable_text(part)
+            for part in template(string).parts]
+
+
+class TestVariableTemplate(unittest.TestCase):
+
+    def test_no_variables(self):
+        for inp, exp in [('{hello}', '{hello}'), ('$\\{x}', '${x}'),
+                         ('${hello', '${hello')]:
+            t = template(inp)
+            assert_equals(t.parts, [exp])
+            assert_none(t.variable)
+            assert_none(t.list_variable)
+
+    def test_scalar_variable(self):
+        t = template('${var}')
+        assert_equals(t.variable.base, 'var')
+        assert_none(t.list_variable)
+
+    def test_list_variable(self):
+        t = template('@{list}')
+        assert_equals(t.variable.base, 'list')
+        assert_equals(t.list_variable.base, 'list')
+
+    def test_list_variable_item(self):
+        t = template('@{list}[1]')
+        assert_equals(t.variable.index, '1')
+        assert_none(t.list_variable)
+
+    def test_empty_variable(self):
+        t = template('${}')
+        assert_none(t.variable)
+        assert_equals(parts('${}'), ['${}'])
+        assert_equals(template('@{}').list_variable.base, '')
+
+    def test_parts(self):
+        assert_equals(parts('a ${x} b @{y}[0]${z}\\n'),
+                      ['a ', '${x}', ' b ', '@{y}[0]', '${z}', '\n'])
+        assert_equals(parts('${x${y}}\\\\${z}'), ['${x${y}}', '\\', '${z}'])
+        assert_none(template('${x} ${y}').variable)
+
+    def test_templates_are_cached(self):
+        t = VariableTemplate.get('${x} ${y}', list(IDENTIFIERS))
+        assert_true(VariableTemplate.get('${x} ${y}', IDENTIFIERS) is t)
+        assert_true(VariableTemplate.get('${x} ${y}', ('$',)) is not t)
+
+
+if __name__ == '__main__':
+    unittest.main()